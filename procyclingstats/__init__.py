@@ -1,10 +1,14 @@
 import os
 import sys
 
+from .archive import HTMLArchive, PackedArchive
+from .cache import PageCache
+from .gc_engine import GCEngine
 from .race_climbs_scraper import RaceClimbs
 from .race_scraper import Race
 from .race_startlist_scraper import RaceStartlist
 from .ranking_scraper import Ranking
+from .replay_server import ReplayServer
 from .rider_results_scraper import RiderResults
 from .rider_scraper import Rider
 from .scraper import Scraper
@@ -13,6 +17,7 @@ from .team_scraper import Team
 from .calendar_scraper import Calendar
 from .table_parser import TableParser
 from .stage_features_scraper import StageFeatures
+from .warehouse import Warehouse
 
 __all__ = [
     "Scraper",
@@ -27,6 +32,12 @@ __all__ = [
     "Calendar",
     "TableParser",
     "StageFeatures",
+    "PageCache",
+    "HTMLArchive",
+    "PackedArchive",
+    "ReplayServer",
+    "Warehouse",
+    "GCEngine",
 ]
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
@@ -0,0 +1,170 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import seconds_to_time, table_seconds, time_to_seconds
+
+TIME_FIELDS = ("time", "bonus")
+"""Fields converted to seconds."""
+
+RANK_FIELDS = ("rank", "prev_rank")
+"""Fields converted to integer ranks."""
+
+
+def _check_numpy() -> None:
+    """
+    Checks whether NumPy is available.
+
+    :raises ImportError: When ``numpy`` isn't installed.
+    """
+    if np is None:
+        raise ImportError("Package 'numpy' is needed for analytics, "
+                          "install 'procyclingstats[analytics]'.")
+
+
+def table_to_columns(table: List[Dict[str, Any]],
+                     fields: Optional[Iterable[str]] = None
+                     ) -> Dict[str, "np.ndarray"]:
+    """
+    Converts table to columns. Time fields are converted to seconds (rows
+    with missing time have the same time as the previous row, riders with
+    other status than ``DF`` have -1), rank fields to integers (0 when
+    missing) and other fields to object arrays.
+
+    :param table: Parsed table.
+    :param fields: Fields to convert, defaults to None (all fields of the
+        first row).
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Dict with field names as keys and columns as values.
+    """
+    _check_numpy()
+    if fields is None:
+        fields = table[0].keys() if table else ()
+    columns = {}
+    for field in fields:
+        if field == "time":
+            columns[field] = np.array(
+                [-1 if seconds is None else seconds
+                 for seconds in table_seconds(table, field)], dtype=np.int64)
+        elif field in TIME_FIELDS:
+            columns[field] = np.array(
+                [time_to_seconds(row.get(field)) or 0 for row in table],
+                dtype=np.int64)
+        elif field in RANK_FIELDS:
+            columns[field] = np.array(
+                [row.get(field) if isinstance(row.get(field), int) else 0
+                 for row in table], dtype=np.int64)
+        else:
+            columns[field] = np.array([row.get(field) for row in table],
+                                      dtype=object)
+    return columns
+
+
+def stages_matrix(tables: Sequence[List[Dict[str, Any]]],
+                  key: str = "rider_url") -> Tuple[List[str], "np.ndarray"]:
+    """
+    Converts results tables of multiple stages to matrix of times.
+
+    :param tables: Results tables of stages with `time` and `key` fields.
+    :param key: Field identifying riders, defaults to `rider_url`.
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Tuple of rider keys and matrix of seconds with riders as rows
+        and stages as columns (-1 where the rider wasn't classified).
+    """
+    _check_numpy()
+    indexes: Dict[str, int] = {}
+    for table in tables:
+        for row in table:
+            indexes.setdefault(row[key], len(indexes))
+    matrix = np.full((len(indexes), len(tables)), -1, dtype=np.int64)
+    for column, table in enumerate(tables):
+        rows = np.array([indexes[row[key]] for row in table], dtype=np.int64)
+        matrix[rows, column] = table_to_columns(table, ("time",))["time"]
+    return list(indexes), matrix
+
+
+def time_gaps(seconds: "np.ndarray") -> "np.ndarray":
+    """
+    Computes time gaps to the fastest rider.
+
+    :param seconds: Times in seconds, -1 where missing.
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Gaps in seconds, -1 where time is missing.
+    """
+    _check_numpy()
+    classified = seconds >= 0
+    if not classified.any():
+        return np.full_like(seconds, -1)
+    return np.where(classified, seconds - seconds[classified].min(), -1)
+
+
+def cumulative_gaps(matrix: "np.ndarray") -> "np.ndarray":
+    """
+    Computes cumulative time gaps to the leader after every stage. Riders
+    are out of the standings since the first stage without time.
+
+    :param matrix: Matrix of seconds with riders as rows and stages as
+        columns, e.g. from `stages_matrix`.
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Matrix of cumulative gaps in seconds, -1 where the rider is out
+        of the standings.
+    """
+    _check_numpy()
+    classified = np.logical_and.accumulate(matrix >= 0, axis=1)
+    totals = np.cumsum(np.where(classified, matrix, 0), axis=1)
+    leaders = np.where(classified, totals, np.iinfo(np.int64).max).min(axis=0)
+    return np.where(classified, totals - leaders, -1)
+
+
+def position_changes(rank: "np.ndarray",
+                     prev_rank: "np.ndarray") -> "np.ndarray":
+    """
+    Computes position changes between previous and current ranks.
+
+    :param rank: Current ranks, 0 where missing.
+    :param prev_rank: Previous ranks, 0 where missing.
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Count of gained positions (negative when positions were lost),
+        0 where one of the ranks is missing.
+    """
+    _check_numpy()
+    return np.where((rank > 0) & (prev_rank > 0), prev_rank - rank, 0)
+
+
+def team_classification(team_urls: "np.ndarray", seconds: "np.ndarray",
+                        top: int = 3) -> List[Dict[str, Any]]:
+    """
+    Computes team classification from times of the best `top` riders of
+    every team. Teams with less than `top` classified riders aren't
+    classified, riders without team (None team URL) are left out.
+
+    :param team_urls: Team of every rider, None where missing.
+    :param seconds: Time of every rider in seconds, -1 where missing.
+    :param top: Count of riders whose times are summed, defaults to 3.
+    :raises ImportError: When ``numpy`` isn't installed.
+    :return: Table with fields `team_url`, `rank` and `time` (sum of times
+        in ``H:MM:SS`` format).
+    """
+    _check_numpy()
+    classified = (seconds >= 0) & np.not_equal(team_urls, None)
+    teams, codes = np.unique(team_urls[classified].astype(str),
+                             return_inverse=True)
+    team_seconds = seconds[classified]
+    order = np.lexsort((team_seconds, codes))
+    sorted_codes = codes[order]
+    # position of every rider within his team
+    first_in_team = np.searchsorted(sorted_codes, sorted_codes)
+    counted = np.arange(len(order)) - first_in_team < top
+    sums = np.bincount(sorted_codes[counted],
+                       weights=team_seconds[order][counted],
+                       minlength=len(teams)).astype(np.int64)
+    counts = np.bincount(sorted_codes[counted], minlength=len(teams))
+    ranked = np.flatnonzero(counts == top)
+    ranked = ranked[np.argsort(sums[ranked], kind="stable")]
+    return [{"team_url": str(teams[code]),
+             "rank": rank,
+             "time": seconds_to_time(int(sums[code]))}
+            for rank, code in enumerate(ranked.tolist(), start=1)]
@@ -0,0 +1,396 @@
+import abc
+import gzip
+import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, Iterator, List,
+                    Optional, Tuple, Type)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+if TYPE_CHECKING:
+    from .scraper import Scraper
+
+
+class _ArchiveReader(abc.ABC):
+    """
+    Base class for archives of page HTMLs. Subclasses have to implement
+    `get_bytes` method, fill `_index` dict with archived URLs and set
+    `_location` to value from which the archive can be reopened in worker
+    processes.
+    """
+
+    _index: Dict[str, Any]
+    _location: str
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Gets HTML of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :return: Archived HTML, None when the page isn't archived.
+        """
+        html_bytes = self.get_bytes(url)
+        if html_bytes is None:
+            return None
+        return html_bytes.decode("utf-8")
+
+    @abc.abstractmethod
+    def get_bytes(self, url: str) -> Optional[bytes]:
+        """
+        Gets HTML of a page with given URL as UTF-8 encoded bytes.
+
+        :param url: Absolute URL of the page.
+        :return: Archived HTML, None when the page isn't archived.
+        """
+
+    def urls(self) -> List[str]:
+        """
+        Gets URLs of all archived pages.
+
+        :return: List of absolute URLs.
+        """
+        return list(self._index)
+
+    def load(self, scraper_class: Type["Scraper"], url: str) -> "Scraper":
+        """
+        Creates scraper object from archived HTML without making request.
+
+        :param scraper_class: Scraping class to create object of.
+        :param url: (Relative) URL of the archived page.
+        :raises KeyError: When the page isn't archived.
+        :raises ValueError: When archived HTML is invalid.
+        :return: Scraper object ready for parsing.
+        """
+        absolute_url = url if url.startswith(("http://", "https://")) else \
+            scraper_class.BASE_URL + url.lstrip("/")
+        html_bytes = self.get_bytes(absolute_url)
+        if html_bytes is None:
+            raise KeyError(f"Page isn't archived: '{absolute_url}'")
+        return scraper_class.from_html(absolute_url, html_bytes)
+
+    def reparse(self, scraper_class: Type["Scraper"],
+                urls: Optional[Iterable[str]] = None,
+                max_workers: Optional[int] = None,
+                chunksize: int = 16) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Parses archived pages with ``parse`` method of given scraping class
+        in a process pool. Pages are read directly from the archive in worker
+        processes, so no requests are made.
+
+        :param scraper_class: Scraping class to parse pages with.
+        :param urls: Absolute URLs of archived pages to parse, defaults to
+            None (all archived pages).
+        :param max_workers: Count of worker processes, defaults to None (CPU
+            count).
+        :param chunksize: Count of pages sent to worker process at once,
+            defaults to 16.
+        :return: Iterator of tuples with URL and parsed data in order of given
+            URLs. Parsed data are None for pages with invalid HTML.
+        """
+        urls = self.urls() if urls is None else list(urls)
+        jobs = [(scraper_class, url) for url in urls]
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_open_worker_archive,
+                                 initargs=(type(self), self._location)
+                                 ) as executor:
+            yield from zip(urls, executor.map(_reparse_page, jobs,
+                                              chunksize=chunksize))
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class HTMLArchive(_ArchiveReader):
+    """
+    Archive of page HTMLs stored in a directory. Every distinct HTML is
+    stored only once as a compressed file named by hash of its content and
+    URLs are mapped to the hashes by append-only index file. Archive has the
+    same interface as ``PageCache``, so it can be set as
+    ``Scraper.page_cache`` to archive every fetched page.
+
+    Usage:
+
+    >>> from procyclingstats import HTMLArchive, Scraper, Stage
+    >>> archive = HTMLArchive("pcs_archive")
+    >>> Scraper.page_cache = archive
+    >>> stage = Stage("race/tour-de-france/2022/stage-18")
+    >>> # later, possibly with newer version of the package
+    >>> stage = archive.load(Stage, "race/tour-de-france/2022/stage-18")
+    >>> for url, parsed in archive.reparse(Stage):
+    ...     ...
+
+    :param directory: Directory of the archive, created if needed.
+    :param compression: ``gzip`` or ``zstd`` (requires third party
+        ``zstandard`` package), defaults to ``gzip``. Used only for storing
+        new pages, pages compressed by both are always readable.
+    """
+
+    INDEX_FILENAME = "index.tsv"
+    """Name of index file with lines in ``hash<TAB>URL`` format."""
+
+    _extensions = {"gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, directory: str, compression: str = "gzip") -> None:
+        if compression not in self._extensions:
+            raise ValueError(f"Invalid compression: '{compression}'")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "Package 'zstandard' is needed for zstd compression, "
+                "install 'procyclingstats[zstd]'.")
+        self.directory = directory
+        self.compression = compression
+        self._location = directory
+        self._index: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        self._load_index()
+
+    def get_bytes(self, url: str) -> Optional[bytes]:
+        """
+        Gets HTML of a page with given URL as UTF-8 encoded bytes.
+
+        :param url: Absolute URL of the page.
+        :return: Archived HTML, None when the page isn't archived.
+        """
+        content_hash = self._index.get(url)
+        if content_hash is None:
+            return None
+        return self._read_object(content_hash)
+
+    def set(self, url: str, html: str) -> None:
+        """
+        Stores HTML of a page with given URL. Content that is already in the
+        archive isn't stored again.
+
+        :param url: Absolute URL of the page.
+        :param html: HTML of the page.
+        """
+        self.put(url, html.encode("utf-8"))
+
+    def put(self, url: str, html_bytes: bytes) -> str:
+        """
+        Stores UTF-8 encoded HTML of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :param html_bytes: HTML of the page.
+        :return: Hash of the content.
+        """
+        content_hash = hashlib.sha256(html_bytes).hexdigest()
+        if self._object_path(content_hash) is None:
+            self._write_object(content_hash, html_bytes)
+        with self._lock:
+            if self._index.get(url) != content_hash:
+                self._index[url] = content_hash
+                index_path = os.path.join(self.directory, self.INDEX_FILENAME)
+                with open(index_path, "a", encoding="utf-8") as index:
+                    index.write(f"{content_hash}\t{url}\n")
+        return content_hash
+
+    def content_hash(self, url: str) -> Optional[str]:
+        """
+        Gets hash of archived content of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :return: SHA-256 hex digest, None when the page isn't archived.
+        """
+        return self._index.get(url)
+
+    def pack(self, path: str,
+             urls: Optional[Iterable[str]] = None) -> "PackedArchive":
+        """
+        Writes archived pages uncompressed into one packed file for bulk
+        reparsing, see ``PackedArchive``. Every distinct content is written
+        only once.
+
+        :param path: Path of the packed file. Index is written next to it
+            with ``.idx`` suffix.
+        :param urls: Absolute URLs of archived pages to pack, defaults to None
+            (all archived pages).
+        :return: Packed archive opened for reading.
+        """
+        urls = self.urls() if urls is None else list(urls)
+        ranges: Dict[str, Tuple[int, int]] = {}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as pack, \
+                open(f"{tmp_path}.idx", "w", encoding="utf-8") as index:
+            for url in urls:
+                content_hash = self._index[url]
+                if content_hash not in ranges:
+                    html_bytes = self._read_object(content_hash)
+                    ranges[content_hash] = (pack.tell(), len(html_bytes))
+                    pack.write(html_bytes)
+                offset, length = ranges[content_hash]
+                index.write(f"{offset}\t{length}\t{url}\n")
+        os.replace(tmp_path, path)
+        os.replace(f"{tmp_path}.idx", f"{path}.idx")
+        return PackedArchive(path)
+
+    def _load_index(self) -> None:
+        """Loads URL to hash mapping from index file, later lines win."""
+        index_path = os.path.join(self.directory, self.INDEX_FILENAME)
+        if not os.path.exists(index_path):
+            return
+        with open(index_path, "r", encoding="utf-8") as index:
+            for line in index:
+                content_hash, _, url = line.rstrip("\n").partition("\t")
+                if url:
+                    self._index[url] = content_hash
+
+    def _object_path(self, content_hash: str) -> Optional[str]:
+        """
+        Finds path of stored object with given hash in any compression.
+
+        :param content_hash: Hash of the content.
+        :return: Path to the object, None when the object isn't stored.
+        """
+        for extension in self._extensions.values():
+            path = os.path.join(self.directory, "objects", content_hash[:2],
+                                content_hash + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _read_object(self, content_hash: str) -> bytes:
+        """
+        Reads and decompresses stored object.
+
+        :param content_hash: Hash of the content.
+        :raises FileNotFoundError: When index points to missing object.
+        :return: Decompressed content.
+        """
+        path = self._object_path(content_hash)
+        if path is None:
+            raise FileNotFoundError(f"Archive object missing: {content_hash}")
+        with open(path, "rb") as obj:
+            data = obj.read()
+        if path.endswith(self._extensions["zstd"]):
+            if zstandard is None:
+                raise ImportError(
+                    "Package 'zstandard' is needed to read zstd objects, "
+                    "install 'procyclingstats[zstd]'.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def _write_object(self, content_hash: str, html_bytes: bytes) -> None:
+        """
+        Compresses and stores object. Object is written to temporary file
+        first, so readers never see partial object.
+
+        :param content_hash: Hash of the content.
+        :param html_bytes: Content to store.
+        """
+        if self.compression == "zstd":
+            data = zstandard.ZstdCompressor().compress(html_bytes)
+        else:
+            data = gzip.compress(html_bytes)
+        object_dir = os.path.join(self.directory, "objects", content_hash[:2])
+        os.makedirs(object_dir, exist_ok=True)
+        path = os.path.join(object_dir,
+                            content_hash + self._extensions[self.compression])
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as obj:
+            obj.write(data)
+        os.replace(tmp_path, path)
+
+
+class PackedArchive(_ArchiveReader):
+    """
+    Read-only archive of uncompressed page HTMLs packed into one file, which
+    is created by ``HTMLArchive.pack``. The file is memory-mapped, so reading
+    a page doesn't need opening, reading or decompressing any file and page
+    bytes are passed to the HTML parser without decoding them to string.
+    Worker processes of ``reparse`` map the same file, so the operating
+    system shares its pages among them.
+
+    Usage:
+
+    >>> packed = HTMLArchive("pcs_archive").pack("stages.pack")
+    >>> for url, parsed in packed.reparse(Stage):
+    ...     ...
+
+    :param path: Path of the packed file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._location = path
+        self._index: Dict[str, Tuple[int, int]] = {}
+        with open(f"{path}.idx", "r", encoding="utf-8") as index:
+            for line in index:
+                offset, length, url = line.rstrip("\n").split("\t", 2)
+                self._index[url] = (int(offset), int(length))
+        self._file = open(path, "rb")
+        # empty files can't be mapped
+        self._mmap = mmap.mmap(self._file.fileno(), 0,
+                               access=mmap.ACCESS_READ) \
+            if os.path.getsize(path) else None
+
+    def get_bytes(self, url: str) -> Optional[bytes]:
+        """
+        Gets HTML of a page with given URL as UTF-8 encoded bytes. The bytes
+        are a copy of the page's range of the mapped file, the HTML parser
+        doesn't accept memoryview, so a view would be copied anyway.
+
+        :param url: Absolute URL of the page.
+        :return: Archived HTML, None when the page isn't archived.
+        """
+        byte_range = self._index.get(url)
+        if byte_range is None:
+            return None
+        offset, length = byte_range
+        if self._mmap is None:
+            return b""
+        return self._mmap[offset:offset + length]
+
+    def close(self) -> None:
+        """Unmaps and closes the packed file."""
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackedArchive":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+_worker_archive: Optional[_ArchiveReader] = None
+"""Archive opened by `_open_worker_archive` in current worker process."""
+
+
+def _open_worker_archive(archive_class: Type[_ArchiveReader],
+                         location: str) -> None:
+    """
+    Opens archive once per worker process of `_ArchiveReader.reparse`.
+
+    :param archive_class: Class of the archive.
+    :param location: Location the archive is opened from.
+    """
+    global _worker_archive  # pylint: disable=global-statement
+    _worker_archive = archive_class(location)  # type: ignore
+
+
+def _reparse_page(
+        job: Tuple[Type["Scraper"], str]) -> Optional[Dict[str, Any]]:
+    """
+    Parses one archived page, runs in worker process of
+    `_ArchiveReader.reparse`.
+
+    :param job: Tuple of scraping class and absolute URL.
+    :return: Parsed data, None when archived HTML is invalid.
+    """
+    scraper_class, url = job
+    try:
+        return _worker_archive.load(scraper_class, url).parse()  # type: ignore
+    except ValueError:
+        return None
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class PageCache:
+    """
+    Thread-safe cache of page HTMLs keyed by absolute URL. The most recently
+    used pages are kept in memory, the least recently used ones are dropped
+    when `max_size` is exceeded. When `directory` is given, every page is
+    also stored to a file there, so cached pages survive across processes.
+    Pages are held as UTF-8 encoded bytes, which scraper objects pass to the
+    HTML parser without decoding them to string.
+
+    Usage:
+
+    >>> from procyclingstats import PageCache, Scraper, Team
+    >>> Scraper.page_cache = PageCache(directory="pcs_cache")
+    >>> team = Team("team/bora-hansgrohe-2022")
+    >>> # HTML is now taken from the cache without making request
+    >>> team = Team("team/bora-hansgrohe-2022")
+
+    :param max_size: Maximal count of pages held in memory, defaults to 256.
+    :param directory: Directory for persisting cached pages, defaults to None
+        (pages are held only in memory).
+    """
+
+    def __init__(self, max_size: int = 256,
+                 directory: Optional[str] = None) -> None:
+        self.max_size = max_size
+        self.directory = directory
+        self._pages: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Gets HTML of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :return: Cached HTML, None when the page isn't cached.
+        """
+        html_bytes = self.get_bytes(url)
+        if html_bytes is None:
+            return None
+        return html_bytes.decode("utf-8")
+
+    def get_bytes(self, url: str) -> Optional[bytes]:
+        """
+        Gets HTML of a page with given URL as UTF-8 encoded bytes.
+
+        :param url: Absolute URL of the page.
+        :return: Cached HTML, None when the page isn't cached.
+        """
+        with self._lock:
+            if url in self._pages:
+                self._pages.move_to_end(url)
+                return self._pages[url]
+        if not self.directory:
+            return None
+        try:
+            with open(self._page_path(url), "rb") as page:
+                html_bytes = page.read()
+        except FileNotFoundError:
+            return None
+        self._remember(url, html_bytes)
+        return html_bytes
+
+    def set(self, url: str, html: str) -> None:
+        """
+        Stores HTML of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :param html: HTML of the page.
+        """
+        self.put(url, html.encode("utf-8"))
+
+    def put(self, url: str, html_bytes: bytes) -> None:
+        """
+        Stores UTF-8 encoded HTML of a page with given URL.
+
+        :param url: Absolute URL of the page.
+        :param html_bytes: HTML of the page.
+        """
+        self._remember(url, html_bytes)
+        if self.directory:
+            path = self._page_path(url)
+            # write to temporary file first, so readers never see partial page
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as page:
+                page.write(html_bytes)
+            os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Removes all pages from memory (persisted pages are kept)."""
+        with self._lock:
+            self._pages.clear()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            if url in self._pages:
+                return True
+        return bool(self.directory) and os.path.exists(self._page_path(url))
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def _remember(self, url: str, html_bytes: bytes) -> None:
+        """
+        Stores page to memory and drops least recently used pages if needed.
+
+        :param url: Absolute URL of the page.
+        :param html_bytes: UTF-8 encoded HTML of the page.
+        """
+        with self._lock:
+            self._pages[url] = html_bytes
+            self._pages.move_to_end(url)
+            while len(self._pages) > self.max_size:
+                self._pages.popitem(last=False)
+
+    def _page_path(self, url: str) -> str:
+        """
+        Makes path of the file where page with given URL is persisted.
+
+        :param url: Absolute URL of the page.
+        :return: Path to the page file.
+        """
+        filename = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{filename}.html")  # type: ignore
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .scraper import Scraper
 from .table_parser import TableParser
@@ -10,9 +10,13 @@ class Calendar(Scraper):
     Scraper for Calendar HTML page.
     """
 
-    def calendar(self, *args: str) -> List[Dict[str, Any]]:
+    def calendar(self, *args: str, limit: Optional[int] = None
+                 ) -> List[Dict[str, Any]]:
         """
         Parses calendar from HTML.
+
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         """
         available_fields = (
             "date",
@@ -29,6 +33,6 @@ class Calendar(Scraper):
 
         if calendar_html:
             calendar_parser = TableParser(calendar_html)
-            calendar_parser.parse(fields)
+            calendar_parser.parse(fields, limit)
             return calendar_parser.table
         return []
@@ -0,0 +1,194 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import seconds_to_time, table_seconds, time_to_seconds
+
+
+class GCEngine:
+    """
+    Reconstructs GC standings from results tables of consecutive stages. Times
+    of all riders are kept as integer seconds in NumPy arrays, after every
+    added stage rider's stage time minus bonus seconds is added to his GC
+    time. Riders with other status than ``DF`` (``DNF``, ``DNS``, ``OTL``,
+    ``DSQ``) are removed from the GC, as well as riders in the GC missing in
+    results of a stage. Only riders of the first stage (or of given starting
+    GC) enter the GC, riders first seen in a later stage don't have time of
+    all stages, so they're kept out of it. Riders with the same time are
+    ordered by the previous standings. Requires ``numpy`` package.
+
+    Usage:
+
+    >>> from procyclingstats import GCEngine, Stage
+    >>> engine = GCEngine()
+    >>> for i in range(1, 22):
+    ...     stage = Stage(f"race/tour-de-france/2022/stage-{i}")
+    ...     engine.add_stage(stage.results("rider_url", "status", "time",
+    ...                                    "bonus"))
+    >>> engine.gc()[0]
+    {'rider_url': 'rider/jonas-vingegaard', 'rank': 1, 'time': '79:33:20'}
+    >>> engine.compare(stage.gc())
+    []
+
+    :param gc: GC table (with `rider_url` and `time` fields) the
+        reconstruction starts from, e.g. GC after the last stage that is
+        available. Defaults to None (reconstruction starts from the first
+        stage).
+    :raises ImportError: When ``numpy`` isn't installed.
+    """
+
+    def __init__(self, gc: Optional[List[Dict[str, Any]]] = None) -> None:
+        if np is None:
+            raise ImportError("Package 'numpy' is needed for GC engine, "
+                              "install 'procyclingstats[analytics]'.")
+        self.stages_count = 0
+        self.rider_urls: List[str] = []
+        self._indexes: Dict[str, int] = {}
+        self._seconds = np.zeros(0, dtype=np.int64)
+        self._active = np.zeros(0, dtype=bool)
+        self._positions = np.zeros(0, dtype=np.int64)
+        self._starting = not gc
+        if gc:
+            indexes = self._rider_indexes(gc)
+            seconds = table_seconds(gc)
+            for index, rider_seconds in zip(indexes, seconds):
+                if rider_seconds is not None:
+                    self._seconds[index] = rider_seconds
+                    self._active[index] = True
+            self._update_positions()
+
+    def add_stage(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Adds stage results to the GC. Riders that aren't in the GC yet enter
+        it only with the first stage.
+
+        :param results: Stage results table with `rider_url`, `status`,
+            `time` and `bonus` fields, e.g. from ``Stage.results``.
+        """
+        indexes = np.array(self._rider_indexes(results), dtype=np.int64)
+        stage_seconds = table_seconds(results)
+        classified = np.array([seconds is not None
+                               for seconds in stage_seconds], dtype=bool)
+        seconds = np.array([seconds or 0 for seconds in stage_seconds],
+                           dtype=np.int64)
+        bonuses = np.array([time_to_seconds(row.get("bonus")) or 0
+                            for row in results], dtype=np.int64)
+        if self._starting:
+            self._active[indexes[classified]] = True
+            self._starting = False
+        else:
+            # riders in the GC without result of this stage leave it
+            in_results = np.zeros(len(self.rider_urls), dtype=bool)
+            in_results[indexes] = True
+            self._active &= in_results
+        self._seconds[indexes] += np.where(classified, seconds - bonuses, 0)
+        self._active[indexes[~classified]] = False
+        self.stages_count += 1
+        self._update_positions()
+
+    def gc(self) -> List[Dict[str, Any]]:
+        """
+        Makes current GC standings.
+
+        :return: Table with fields `rider_url`, `rank` and `time` (absolute
+            GC time in ``H:MM:SS`` format).
+        """
+        order = self._standings()
+        return [{"rider_url": self.rider_urls[index],
+                 "rank": rank,
+                 "time": seconds_to_time(int(self._seconds[index]))}
+                for rank, index in enumerate(order.tolist(), start=1)]
+
+    def compare(self, gc: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Compares reconstructed GC with given GC table, e.g. from
+        ``Stage.gc``.
+
+        :param gc: GC table with `rider_url`, `rank` and `time` fields.
+        :return: Table of riders whose rank or time differ with fields
+            `rider_url`, `rank`, `time`, `expected_rank` and `expected_time`.
+            Rank and time are None when the rider isn't in reconstructed GC,
+            expected ones are None when the rider isn't in given GC.
+        """
+        expected_seconds = table_seconds(gc)
+        expected = {row["rider_url"]: (row.get("rank"), seconds)
+                    for row, seconds in zip(gc, expected_seconds)
+                    if row.get("rider_url") and seconds is not None}
+        ranks, seconds = self._ranks_and_seconds()
+        rider_urls = list(dict.fromkeys(
+            [self.rider_urls[i] for i in np.flatnonzero(ranks)] +
+            list(expected)))
+        indexes = np.array([self._indexes.get(url, -1) for url in rider_urls],
+                           dtype=np.int64)
+        known = indexes >= 0
+        computed_ranks = np.where(known, ranks[indexes], 0)
+        computed_seconds = np.where(known, seconds[indexes], 0)
+        expected_ranks = np.array([expected.get(url, (0, 0))[0] or 0
+                                   for url in rider_urls], dtype=np.int64)
+        expected_times = np.array([expected.get(url, (0, 0))[1]
+                                   for url in rider_urls], dtype=np.int64)
+        mismatches = np.flatnonzero((computed_ranks != expected_ranks) |
+                                    (computed_seconds != expected_times))
+        return [{
+            "rider_url": rider_urls[i],
+            "rank": int(computed_ranks[i]) or None,
+            "time": seconds_to_time(int(computed_seconds[i]))
+                    if computed_ranks[i] else None,
+            "expected_rank": expected[rider_urls[i]][0]
+                             if rider_urls[i] in expected else None,
+            "expected_time": seconds_to_time(expected[rider_urls[i]][1])
+                             if rider_urls[i] in expected else None,
+        } for i in mismatches.tolist()]
+
+    def _ranks_and_seconds(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Makes arrays with GC rank (0 for riders out of the GC) and GC time of
+        every known rider.
+
+        :return: Tuple of ranks and seconds arrays indexed by rider index.
+        """
+        ranks = np.zeros(len(self.rider_urls), dtype=np.int64)
+        order = self._standings()
+        ranks[order] = np.arange(1, len(order) + 1)
+        return ranks, self._seconds
+
+    def _standings(self) -> "np.ndarray":
+        """
+        Orders riders in the GC by time, ties by previous standings.
+
+        :return: Indexes of riders in the GC in standings order.
+        """
+        active = np.flatnonzero(self._active)
+        order = np.lexsort((self._positions[active], self._seconds[active]))
+        return active[order]
+
+    def _update_positions(self) -> None:
+        """Stores current standings as the previous ones."""
+        self._positions[self._standings()] = np.arange(
+            np.count_nonzero(self._active))
+
+    def _rider_indexes(self, table: List[Dict[str, Any]]) -> List[int]:
+        """
+        Gets indexes of riders from table, unknown riders are added.
+
+        :param table: Table with `rider_url` field.
+        :return: List of rider indexes.
+        """
+        new_urls = list(dict.fromkeys(row["rider_url"] for row in table
+                                      if row["rider_url"] not in self._indexes))
+        if new_urls:
+            for url in new_urls:
+                self._indexes[url] = len(self.rider_urls)
+                self.rider_urls.append(url)
+            new_count = len(new_urls)
+            self._seconds = np.concatenate(
+                (self._seconds, np.zeros(new_count, dtype=np.int64)))
+            self._active = np.concatenate(
+                (self._active, np.zeros(new_count, dtype=bool)))
+            self._positions = np.concatenate(
+                (self._positions, np.full(new_count, len(self._positions),
+                                          dtype=np.int64)))
+        return [self._indexes[row["rider_url"]] for row in table]
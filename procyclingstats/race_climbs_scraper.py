@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from selectolax.parser import HTMLParser
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -42,15 +44,19 @@ class RaceClimbs(Scraper):
     }
 
     """
-    def _html_valid(self) -> bool:
+    def _html_valid(self, html: Optional[HTMLParser] = None) -> bool:
         """
         Extends Scraper method for validating HTMLs.
 
+        :param html: HTML to check, defaults to None (`self.html` is checked).
         :return: True if given HTML is valid, otherwise False
         """
-        return self.html.css_first("div.page-content > h2").text() == "Climbs"
+        if html is None:
+            html = self.html
+        return html.css_first("div.page-content > h2").text() == "Climbs"
 
-    def climbs(self, *args: str) -> List[Dict[str, Any]]:
+    def climbs(self, *args: str, limit: Optional[int] = None
+               ) -> List[Dict[str, Any]]:
         """
         Parses race's climbs table from HTML. Note that not allways all info
         about the climbs is present (usually in older races).
@@ -65,6 +71,8 @@ class RaceClimbs(Scraper):
             - top: Height above sea level at the top of the climb in meters.
             - km_before_finnish: KMs to finnish from the top of the climb.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -82,7 +90,7 @@ class RaceClimbs(Scraper):
             return []
         table_parser = TableParser(table_html)
         casual_fields = [f for f in fields if f in ("climb_name", "climb_url")]
-        table_parser.parse(casual_fields)
+        table_parser.parse(casual_fields, limit)
         if "length" in fields:
             lengths = table_parser.parse_extra_column("Length", float)
             table_parser.extend_table("length", lengths)
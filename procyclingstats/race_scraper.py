@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .errors import ExpectedParsingError, UnexpectedParsingError
 from .scraper import Scraper
@@ -27,6 +29,45 @@ class Race(Scraper):
 
     """
 
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "fetch_editions",
+        "cached_stages",
+        "clear_cached_stages",
+    )
+    """Public methods that aren't called by `parse` method."""
+
+    _edition_methods = (
+        "name",
+        "year",
+        "edition",
+        "startdate",
+        "enddate",
+        "category",
+        "uci_tour",
+        "nationality",
+        "is_one_day_race",
+        "stages",
+        "stages_winners",
+    )
+    """Parsing methods called on every edition by `fetch_editions`."""
+
+    _sub_pages = {"final_5k": "route/final-5k"}
+    """Sub-pages some parsing methods parse from."""
+
+    _sub_page_methods = {"final_5k_stats": "final_5k"}
+    """Parsing methods that parse from a sub-page."""
+
+    def _sub_page_url(self, name: str) -> str:
+        """
+        Overrides Scraper method. Sub-pages are relative to the race overview
+        URL, e.g. ``race/tour-de-france/2022``.
+
+        :param name: Name of the sub-page.
+        :return: Relative URL of the sub-page.
+        """
+        race_url = "/".join(self._decompose_url()[:3])
+        return f"{race_url}/{self._sub_pages[name]}"
+
     def year(self) -> int:
         """
         Parse year when the race occured from HTML.
@@ -47,24 +88,19 @@ class Race(Scraper):
 
         :return: Name of the race, e.g. ``Tour de France``.
         """
-        # Try new structure first
+        if self._layout() == "legacy":
+            display_name_html = self.html.css_first(".page-title > .main > h1")
+            if not display_name_html:
+                raise ExpectedParsingError("Race name unavailable.")
+            return display_name_html.text()
+
         h1_element = self.html.css_first("h1")
-        if h1_element:
-            text = h1_element.text()
-            if "»" in text:
-                parts = text.split("»")
-                if len(parts) > 1:
-                    race_name = parts[1].strip()
-                    # Remove edition number if present (e.g., "109th Tour de France" -> "Tour de France")
-                    import re
-                    race_name = re.sub(r'^\d+(?:st|nd|rd|th)\s+', '', race_name)
-                    return race_name
-        
-        # Fallback to original selector
-        display_name_html = self.html.css_first(".page-title > .main > h1")
-        if not display_name_html:
+        text = h1_element.text() if h1_element else ""
+        parts = text.split("»")
+        if len(parts) < 2:
             raise ExpectedParsingError("Race name unavailable.")
-        return display_name_html.text()
+        # Remove edition number if present (e.g., "109th Tour de France" -> "Tour de France")
+        return re.sub(r'^\d+(?:st|nd|rd|th)\s+', '', parts[1].strip())
 
     def is_one_day_race(self) -> bool:
         """
@@ -93,7 +129,15 @@ class Race(Scraper):
 
         :return: 2 chars long country code in uppercase.
         """
-        # Try new structure first - look for flag in page title area
+        if self._layout() == "legacy":
+            nationality_html = self.html.css_first(
+                ".page-title > .main > span.flag")
+            if not nationality_html:
+                raise ExpectedParsingError("Race nationality unavailable.")
+            flag_class = nationality_html.attributes["class"]
+            return flag_class.split(" ")[1].upper()  # type: ignore
+
+        # look for flag in page title area first
         page_title = self.html.css_first(".page-title")
         if page_title:
             flag_elements = page_title.css("span[class*='flag']")
@@ -103,8 +147,7 @@ class Race(Scraper):
                 parts = flag_class.split()
                 if len(parts) >= 2 and parts[0] == "flag" and len(parts[1]) == 2:
                     return parts[1].upper()
-        
-        # Fallback to original method
+
         flag_elements = self.html.css("span[class*='flag']")
         for flag_elem in flag_elements:
             flag_class = flag_elem.attributes.get("class", "")
@@ -112,13 +155,7 @@ class Race(Scraper):
             parts = flag_class.split()
             if len(parts) >= 2 and parts[0] == "flag":
                 return parts[1].upper()
-        
-        # Fallback to original selector
-        nationality_html = self.html.css_first(".page-title > .main > span.flag")
-        if not nationality_html:
-            raise ExpectedParsingError("Race nationality unavailable.")
-        flag_class = nationality_html.attributes["class"]
-        return flag_class.split(" ")[1].upper()  # type: ignore
+        raise ExpectedParsingError("Race nationality unavailable.")
 
     def edition(self) -> int:
         """
@@ -126,20 +163,19 @@ class Race(Scraper):
 
         :return: Edition as int.
         """
-        # Try new structure first - look for edition in H1
+        if self._layout() == "legacy":
+            edition_html = self.html.css_first(
+                ".page-title > .main > span + font")
+            if edition_html is not None:
+                return int(edition_html.text()[:-2])
+            raise ExpectedParsingError("Race cancelled, edition unavailable.")
+
         h1_element = self.html.css_first("h1")
-        if h1_element:
-            text = h1_element.text()
-            import re
-            edition_match = re.search(r'(\d+)(?:st|nd|rd|th)', text)
-            if edition_match:
-                return int(edition_match.group(1))
-        
-        # Fallback to original selector
-        edition_html = self.html.css_first(".page-title > .main > span + font")
-        if edition_html is not None:
-            return int(edition_html.text()[:-2])
-        raise ExpectedParsingError("Race cancelled, edition unavailable.")
+        text = h1_element.text() if h1_element else ""
+        edition_match = re.search(r'(\d+)(?:st|nd|rd|th)', text)
+        if not edition_match:
+            raise ExpectedParsingError("Race cancelled, edition unavailable.")
+        return int(edition_match.group(1))
 
     def startdate(self) -> str:
         """
@@ -147,22 +183,11 @@ class Race(Scraper):
 
         :return: Startdate in ``YYYY-MM-DD`` format.
         """
-        # Try new structure first - keyvalue list
-        keyvalue_list = self.html.css_first('ul.list.keyvalueList')
-        if keyvalue_list:
-            for li in keyvalue_list.css('li'):
-                title_elem = li.css_first('.title')
-                value_elem = li.css_first('.value')
-                if title_elem and value_elem:
-                    title = title_elem.text().strip().rstrip(':')
-                    if title == 'Startdate':
-                        return value_elem.text().strip()
-        
-        # Fallback to original method
-        startdate_html = self.html.css_first(".infolist > li > div:nth-child(2)")
-        if not startdate_html:
-            raise ExpectedParsingError("Race startdate unavailable (race may not have occurred yet).")
-        return startdate_html.text()
+        value_html = self._info_value("Startdate", 0)
+        if value_html is None:
+            raise ExpectedParsingError(
+                "Race startdate unavailable (race may not have occurred yet).")
+        return value_html.text().strip()
 
     def enddate(self) -> str:
         """
@@ -170,23 +195,11 @@ class Race(Scraper):
 
         :return: Enddate in ``YYYY-MM-DD`` format.
         """
-        # Try new structure first - keyvalue list
-        keyvalue_list = self.html.css_first('ul.list.keyvalueList')
-        if keyvalue_list:
-            for li in keyvalue_list.css('li'):
-                title_elem = li.css_first('.title')
-                value_elem = li.css_first('.value')
-                if title_elem and value_elem:
-                    title = title_elem.text().strip().rstrip(':')
-                    if title == 'Enddate':
-                        return value_elem.text().strip()
-        
-        # Fallback to original method
-        enddate_elements = self.html.css(".infolist > li > div:nth-child(2)")
-        if len(enddate_elements) < 2:
-            raise ExpectedParsingError("Race enddate unavailable (race may not have occurred yet).")
-        enddate_html = enddate_elements[1]
-        return enddate_html.text()
+        value_html = self._info_value("Enddate", 1)
+        if value_html is None:
+            raise ExpectedParsingError(
+                "Race enddate unavailable (race may not have occurred yet).")
+        return value_html.text().strip()
 
     def category(self) -> str:
         """
@@ -194,23 +207,11 @@ class Race(Scraper):
 
         :return: Race category e.g. ``Men Elite``.
         """
-        # Try new structure first - keyvalue list
-        keyvalue_list = self.html.css_first('ul.list.keyvalueList')
-        if keyvalue_list:
-            for li in keyvalue_list.css('li'):
-                title_elem = li.css_first('.title')
-                value_elem = li.css_first('.value')
-                if title_elem and value_elem:
-                    title = title_elem.text().strip().rstrip(':')
-                    if title == 'Category':
-                        return value_elem.text().strip()
-        
-        # Fallback to original method
-        category_elements = self.html.css(".infolist > li > div:nth-child(2)")
-        if len(category_elements) < 3:
-            raise ExpectedParsingError("Race category unavailable (race may not have occurred yet).")
-        category_html = category_elements[2]
-        return category_html.text()
+        value_html = self._info_value("Category", 2)
+        if value_html is None:
+            raise ExpectedParsingError(
+                "Race category unavailable (race may not have occurred yet).")
+        return value_html.text().strip()
 
     def uci_tour(self) -> str:
         """
@@ -218,23 +219,11 @@ class Race(Scraper):
 
         :return: UCI Tour of the race e.g. ``UCI Worldtour``.
         """
-        # Try new structure first - keyvalue list
-        keyvalue_list = self.html.css_first('ul.list.keyvalueList')
-        if keyvalue_list:
-            for li in keyvalue_list.css('li'):
-                title_elem = li.css_first('.title')
-                value_elem = li.css_first('.value')
-                if title_elem and value_elem:
-                    title = title_elem.text().strip().rstrip(':')
-                    if title == 'UCI Tour':
-                        return value_elem.text().strip()
-        
-        # Fallback to original method
-        uci_tour_elements = self.html.css(".infolist > li > div:nth-child(2)")
-        if len(uci_tour_elements) < 4:
-            raise ExpectedParsingError("UCI Tour unavailable (race may not have occurred yet).")
-        uci_tour_html = uci_tour_elements[3]
-        return uci_tour_html.text()
+        value_html = self._info_value("UCI Tour", 3)
+        if value_html is None:
+            raise ExpectedParsingError(
+                "UCI Tour unavailable (race may not have occurred yet).")
+        return value_html.text().strip()
 
     def prev_editions_select(self) -> List[Dict[str, str]]:
         """
@@ -243,10 +232,81 @@ class Race(Scraper):
         :return: Parsed select menu represented as list of dicts with keys
             ``text`` and ``value``.
         """
-        editions_select_html = self.html.css_first("form > select")
-        return parse_select(editions_select_html)
-
-    def stages(self, *args: str) -> List[Dict[str, Any]]:
+        # stage races have also stages select, so find the one with years
+        selects_html = self.html.css("form > select")
+        for select_html in selects_html:
+            first_option_html = select_html.css_first("option")
+            if first_option_html and first_option_html.text().isnumeric():
+                return parse_select(select_html)
+        if not selects_html:
+            raise ExpectedParsingError("Previous editions select unavailable.")
+        return parse_select(selects_html[0])
+
+    def fetch_editions(self, first_year: Optional[int] = None,
+                       last_year: Optional[int] = None,
+                       max_workers: int = 8,
+                       skip_cached: bool = False) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetches overview pages of race editions from previous editions select
+        menu concurrently and parses basic info, stages and stages winners
+        from them. Editions which pages are unavailable (e.g. cancelled ones)
+        are skipped.
+
+        :param first_year: First year of wanted editions, defaults to None
+            (no lower bound).
+        :param last_year: Last year of wanted editions, defaults to None (no
+            upper bound).
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :param skip_cached: Whether to parse editions which overview pages
+            are already stored in ``Scraper.page_cache`` straight from the
+            cache, so only missing editions are requested. Useful for
+            incremental backfills. Defaults to False.
+        :return: Dict mapping edition years to dicts with parsed data, where
+            keys are `_edition_methods` names. Values of methods that raised
+            ``ExpectedParsingError`` are None.
+        """
+        edition_urls = {}
+        for option in self.prev_editions_select():
+            if not option["text"].isnumeric():
+                continue
+            year = int(option["text"])
+            if (first_year is not None and year < first_year) or \
+                    (last_year is not None and year > last_year):
+                continue
+            url = "/".join(option["value"].split("/")[:3])
+            edition_urls[url] = year
+
+        races = []
+        urls_to_fetch = []
+        for url in edition_urls:
+            html = None
+            if skip_cached and self.page_cache is not None:
+                html = self.page_cache.get_bytes(self._make_url_absolute(url))
+            if html is None:
+                urls_to_fetch.append(url)
+                continue
+            try:
+                races.append(Race.from_html(url, html))
+            except ValueError:
+                continue
+        races.extend(Race.fetch_many(urls_to_fetch, max_workers,
+                                     skip_invalid=True))
+        editions = {}
+        for race in races:
+            parsed_data = {}
+            for method_name in self._edition_methods:
+                try:
+                    parsed_data[method_name] = getattr(race, method_name)()
+                except ExpectedParsingError:
+                    parsed_data[method_name] = None
+            editions[edition_urls[race.relative_url()]] = parsed_data
+        # keep order of the select menu
+        return {year: editions[year] for year in edition_urls.values()
+                if year in editions}
+
+    def stages(self, *args: str, limit: Optional[int] = None
+               ) -> List[Dict[str, Any]]:
         """
         Parses race stages from HTML (available only on stage races). When
         race is one day race, empty list is returned.
@@ -261,6 +321,8 @@ class Race(Scraper):
             - stage_url: URL of the stage, e.g. \
                 ``race/tour-de-france/2022/stage-2``.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -302,7 +364,7 @@ class Race(Scraper):
             row.remove()
         table_parser = TableParser(stages_table_html)
         casual_f_to_parse = [f for f in fields if f != "date"]
-        table_parser.parse(casual_f_to_parse)
+        table_parser.parse(casual_f_to_parse, limit)
 
         # add stages dates to table if needed
         if "date" in fields:
@@ -310,6 +372,36 @@ class Race(Scraper):
             table_parser.extend_table("date", dates)
         return table_parser.table
 
+    @staticmethod
+    def cached_stages(race_url: str) -> List[Dict[str, Any]]:
+        """
+        Gets stages table of a race with all fields from shared memo. The race
+        page is fetched and parsed only on the first call with given URL, so
+        scrapers that need parent race data (e.g. stages of the race of
+        a stage) don't download the same race page repeatedly. Memo holds
+        stages of the `RACE_STAGES_MEMO_SIZE` most recently used races, keyed
+        by absolute race URL (made with current ``Scraper.BASE_URL``) and
+        current ``Scraper.page_cache``. Use ``clear_cached_stages`` to empty
+        it.
+
+        :param race_url: (Relative) URL of race overview, e.g.
+            ``race/tour-de-france/2022``.
+        :return: Table with all ``stages`` fields. Rows are copies, so they
+            can be modified freely.
+        """
+        relative_url = race_url
+        if race_url.startswith(("http://", "https://")):
+            relative_url = "/".join(race_url.split("/")[3:])
+        relative_url = "/".join(
+            part for part in relative_url.split("/") if part)
+        return [dict(row) for row in _memoized_race_stages(
+            Scraper.BASE_URL + relative_url, Scraper.page_cache)]
+
+    @staticmethod
+    def clear_cached_stages() -> None:
+        """Empties memo of stages tables used by ``cached_stages``."""
+        _memoized_race_stages.cache_clear()
+
     def stages_winners(self, *args) -> List[Dict[str, str]]:
         """
         Parses stages winners from HTML (available only on stage races). When
@@ -387,6 +479,11 @@ class Race(Scraper):
     def final_5k_stats(self, *args: str) -> List[Dict[str, Any]]:
         """
         Parses final 5k statistics from HTML (available on both stage races and one-day races).
+        Statistics are parsed from final-5k sub-page, which is requested on
+        the first call (or prefetched with `prefetch_sub_pages`), also when
+        the object is materialized. Objects created from HTML don't request
+        it, set it with `set_sub_page`. `parse` doesn't request the sub-page,
+        the value is None when it isn't loaded.
 
         :param args: Fields that should be contained in returned table. When
             no args are passed, all fields are parsed.
@@ -398,6 +495,8 @@ class Race(Scraper):
             - vertical_meters: Vertical meters climbed in final 5k.
             - avg_gradient: Average gradient percentage in final 5k.
 
+        :raises ExpectedParsingError: When the sub-page isn't loaded and the
+            object is created from HTML.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -412,14 +511,9 @@ class Race(Scraper):
         
         fields = parse_table_fields_args(args, available_fields)
         
-        # Create new scraper instance with final-5k URL
-        from .scraper import Scraper
-        final_5k_url = f"{self.relative_url()}/route/final-5k"
-        final_5k_scraper = Scraper(final_5k_url)
-        
-        # Find the final 5k statistics table
+        # Find the final 5k statistics table on final-5k sub-page
         final_5k_table_html = None
-        for table in final_5k_scraper.html.css("table.basic"):
+        for table in self._sub_page("final_5k").css("table.basic"):
             table_text = table.text()
             if "Vertical meters" in table_text and "Stage" in table_text:
                 final_5k_table_html = table
@@ -473,3 +567,22 @@ class Race(Scraper):
             table_parser.extend_table("avg_gradient", avg_gradient)
         
         return table_parser.table
+
+
+RACE_STAGES_MEMO_SIZE = 64
+"""Count of races which stages are held by `Race.cached_stages` memo."""
+
+
+@lru_cache(maxsize=RACE_STAGES_MEMO_SIZE)
+def _memoized_race_stages(race_url: str,
+                          page_cache: Any) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parses stages of race with given URL. Results are memoized, use
+    `Race.cached_stages` that returns copies of them.
+
+    :param race_url: Normalized absolute race URL.
+    :param page_cache: ``Scraper.page_cache`` the race page is fetched with,
+        part of the memo key only.
+    :return: Stages table as tuple.
+    """
+    return tuple(Race(race_url).stages())
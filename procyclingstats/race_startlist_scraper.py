@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from .rider_scraper import Rider
 from .scraper import Scraper
 from .table_parser import TableParser
 from .utils import parse_table_fields_args
@@ -41,7 +42,18 @@ class RaceStartlist(Scraper):
     }
     """
 
-    def startlist(self, *args: str) -> List[Dict[str, Any]]:
+    _startlist_fields = (
+        "rider_name",
+        "rider_url",
+        "team_name",
+        "team_url",
+        "nationality",
+        "rider_number",
+    )
+    """Fields available in startlist table."""
+
+    def startlist(self, *args: str, limit: Optional[int] = None
+                  ) -> List[Dict[str, Any]]:
         """
         Parses startlist from HTML. When startlist is individual (without
         teams) fields team name, team url and rider nationality are set to
@@ -59,17 +71,12 @@ class RaceStartlist(Scraper):
                 numbered participants (e.g. the ones that haven't occured yet)
                 is every rider's ID None.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rider_name",
-            "rider_url",
-            "team_name",
-            "team_url",
-            "nationality",
-            "rider_number",
-        )
+        available_fields = self._startlist_fields
         fields = parse_table_fields_args(args, available_fields)
         startlist_html = self.html.css_first("table.basic")
 
@@ -77,7 +84,7 @@ class RaceStartlist(Scraper):
         if startlist_html:
             startlist_parser = TableParser(startlist_html)
             casual_fields = [f for f in fields if f != "rider_number"]
-            startlist_parser.parse(casual_fields)
+            startlist_parser.parse(casual_fields, limit)
             # adds rider number to table if needed
             if "rider_number" in fields:
                 numbers = startlist_parser.parse_extra_column(
@@ -93,6 +100,8 @@ class RaceStartlist(Scraper):
             return table
             
         for team_html in startlist_html.css(".ridersCont"):
+            if limit is not None and len(table) >= limit:
+                break
             try:
                 riders_table = team_html.css_first("ul")
                 if not riders_table:
@@ -134,4 +143,33 @@ class RaceStartlist(Scraper):
             except Exception:
                 # Skip problematic teams instead of failing completely
                 continue
-        return table
+        return table if limit is None else table[:limit]
+
+    @staticmethod
+    def fetch_riders(*startlists: Iterable[Dict[str, Any]],
+                     max_workers: int = 8) -> Iterator[Rider]:
+        """
+        Fetches profiles of riders from given startlists concurrently. Every
+        rider is fetched only once, even when is contained in more
+        startlists.
+
+        Usage:
+
+        >>> startlists = [RaceStartlist(url).startlist("rider_url")
+        ...               for url in startlist_urls]
+        >>> for rider in RaceStartlist.fetch_riders(*startlists):
+        ...     print(rider.name())
+
+        :param startlists: Tables returned by ``startlist`` method, every row
+            has to contain ``rider_url`` field.
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :return: Iterator of ``Rider`` objects ready for parsing, yielded as
+            soon as they are fetched. Riders with unavailable profiles are
+            skipped.
+        """
+        # dict keeps order of first occurrence
+        rider_urls = dict.fromkeys(
+            row["rider_url"] for startlist in startlists
+            for row in startlist if row.get("rider_url"))
+        return Rider.iter_fetch(rider_urls, max_workers, skip_invalid=True)
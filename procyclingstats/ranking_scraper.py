@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Literal, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -60,7 +60,114 @@ class Ranking(Scraper):
         ...
     }
     """
-    def individual_ranking(self, *args: str) -> List[Dict[str, Any]]:
+
+    _individual_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "rider_name",
+        "rider_url",
+        "team_name",
+        "team_url",
+        "nationality",
+        "points",
+    )
+    """Fields available in individual ranking table."""
+
+    _team_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "team_name",
+        "team_url",
+        "nationality",
+        "class",
+        "points",
+    )
+    """Fields available in team ranking table."""
+
+    _nations_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "nation_name",
+        "nation_url",
+        "nationality",
+        "points",
+    )
+    """Fields available in nations ranking table."""
+
+    _races_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "race_name",
+        "race_url",
+        "nationality",
+        "class",
+        "points",
+    )
+    """Fields available in races ranking table."""
+
+    _individual_wins_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "rider_name",
+        "rider_url",
+        "team_name",
+        "team_url",
+        "nationality",
+        "first_places",
+        "second_places",
+        "third_places",
+    )
+    """Fields available in individual wins ranking table."""
+
+    _teams_wins_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "team_name",
+        "team_url",
+        "nationality",
+        "class",
+        "first_places",
+        "second_places",
+        "third_places",
+    )
+    """Fields available in teams wins ranking table."""
+
+    _nations_wins_ranking_fields = (
+        "rank",
+        "prev_rank",
+        "nation_name",
+        "nation_url",
+        "nationality",
+        "first_places",
+        "second_places",
+        "third_places",
+    )
+    """Fields available in nations wins ranking table."""
+
+    _distance_ranking_fields = (
+        "rider_name",
+        "rider_url",
+        "team_name",
+        "team_url",
+        "rank",
+        "nationality",
+        "distance",
+    )
+    """Fields available in distance ranking table."""
+
+    _racedays_ranking_fields = (
+        "rider_name",
+        "rider_url",
+        "team_name",
+        "team_url",
+        "rank",
+        "nationality",
+        "racedays",
+    )
+    """Fields available in racedays ranking table."""
+
+    def individual_ranking(self, *args: str, limit: Optional[int] = None
+                           ) -> List[Dict[str, Any]]:
         """
         Parses individual ranking from HTML.
 
@@ -76,28 +183,23 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not an
             individual points ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "rider_name",
-            "rider_url",
-            "team_name",
-            "team_url",
-            "nationality",
-            "points"
-        )
+        available_fields = self._individual_ranking_fields
         if self._ranking_type() != "individual":
             raise ExpectedParsingError(
                 "This object doesn't support individual_ranking method, create"
                 "one with individual ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def team_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def team_ranking(self, *args: str, limit: Optional[int] = None
+                     ) -> List[Dict[str, Any]]:
         """
         Parses team ranking from HTML.
 
@@ -112,27 +214,23 @@ class Ranking(Scraper):
             - class: Team's class, e.g. ``WT``.
             - points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a team
             points ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "team_name",
-            "team_url",
-            "nationality",
-            "class",
-            "points"
-        )
+        available_fields = self._team_ranking_fields
         if self._ranking_type() != "teams":
             raise ExpectedParsingError(
                 "This object doesn't support team_ranking method, "
                 "create one with teams ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def nations_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def nations_ranking(self, *args: str, limit: Optional[int] = None
+                        ) -> List[Dict[str, Any]]:
 
         """
         Parses nations ranking from HTML.
@@ -147,26 +245,23 @@ class Ranking(Scraper):
             - nationality: Nation as 2 chars long country code.
             - points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a
             nationality points ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "nation_name",
-            "nation_url",
-            "nationality",
-            "points"
-        )
+        available_fields = self._nations_ranking_fields
         if self._ranking_type() != "nations":
             raise ExpectedParsingError(
                 "This object doesn't support nations_ranking method, create" +
                 "one with nations ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def races_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def races_ranking(self, *args: str, limit: Optional[int] = None
+                      ) -> List[Dict[str, Any]]:
         """
         Parses race ranking from HTML. Race points are evaluated based on
             startlist quality score.
@@ -182,20 +277,14 @@ class Ranking(Scraper):
             - class: Race's class, e.g. ``WT``.
             - points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a race
             ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "race_name",
-            "race_url",
-            "nationality",
-            "class",
-            "points"
-        )
+        available_fields = self._races_ranking_fields
         if self._ranking_type() != "races":
             raise ExpectedParsingError(
                 "This object doesn't support races_ranking method, create one"
@@ -204,18 +293,17 @@ class Ranking(Scraper):
         fields = parse_table_fields_args(args, available_fields)
         html_table = self.html.css_first("table")
         table_parser = TableParser(html_table)
-        # parse race name and url as stage name and url and rename it
-        # afterwards
+        table_parser.parse([field for field in fields
+                            if field not in ("race_name", "race_url")], limit)
+        # race name and url are parsed as stage name and url
         if "race_name" in fields:
-            fields[fields.index("race_name")] = "stage_name"
+            table_parser.extend_table("race_name", table_parser.stage_name())
         if "race_url" in fields:
-            fields[fields.index("race_url")] = "stage_url"
-        table_parser.parse(fields)
-        table_parser.rename_field("stage_name", "race_name")
-        table_parser.rename_field("stage_url", "race_url")
+            table_parser.extend_table("race_url", table_parser.stage_url())
         return table_parser.table
 
-    def individual_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def individual_wins_ranking(self, *args: str, limit: Optional[int] = None
+                                ) -> List[Dict[str, Any]]:
         """
         Parses individual wins ranking from HTML.
 
@@ -233,30 +321,23 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not an
             individual wins ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "rider_name",
-            "rider_url",
-            "team_name",
-            "team_url",
-            "nationality",
-            "first_places",
-            "second_places",
-            "third_places"
-        )
+        available_fields = self._individual_wins_ranking_fields
         if self._ranking_type() != "individual_wins":
             raise ExpectedParsingError(
                 "This object doesn't support races_ranking method, create one"
                 "with individual wins ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def teams_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def teams_wins_ranking(self, *args: str, limit: Optional[int] = None
+                           ) -> List[Dict[str, Any]]:
         """
         Parses team wins ranking from HTML.
 
@@ -273,29 +354,23 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a team
             wins ranking.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "team_name",
-            "team_url",
-            "nationality",
-            "class",
-            "first_places",
-            "second_places",
-            "third_places"
-        )
+        available_fields = self._teams_wins_ranking_fields
         if self._ranking_type() != "team_wins":
             raise ExpectedParsingError(
                 "This object doesn't support teams_wins_ranking method, "
                 "create one with teams wins ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def nations_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def nations_wins_ranking(self, *args: str, limit: Optional[int] = None
+                             ) -> List[Dict[str, Any]]:
         """
         Parses nations wins ranking from HTML.
 
@@ -311,30 +386,25 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a nation
             wins ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rank",
-            "prev_rank",
-            "nation_name",
-            "nation_url",
-            "nationality",
-            "first_places",
-            "second_places",
-            "third_places"
-        )
+        available_fields = self._nations_wins_ranking_fields
 
         if self._ranking_type() != "nation_wins":
             raise ExpectedParsingError(
                 "This object doesn't support nations_wins_ranking method, " +
                 "create one with nations wins ranking URL to call this" +
                 "method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+                                                 limit)
 
-    def distance_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def distance_ranking(self, *args: str, limit: Optional[int] = None
+                         ) -> List[Dict[str, Any]]:
         """
         Parses ranking with riders ridden distances from HTML.
 
@@ -349,20 +419,14 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - distance: Rider's ridden distance in the season as KMs.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a
             distance ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rider_name",
-            "rider_url",
-            "team_name",
-            "team_url",
-            "rank",
-            "nationality",
-            "distance",
-        )
+        available_fields = self._distance_ranking_fields
         if self._ranking_type() != "distance":
             raise ExpectedParsingError(
                 "This object doesn't support distance_ranking method, " +
@@ -373,7 +437,7 @@ class Ranking(Scraper):
 
         distance_ranking_table_html = self.html.css_first("span > table")
         table_parser = TableParser(distance_ranking_table_html)
-        table_parser.parse(casual_fields)
+        table_parser.parse(casual_fields, limit)
 
         if "distance" in fields:
             distances = table_parser.parse_extra_column("KMs",
@@ -381,7 +445,8 @@ class Ranking(Scraper):
             table_parser.extend_table("distance", distances)
         return table_parser.table
 
-    def racedays_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def racedays_ranking(self, *args: str, limit: Optional[int] = None
+                         ) -> List[Dict[str, Any]]:
         """
         Parses ranking with riders ridden racedays from HTML.
 
@@ -396,20 +461,14 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - racedays: Rider's ridden racedays in the season.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpectedParsingError: When the table from HTML is not a
             racedays ranking table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rider_name",
-            "rider_url",
-            "team_name",
-            "team_url",
-            "rank",
-            "nationality",
-            "racedays",
-        )
+        available_fields = self._racedays_ranking_fields
         if self._ranking_type() != "racedays":
             raise ExpectedParsingError(
                 "This object doesn't support distance_ranking method, " +
@@ -420,7 +479,7 @@ class Ranking(Scraper):
 
         distance_ranking_table_html = self.html.css_first("span > table")
         table_parser = TableParser(distance_ranking_table_html)
-        table_parser.parse(casual_fields)
+        table_parser.parse(casual_fields, limit)
 
         if "racedays" in fields:
             racedays = table_parser.parse_extra_column("Racedays",
@@ -513,17 +572,19 @@ class Ranking(Scraper):
 
     def _parse_regular_ranking_table(self,
             args: Tuple[str, ...],
-            available_fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+            available_fields: Tuple[str, ...],
+            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Does general ranking parsing procedure using TableParser.
 
         :param args: Parsing method args (only the ones that
             `TableParser.parse` method is able to parse).
         :param available_fields: Available table fields for parsing method
+        :param limit: Maximal count of rows to parse, defaults to None.
         :return: Table with wanted fields.
         """
         fields = parse_table_fields_args(args, available_fields)
         html_table = self.html.css_first("table")
         table_parser = TableParser(html_table)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
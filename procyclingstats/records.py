@@ -0,0 +1,239 @@
+import keyword
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from .race_startlist_scraper import RaceStartlist
+from .ranking_scraper import Ranking
+from .rider_results_scraper import RiderResults
+from .stage_scraper import Stage
+from .table_parser import TableParser
+from .team_scraper import Team
+
+
+def _attribute_name(field: str) -> str:
+    """
+    Makes attribute name of given field, fields that are Python keywords get
+    underscore suffix (`class` field is stored in `class_` attribute).
+
+    :param field: Field name.
+    :return: Attribute name.
+    """
+    return f"{field}_" if keyword.iskeyword(field) else field
+
+
+class RowRecord:
+    """
+    Base class of compact table rows. Values are stored in ``__slots__``
+    instead of dict, which saves memory and makes attribute access faster.
+    Fields missing in the row are None. Concrete row classes are created
+    with `row_class`.
+
+    :param values: Values of the row with field names as keys.
+    :raises ValueError: When one of the values isn't a field of the row.
+    """
+
+    __slots__ = ()
+    fields: Tuple[str, ...] = ()
+    """Fields of the row."""
+
+    def __init__(self, **values: Any) -> None:
+        for field in self.fields:
+            setattr(self, _attribute_name(field), values.pop(field, None))
+        if values:
+            raise ValueError(
+                f"Invalid fields of {type(self).__name__}: '{list(values)}'")
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]],
+                     length: int) -> List["RowRecord"]:
+        """
+        Creates rows from table columns without making dict of every row.
+
+        :param columns: Columns of the table with field names as keys.
+        :param length: Count of rows.
+        :raises ValueError: When one of columns isn't a field of the row.
+        :return: List of row records.
+        """
+        invalid_fields = [field for field in columns
+                          if field not in cls.fields]
+        if invalid_fields:
+            raise ValueError(
+                f"Invalid fields of {cls.__name__}: '{invalid_fields}'")
+        rows = [cls.__new__(cls) for _ in range(length)]
+        for field in cls.fields:
+            attribute = _attribute_name(field)
+            column = columns.get(field)
+            if column is None:
+                for row in rows:
+                    setattr(row, attribute, None)
+            else:
+                for row, value in zip(rows, column):
+                    setattr(row, attribute, value)
+        return rows
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "RowRecord":
+        """
+        Creates row from dict row of parsed table.
+
+        :param row: Table row.
+        :raises ValueError: When one of row keys isn't a field of the row.
+        :return: Row record.
+        """
+        return cls(**row)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Converts row to dict.
+
+        :return: Dict with field names as keys.
+        """
+        return {field: getattr(self, _attribute_name(field))
+                for field in self.fields}
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Gets value of given field.
+
+        :param field: Field name.
+        :param default: Value returned when the field isn't a field of the
+            row, defaults to None.
+        :return: Value of the field.
+        """
+        if field not in self.fields:
+            return default
+        return getattr(self, _attribute_name(field))
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in self.fields:
+            raise KeyError(field)
+        return getattr(self, _attribute_name(field))
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field not in self.fields:
+            raise KeyError(field)
+        setattr(self, _attribute_name(field), value)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and \
+            self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={value!r}"
+                           for field, value in self.as_dict().items())
+        return f"{type(self).__name__}({values})"
+
+
+def row_class(name: str, fields: Tuple[str, ...]) -> Type[RowRecord]:
+    """
+    Creates row class with given fields.
+
+    :param name: Name of the class.
+    :param fields: Fields of the row, e.g. available fields of a table
+        parsing method.
+    :return: Row class.
+    """
+    return type(name, (RowRecord,), {
+        "__slots__": tuple(_attribute_name(field) for field in fields),
+        "__module__": __name__,
+        "fields": tuple(fields),
+    })
+
+
+# pylint: disable=protected-access
+StageResultRow = row_class("StageResultRow", Stage._results_fields)
+StageGCRow = row_class("StageGCRow", Stage._gc_fields)
+RiderResultRow = row_class("RiderResultRow", RiderResults._results_fields)
+TeamRiderRow = row_class("TeamRiderRow", Team._riders_fields)
+RankingRow = row_class("RankingRow", Ranking._individual_ranking_fields)
+TeamRankingRow = row_class("TeamRankingRow", Ranking._team_ranking_fields)
+NationsRankingRow = row_class("NationsRankingRow",
+                              Ranking._nations_ranking_fields)
+RacesRankingRow = row_class("RacesRankingRow", Ranking._races_ranking_fields)
+IndividualWinsRankingRow = row_class(
+    "IndividualWinsRankingRow", Ranking._individual_wins_ranking_fields)
+TeamsWinsRankingRow = row_class("TeamsWinsRankingRow",
+                                Ranking._teams_wins_ranking_fields)
+NationsWinsRankingRow = row_class("NationsWinsRankingRow",
+                                  Ranking._nations_wins_ranking_fields)
+DistanceRankingRow = row_class("DistanceRankingRow",
+                               Ranking._distance_ranking_fields)
+RacedaysRankingRow = row_class("RacedaysRankingRow",
+                               Ranking._racedays_ranking_fields)
+StartlistRow = row_class("StartlistRow", RaceStartlist._startlist_fields)
+# pylint: enable=protected-access
+
+ROW_CLASSES: Dict[Tuple[type, str], Type[RowRecord]] = {
+    (Stage, "results"): StageResultRow,
+    (Stage, "gc"): StageGCRow,
+    (RiderResults, "results"): RiderResultRow,
+    (Team, "riders"): TeamRiderRow,
+    (Ranking, "individual_ranking"): RankingRow,
+    (Ranking, "team_ranking"): TeamRankingRow,
+    (Ranking, "nations_ranking"): NationsRankingRow,
+    (Ranking, "races_ranking"): RacesRankingRow,
+    (Ranking, "individual_wins_ranking"): IndividualWinsRankingRow,
+    (Ranking, "teams_wins_ranking"): TeamsWinsRankingRow,
+    (Ranking, "nations_wins_ranking"): NationsWinsRankingRow,
+    (Ranking, "distance_ranking"): DistanceRankingRow,
+    (Ranking, "racedays_ranking"): RacedaysRankingRow,
+    (RaceStartlist, "startlist"): StartlistRow,
+}
+"""Row classes of table parsing methods."""
+
+_DIRECT_ROW_METHODS = frozenset(
+    [(RiderResults, "results")] +
+    [(Ranking, method_name) for scraper_class, method_name in ROW_CLASSES
+     if scraper_class is Ranking])
+"""Table parsing methods whose table parser builds row records directly.
+Rows of other methods are joined with other tables as dicts, so they're
+converted afterwards."""
+
+
+def to_records(table: List[Dict[str, Any]],
+               row_cls: Type[RowRecord]) -> List[RowRecord]:
+    """
+    Converts parsed table to row records.
+
+    :param table: Parsed table.
+    :param row_cls: Row class to convert rows to.
+    :raises ValueError: When table has fields that the row class doesn't.
+    :return: List of row records.
+    """
+    return [row_cls(**row) for row in table]
+
+
+def records(table_method: Callable[..., List[Dict[str, Any]]],
+            *args: str) -> List[RowRecord]:
+    """
+    Calls table parsing method of scraper object and returns the table as
+    row records. Tables of rankings and rider's results are parsed to row
+    records directly, other tables are converted from parsed dicts.
+
+    Usage:
+
+    >>> from procyclingstats import Stage
+    >>> from procyclingstats.records import records
+    >>> stage = Stage("race/tour-de-france/2022/stage-18")
+    >>> row = records(stage.results, "rider_url", "rank")[0]
+    >>> row.rider_url, row.rank
+    ('rider/jonas-vingegaard-rasmussen', 1)
+
+    :param table_method: Bound table parsing method, e.g. ``stage.results``.
+    :param args: Fields passed to the method.
+    :raises ValueError: When the method has no row class.
+    :return: List of row records.
+    """
+    scraper_class = type(table_method.__self__)  # type: ignore
+    for cls in scraper_class.__mro__:
+        row_cls = ROW_CLASSES.get((cls, table_method.__name__))
+        if row_cls is None:
+            continue
+        if (cls, table_method.__name__) not in _DIRECT_ROW_METHODS:
+            return to_records(table_method(*args), row_cls)
+        with TableParser.building_rows(row_cls):
+            table = table_method(*args)
+        # materialized objects return stored dicts
+        return [row if isinstance(row, row_cls) else row_cls(**row)
+                for row in table]
+    raise ValueError(f"Method '{table_method.__name__}' of "
+                     f"'{scraper_class.__name__}' has no row class.")
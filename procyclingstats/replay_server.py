@@ -0,0 +1,170 @@
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Tuple, Union
+
+NOT_FOUND_HTML = (b"<html><head><title>Page not found</title></head><body>"
+                  b"<div class=\"page-title\"><div class=\"main\">"
+                  b"<h1>Page not found</h1></div></div></body></html>")
+"""Body of responses to URLs that aren't in the source."""
+
+UNAVAILABLE_HTML = (b"<html><body><div class=\"page-content\"><div>"
+                    b"Due to technical difficulties this page is temporarily "
+                    b"unavailable.</div></div></body></html>")
+"""Body of injected error responses, the same message as the site shows."""
+
+
+class ReplayServer:
+    """
+    Local HTTP server that replays stored pages, so scraping (including
+    concurrent fetching, caching and error handling) can be tested and
+    benchmarked without access to procyclingstats.com. Pages are taken from
+    `source`, which is any object with ``get(url)`` method returning HTML
+    (or ``get_bytes(url)`` returning UTF-8 encoded HTML) or None, e.g.
+    ``HTMLArchive``, ``PackedArchive`` or ``PageCache``. The source is queried
+    with URLs on `origin`, so archives created from the real site can be
+    replayed as they are.
+
+    To scrape from the server, set ``Scraper.BASE_URL`` to its ``url``.
+
+    Usage:
+
+    >>> from procyclingstats import HTMLArchive, ReplayServer, Scraper, Stage
+    >>> archive = HTMLArchive("pcs_archive")
+    >>> with ReplayServer(archive, latency=0.05, error_rate=0.01) as server:
+    ...     Scraper.BASE_URL = server.url
+    ...     stage = Stage("race/tour-de-france/2022/stage-18")
+
+    :param source: Object pages are taken from.
+    :param host: Host to listen on, defaults to ``127.0.0.1``.
+    :param port: Port to listen on, defaults to 0 (any free port).
+    :param latency: Delay of every response in seconds, either constant or
+        tuple with bounds of uniformly distributed delay. Defaults to 0.
+    :param error_rate: Probability of responding with `error_status` instead
+        of the page, defaults to 0.
+    :param error_status: HTTP status of injected errors, defaults to 503.
+    :param origin: Base URL of the site the source was created from,
+        defaults to ``https://www.procyclingstats.com/``.
+    :param seed: Seed of random generator used for latency and error
+        injection, defaults to None.
+    """
+
+    def __init__(self, source: Any, host: str = "127.0.0.1", port: int = 0,
+                 latency: Union[float, Tuple[float, float]] = 0,
+                 error_rate: float = 0, error_status: int = 503,
+                 origin: str = "https://www.procyclingstats.com/",
+                 seed: Optional[int] = None) -> None:
+        self.source = source
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.origin = origin
+        self.requests_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. ``http://127.0.0.1:8000/``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "ReplayServer":
+        """
+        Starts serving in a background thread.
+
+        :return: The server itself.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serves in current thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def _respond(self, path: str) -> Tuple[int, bytes]:
+        """
+        Makes response to request of given path with configured latency and
+        errors.
+
+        :param path: Requested path including query string.
+        :return: Tuple of HTTP status and body.
+        """
+        with self._lock:
+            self.requests_count += 1
+            if isinstance(self.latency, tuple):
+                delay = self._random.uniform(*self.latency)
+            else:
+                delay = self.latency
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return self.error_status, UNAVAILABLE_HTML
+        html = self._page(self.origin + path.lstrip("/"))
+        if html is None:
+            return 404, NOT_FOUND_HTML
+        return 200, html
+
+    def _page(self, url: str) -> Optional[bytes]:
+        """
+        Gets page from the source.
+
+        :param url: URL of the page on `origin`.
+        :return: UTF-8 encoded HTML, None when the page isn't in the source.
+        """
+        if hasattr(self.source, "get_bytes"):
+            return self.source.get_bytes(url)
+        html = self.source.get(url)
+        if isinstance(html, str):
+            return html.encode("utf-8")
+        return html
+
+    def _handler_class(self) -> type:
+        """
+        Makes request handler class bound to this server.
+
+        :return: Request handler class.
+        """
+        server = self
+
+        class ReplayRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                self._reply(send_body=True)
+
+            def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+                self._reply(send_body=False)
+
+            def _reply(self, send_body: bool) -> None:
+                status, body = server._respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def log_message(self, *_: Any) -> None:
+                pass
+
+        return ReplayRequestHandler
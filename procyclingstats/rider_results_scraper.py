@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from selectolax.parser import HTMLParser
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -53,15 +55,36 @@ class RiderResults(Scraper):
     }
     """
 
-    def _html_valid(self) -> bool:
+    _results_fields = (
+        "date",
+        "rank",
+        "stage_url",
+        "stage_name",
+        "nationality",
+        "class",
+        "distance",
+        "pcs_points",
+        "uci_points",
+    )
+    """Fields available in rider's default results table."""
+
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "fetch_career",
+    )
+    """Public methods that aren't called by `parse` method."""
+
+    def _html_valid(self, html: Optional[HTMLParser] = None) -> bool:
         """
         Extends Scraper method for validating HTMLs.
 
+        :param html: HTML to check, defaults to None (`self.html` is checked).
         :return: True if given HTML is valid, otherwise False
         """
         try:
-            assert super()._html_valid()
-            page_title = self.html.css_first(".page-content > h2").text()
+            assert super()._html_valid(html)
+            if html is None:
+                html = self.html
+            page_title = html.css_first(".page-content > h2").text()
             assert page_title in ("All results", "Top results final 5k analysis")
             return True
         except AssertionError:
@@ -69,6 +92,7 @@ class RiderResults(Scraper):
 
     def _set_up_html(self):
         """Overrides Scraper method. Removes last table row with sum stats."""
+        super()._set_up_html()
         results_table_html = self.html.css_first("table")
         if not results_table_html:
             return
@@ -76,7 +100,8 @@ class RiderResults(Scraper):
             if "class" in row.attributes and row.attributes["class"] == "sum":
                 row.decompose()
 
-    def results(self, *args: str) -> List[Dict[str, Any]]:
+    def results(self, *args: str, limit: Optional[int] = None
+                ) -> List[Dict[str, Any]]:
         """
         Parses general rider's results table from HTML.
 
@@ -93,34 +118,18 @@ class RiderResults(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ExpecterParsingError: When the table from HTML isn't a results
             table.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "date",
-            "rank",
-            "stage_url",
-            "stage_name",
-            "nationality",
-            "class",
-            "distance",
-            "pcs_points",
-            "uci_points",
-        )
-        if self.html.css_first(".page-content > h2").text() != "All results":
-            error_msg = (
-                "This object doesn't support 'results' method. "
-                + "Create one from rider's default results table to call this "
-                + "method"
-            )
-            raise ExpectedParsingError(error_msg)
-
-        fields = parse_table_fields_args(args, available_fields)
+        self._check_default_results_table("results")
+        fields = parse_table_fields_args(args, self._results_fields)
         results_table_html = self.html.css_first("table")
         table_parser = TableParser(results_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
 
         if "stage_url" in fields or "stage_name" in fields:
             race_urls = table_parser.parse_extra_column("Race", str, get_href=True)
@@ -134,6 +143,87 @@ class RiderResults(Scraper):
                     row["stage_name"] = race_names[i]
         return table_parser.table
 
+    def fetch_career(self, *args: str,
+                     max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Fetches rider's results from all seasons listed in seasons select
+        menu and merges them into one table. Pages of every season are
+        requested concurrently, including additional pages from pages select
+        menu when a season has more results than fits to one page. The page
+        this object is created from isn't requested again when it's one of
+        the season pages, pages with invalid HTML are skipped. Rows occurring
+        on more pages are added only once.
+
+        :param args: Fields that should be contained in returned table, the
+            same as for ``results`` method. When no args are passed, all
+            fields are parsed.
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :raises ExpectedParsingError: When the object isn't created from
+            rider's default results table.
+        :raises ValueError: When one of args is of invalid value.
+        :return: Table with wanted fields from the whole career, newest
+            results first.
+        """
+        key_fields = ("date", "stage_url", "rank")
+        self._check_default_results_table("fetch_career")
+        fields = parse_table_fields_args(args, self._results_fields)
+
+        rider_id = self._rider_id()
+        try:
+            seasons = [option["value"] for option in self.seasons_select()
+                       if option["value"]]
+        except ExpectedParsingError:
+            seasons = []
+        if not seasons:
+            pages = [self]
+        else:
+            # the season page this object is created from isn't requested
+            own_position = self._career_page_position(self)
+            pages = RiderResults.fetch_many(
+                [self._career_page_url(rider_id, season, "0")
+                 for season in seasons if (season, "0") != own_position],
+                max_workers, skip_invalid=True)
+            if own_position[0] in seasons:
+                pages.append(self)
+
+        # seasons with more results than one page can hold
+        loaded_positions = {self._career_page_position(page)
+                            for page in pages}
+        checked_seasons = set()
+        extra_urls = []
+        for page in pages:
+            season = self._career_page_position(page)[0]
+            if season not in seasons or season in checked_seasons:
+                continue
+            checked_seasons.add(season)
+            try:
+                offsets = [option["value"] for option in page.pages_select()]
+            except ExpectedParsingError:
+                continue
+            extra_urls.extend(
+                self._career_page_url(rider_id, season, offset)
+                for offset in offsets
+                if (season, offset) not in loaded_positions)
+        if extra_urls:
+            pages.extend(RiderResults.fetch_many(extra_urls, max_workers,
+                                                 skip_invalid=True))
+        if seasons:
+            # keep pages of one season together and ordered by offset
+            pages.sort(key=lambda page: self._career_page_key(page, seasons))
+
+        fields_to_parse = fields + [f for f in key_fields if f not in fields]
+        seen = set()
+        table = []
+        for page in pages:
+            for row in page.results(*fields_to_parse):
+                key = tuple(row[f] for f in key_fields)
+                if key in seen:
+                    continue
+                seen.add(key)
+                table.append({field: row.get(field) for field in fields})
+        return table
+
     def final_n_km_results(self, *args: str) -> List[Dict[str, Any]]:
         """
         Parses rider's final n KMs results table from HTML.
@@ -247,3 +337,106 @@ class RiderResults(Scraper):
             ``text`` and ``value``.
         """
         return parse_select(select_menu_by_name(self.html, "category"))
+
+    def _check_default_results_table(self, method_name: str) -> None:
+        """
+        Checks whether the object is created from rider's default results
+        table.
+
+        :param method_name: Name of the method that requires default results
+            table, used in error message.
+        :raises ExpectedParsingError: When the table from HTML isn't a results
+            table.
+        """
+        if self.html.css_first(".page-content > h2").text() != "All results":
+            error_msg = (
+                f"This object doesn't support '{method_name}' method. "
+                + "Create one from rider's default results table to call this "
+                + "method"
+            )
+            raise ExpectedParsingError(error_msg)
+
+    def _rider_id(self) -> str:
+        """
+        Gets rider's ID used by results filter form, which is either numeric
+        ID from the form or rider's URL part.
+
+        :return: Rider's ID.
+        """
+        id_input_html = self.html.css_first(
+            "form[action='rider.php'] > input[name=id]")
+        if id_input_html and id_input_html.attributes.get("value"):
+            return id_input_html.attributes["value"]  # type: ignore
+        url_parts = self._decompose_url()
+        if url_parts[0] == "rider" and len(url_parts) > 1:
+            return url_parts[1]
+        raise ExpectedParsingError("Rider ID unavailable.")
+
+    @staticmethod
+    def _career_page_url(rider_id: str, season: str, offset: str) -> str:
+        """
+        Makes relative URL of rider's results page filtered by season.
+
+        :param rider_id: Rider's ID from results filter form.
+        :param season: Season to filter results by.
+        :param offset: Results offset from pages select menu.
+        :return: Relative URL of the results page.
+        """
+        return (f"rider.php?xseason={season}&pxseason=equal&offset={offset}"
+                f"&id={rider_id}&p=results")
+
+    @staticmethod
+    def _career_page_position(page: "RiderResults"
+                              ) -> Tuple[Optional[str], str]:
+        """
+        Finds out season and results offset of a results page, from URL
+        parameters when available, otherwise from selected options of select
+        menus.
+
+        :param page: RiderResults object.
+        :return: Tuple of season (None when results aren't filtered by
+            season) and results offset.
+        """
+        params = {}
+        if "?" in page.url:
+            params = dict(param.split("=", 1) for param
+                          in page.url.split("?", 1)[1].split("&")
+                          if "=" in param)
+        season = params.get("xseason") or \
+            RiderResults._selected_value(page, "xseason")
+        offset = params.get("offset") or \
+            RiderResults._selected_value(page, "offset") or "0"
+        return season, offset
+
+    @staticmethod
+    def _selected_value(page: "RiderResults",
+                        name_attr: str) -> Optional[str]:
+        """
+        Gets value of selected option of a select menu.
+
+        :param page: RiderResults object.
+        :param name_attr: Name attribute of the select menu.
+        :return: Value of selected option, None when select menu or its
+            selected option isn't available.
+        """
+        try:
+            select_html = select_menu_by_name(page.html, name_attr)
+        except ExpectedParsingError:
+            return None
+        selected_html = select_html.css_first("option[selected]")
+        if selected_html is None:
+            return None
+        return selected_html.attributes.get("value")
+
+    @staticmethod
+    def _career_page_key(page: "RiderResults",
+                         seasons: List[str]) -> Tuple[int, int]:
+        """
+        Makes sorting key of a results page created by ``fetch_career``.
+
+        :param page: Results page of one of `seasons`.
+        :param seasons: Seasons in order in which pages should be sorted.
+        :return: Tuple of season position and results offset.
+        """
+        season, offset = RiderResults._career_page_position(page)
+        return seasons.index(season), int(offset)  # type: ignore
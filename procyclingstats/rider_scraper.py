@@ -7,6 +7,14 @@ from .scraper import Scraper
 from .table_parser import TableParser
 from .utils import get_day_month, parse_table_fields_args
 
+_BIRTHDATE_REGEX = re.compile(
+    r"Date of birth:(\d{1,2})(?:st|nd|rd|th)([A-Za-z]+)(\d{4})")
+_PLACE_OF_BIRTH_REGEX = re.compile(r"Place of birth:\s*([\w\s,]+)")
+_WEIGHT_REGEX = re.compile(r"Weight:(\d+)kg")
+_HEIGHT_REGEX = re.compile(r"Height:(\d+\.\d+)m")
+_MONTHS = {name: number for number, name in enumerate(calendar.month_name)
+           if name}
+
 
 class Rider(Scraper):
     """
@@ -33,32 +41,23 @@ class Rider(Scraper):
     }
     """
 
+    _html_memos = Scraper._html_memos + ("_info_box_record",)
+    """Attributes holding values memoized from the HTML, which are reset to
+    None whenever the HTML changes."""
+
+    _info_box_record: Optional[Dict[str, Any]] = None
+    """Memoized rider's info box parsed by `_info_box` method."""
+
     def birthdate(self) -> str:
         """
         Parses rider's birthdate from HTML.
 
         :return: birthday of the rider in ``YYYY-MM-DD`` format.
         """
-        # Try new structure first
-        info_box = self.html.css_first(".borderbox.left.w65")
-        if info_box:
-            text = info_box.text()
-            import re
-            birth_match = re.search(r'Date of birth:(\d{1,2})(?:st|nd|rd|th)([A-Za-z]+)(\d{4})', text)
-            if birth_match:
-                day, str_month, year = birth_match.groups()
-                month = list(calendar.month_name).index(str_month)
-                return f"{year}-{month}-{day}"
-        
-        # Fallback to original structure
-        general_info_html = self.html.css_first(".rdr-info-cont")
-        if not general_info_html:
+        birthdate = self._info_box()["birthdate"]
+        if birthdate is None:
             raise ExpectedParsingError("Rider birthdate unavailable.")
-        bd_string = general_info_html.text(separator=" ", deep=False)
-        bd_list = [item for item in bd_string.split(" ") if item][:3]
-        [day, str_month, year] = bd_list
-        month = list(calendar.month_name).index(str_month)
-        return f"{year}-{month}-{day}"
+        return birthdate
 
     def place_of_birth(self) -> str:
         """
@@ -66,34 +65,7 @@ class Rider(Scraper):
 
         :return: rider's place of birth (town only).
         """
-        # Try new structure first
-        info_box = self.html.css_first(".borderbox.left.w65")
-        if info_box:
-            text = info_box.text()
-            import re
-            place_match = re.search(r'Place of birth:\s*([\w\s,]+)', text)
-            if place_match:
-                full_match = place_match.group(1)
-                # Get just the first part before newlines or other content
-                place_parts = full_match.split('\n')[0].strip()
-                return place_parts
-        
-        # Fallback to original structure
-        # normal layout
-        try:
-            place_of_birth_html = self.html.css_first(
-                ".rdr-info-cont > span > span > a"
-            )
-            return place_of_birth_html.text()
-        # special layout
-        except AttributeError:
-            try:
-                place_of_birth_html = self.html.css_first(
-                    ".rdr-info-cont > span > span > span > a"
-                )
-                return place_of_birth_html.text()
-            except AttributeError:
-                return ""
+        return self._info_box()["place_of_birth"]
 
     def name(self) -> str:
         """
@@ -101,13 +73,10 @@ class Rider(Scraper):
 
         :return: Rider's name.
         """
-        # Try new structure first
-        h1_element = self.html.css_first("h1")
-        if h1_element:
-            return h1_element.text()
-        
-        # Fallback to original selector
-        name_element = self.html.css_first(".page-title > .main > h1")
+        if self._layout() == "new":
+            name_element = self.html.css_first("h1")
+        else:
+            name_element = self.html.css_first(".page-title > .main > h1")
         if not name_element:
             raise ExpectedParsingError("Rider name unavailable.")
         return name_element.text()
@@ -118,27 +87,7 @@ class Rider(Scraper):
 
         :return: Rider's weigth in kilograms.
         """
-        # Try new structure first
-        info_box = self.html.css_first(".borderbox.left.w65")
-        if info_box:
-            text = info_box.text()
-            import re
-            weight_match = re.search(r'Weight:(\d+)kg', text)
-            if weight_match:
-                return float(weight_match.group(1))
-        
-        # Fallback to original structure
-        # normal layout
-        try:
-            weight_html = self.html.css(".rdr-info-cont > span")[1]
-            return float(weight_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            try:
-                weight_html = self.html.css(".rdr-info-cont > span > span")[1]
-                return float(weight_html.text().split(" ")[1])
-            except (AttributeError, IndexError):
-                return 0.0
+        return self._info_box()["weight"]
 
     def height(self) -> float:
         """
@@ -146,27 +95,7 @@ class Rider(Scraper):
 
         :return: Rider's height in meters.
         """
-        # Try new structure first
-        info_box = self.html.css_first(".borderbox.left.w65")
-        if info_box:
-            text = info_box.text()
-            import re
-            height_match = re.search(r'Height:(\d+\.\d+)m', text)
-            if height_match:
-                return float(height_match.group(1))
-        
-        # Fallback to original structure
-        # normal layout
-        try:
-            height_html = self.html.css_first(".rdr-info-cont > span > span")
-            return float(height_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            try:
-                height_html = self.html.css_first(".rdr-info-cont > span > span > span")
-                return float(height_html.text().split(" ")[1])
-            except (AttributeError, IndexError):
-                return 0.0
+        return self._info_box()["height"]
 
     def nationality(self) -> str:
         """
@@ -175,27 +104,10 @@ class Rider(Scraper):
         :return: Rider's current nationality as 2 chars long country code in
             uppercase.
         """
-        # Try new structure first - look for flag elements in rider info
-        info_box = self.html.css_first(".borderbox.left.w65")
-        if info_box:
-            flag_elements = info_box.css("span[class*='flag']")
-            for flag_elem in flag_elements:
-                flag_class = flag_elem.attributes.get("class", "")
-                # Look for flag classes like "flag si" or "flag gb"
-                parts = flag_class.split()
-                if len(parts) >= 2 and parts[0] == "flag":
-                    return parts[1].upper()
-        
-        # Fallback to original structure
-        # normal layout
-        nationality_html = self.html.css_first(".rdr-info-cont > .flag")
-        if nationality_html is None:
-            # special layout
-            nationality_html = self.html.css_first(".rdr-info-cont > span > span")
-        if not nationality_html:
+        nationality = self._info_box()["nationality"]
+        if nationality is None:
             raise ExpectedParsingError("Rider nationality unavailable.")
-        flag_class = nationality_html.attributes["class"]
-        return flag_class.split(" ")[-1].upper()  # type:ignore
+        return nationality
 
     def image_url(self) -> Optional[str]:
         """
@@ -203,14 +115,13 @@ class Rider(Scraper):
 
         :return: Relative URL of rider's image. None if image is not available.
         """
-        # Try new structure first - look for rider images
-        imgs = self.html.css("img")
-        for img in imgs:
-            src = img.attributes.get("src", "")
-            if src and "riders/" in src:
-                return src
-        
-        # Fallback to original selector
+        if self._layout() == "new":
+            for img in self.html.css("img"):
+                src = img.attributes.get("src", "")
+                if src and "riders/" in src:
+                    return src
+            return None
+
         image_html = self.html.css_first("div.rdr-img-cont > a > img")
         if not image_html:
             return None
@@ -483,3 +394,112 @@ class Rider(Scraper):
             table_parser.extend_table("uci_points", uci_points)
 
         return table_parser.table
+
+    def _info_box(self) -> Dict[str, Any]:
+        """
+        Parses rider's info box (birthdate, place of birth, weight, height and
+        nationality) at once. The info box is parsed only once for every HTML.
+
+        :return: Dict with keys ``birthdate`` and ``nationality`` (None when
+            unavailable), ``place_of_birth`` (empty string when unavailable),
+            ``weight`` and ``height`` (0.0 when unavailable).
+        """
+        if self._info_box_record is None:
+            if self._layout() == "new":
+                self._info_box_record = self._parse_info_box()
+            else:
+                self._info_box_record = self._parse_legacy_info_box()
+        return self._info_box_record
+
+    def _parse_info_box(self) -> Dict[str, Any]:
+        """
+        Parses info box of new layout, text of the box is read only once.
+
+        :return: Info box record, see `_info_box`.
+        """
+        record: Dict[str, Any] = {"birthdate": None, "place_of_birth": "",
+                                  "weight": 0.0, "height": 0.0,
+                                  "nationality": None}
+        info_box = self.html.css_first(".borderbox.left.w65")
+        if not info_box:
+            return record
+        text = info_box.text()
+        birth_match = _BIRTHDATE_REGEX.search(text)
+        if birth_match:
+            day, str_month, year = birth_match.groups()
+            month = _MONTHS.get(str_month)
+            if month is not None:
+                record["birthdate"] = f"{year}-{month}-{day}"
+        place_match = _PLACE_OF_BIRTH_REGEX.search(text)
+        if place_match:
+            # Get just the first part before newlines or other content
+            record["place_of_birth"] = \
+                place_match.group(1).split("\n")[0].strip()
+        weight_match = _WEIGHT_REGEX.search(text)
+        if weight_match:
+            record["weight"] = float(weight_match.group(1))
+        height_match = _HEIGHT_REGEX.search(text)
+        if height_match:
+            record["height"] = float(height_match.group(1))
+        for flag_elem in info_box.css("span[class*='flag']"):
+            # Look for flag classes like "flag si" or "flag gb"
+            parts = flag_elem.attributes.get("class", "").split()
+            if len(parts) >= 2 and parts[0] == "flag":
+                record["nationality"] = parts[1].upper()
+                break
+        return record
+
+    def _parse_legacy_info_box(self) -> Dict[str, Any]:
+        """
+        Parses info box of legacy layout.
+
+        :return: Info box record, see `_info_box`.
+        """
+        record: Dict[str, Any] = {"birthdate": None, "place_of_birth": "",
+                                  "weight": 0.0, "height": 0.0,
+                                  "nationality": None}
+        general_info_html = self.html.css_first(".rdr-info-cont")
+        if not general_info_html:
+            return record
+        bd_string = general_info_html.text(separator=" ", deep=False)
+        bd_list = [item for item in bd_string.split(" ") if item][:3]
+        if len(bd_list) == 3:
+            day, str_month, year = bd_list
+            month = _MONTHS.get(str_month)
+            if month is not None:
+                record["birthdate"] = f"{year}-{month}-{day}"
+
+        # normal layout first, then special layout
+        place_of_birth_html = self.html.css_first(
+            ".rdr-info-cont > span > span > a") or self.html.css_first(
+            ".rdr-info-cont > span > span > span > a")
+        if place_of_birth_html:
+            record["place_of_birth"] = place_of_birth_html.text()
+
+        for selector in (".rdr-info-cont > span", ".rdr-info-cont > span > span"):
+            try:
+                weight_html = self.html.css(selector)[1]
+                record["weight"] = float(weight_html.text().split(" ")[1])
+                break
+            except (IndexError, ValueError):
+                continue
+
+        for selector in (".rdr-info-cont > span > span",
+                         ".rdr-info-cont > span > span > span"):
+            height_html = self.html.css_first(selector)
+            try:
+                record["height"] = float(height_html.text().split(" ")[1])
+                break
+            except (AttributeError, IndexError, ValueError):
+                continue
+
+        nationality_html = self.html.css_first(".rdr-info-cont > .flag")
+        if nationality_html is None:
+            # special layout
+            nationality_html = self.html.css_first(
+                ".rdr-info-cont > span > span")
+        if nationality_html:
+            flag_class = nationality_html.attributes["class"]
+            record["nationality"] = \
+                flag_class.split(" ")[-1].upper()  # type:ignore
+        return record
@@ -1,20 +1,137 @@
+import codecs
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import re
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Literal,
+                    Optional, Tuple, Type, Union)
 
 import requests
-from selectolax.parser import HTMLParser
+from selectolax.parser import HTMLParser, Node
 
+from .archive import HTMLArchive
+from .cache import PageCache
 from .errors import ExpectedParsingError
 
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+_HEADER_CHARSET_REGEX = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+_META_CHARSET_REGEX = re.compile(rb"(<meta[^>]+charset=[\"']?)([\w-]+)",
+                                 re.IGNORECASE)
+
+_CHARSET_SNIFF_SIZE = 1024
+"""Count of bytes from the beginning of HTML searched for meta charset."""
+
+_CONTENT_START = "</header>"
+"""End of the site header, page content (including page navigation with
+select menus, page title and page body) follows."""
+
+_CONTENT_END = '<div class="footer"'
+"""Start of the site footer, parsing methods don't read from it."""
+
+_UNLOADED_SUB_PAGE = object()
+"""Stored result of a parsing method whose sub-page wasn't loaded when the
+object was materialized, the sub-page is requested on the method's first
+call."""
+
+
+def _content_region(html: Union[str, bytes]) -> Union[str, bytes]:
+    """
+    Slices page HTML to the region between the site header and the site
+    footer, which is the only region parsing methods read from. Head with
+    scripts and styles, site menus and footer are cut off. HTML without the
+    site header is returned as it is.
+
+    :param html: HTML of the page, UTF-8 encoded when given as bytes.
+    :return: Sliced HTML of the same type as given HTML.
+    """
+    if isinstance(html, bytes):
+        start_marker = _CONTENT_START.encode()
+        end_marker = _CONTENT_END.encode()
+    else:
+        start_marker, end_marker = _CONTENT_START, _CONTENT_END
+    start = html.find(start_marker)  # type: ignore
+    if start == -1:
+        return html
+    start += len(start_marker)
+    end = html.find(end_marker, start)  # type: ignore
+    return html[start:] if end == -1 else html[start:end]
+
+
+def _response_html(response: requests.Response) -> bytes:
+    """
+    Gets HTML of a response as UTF-8 encoded bytes without decoding it to
+    string. Encoding is taken from Content-Type header or sniffed from meta
+    tag, HTML in other encoding than UTF-8 is transcoded (including its
+    meta charset). When neither
+    declares the encoding, UTF-8 (the encoding of the site) is assumed, so
+    slow encoding detection of ``requests`` is never made.
+
+    :param response: Response with HTML.
+    :return: UTF-8 encoded HTML.
+    """
+    content = response.content
+    match = _HEADER_CHARSET_REGEX.search(
+        response.headers.get("content-type", ""))
+    if match:
+        encoding = match.group(1)
+    else:
+        meta_match = _META_CHARSET_REGEX.search(content[:_CHARSET_SNIFF_SIZE])
+        if not meta_match:
+            return content
+        encoding = meta_match.group(2).decode("ascii")
+    try:
+        encoding = codecs.lookup(encoding).name
+    except LookupError:
+        return content
+    if encoding == "utf-8":
+        return content
+    html = content.decode(encoding, errors="replace").encode("utf-8")
+    # the parser honours meta charset, so it has to declare the new encoding
+    return _META_CHARSET_REGEX.sub(rb"\1utf-8", html, count=1)
+
 
 class Scraper:
     """Base class for all scraping classes."""
 
     BASE_URL: str = "https://www.procyclingstats.com/"
 
-    _public_nonparsing_methods = ("update_html", "parse", "relative_url")
+    REQUEST_TIMEOUT: float = 30
+    """Timeout in seconds for requests made through `_http_session`."""
+
+    page_cache: Optional[Union[PageCache, HTMLArchive]] = None
+    """Cache of valid page HTMLs shared by all scraper objects. When set,
+    `update_html` takes HTML from the cache instead of making request."""
+
+    slice_html: bool = False
+    """Whether to build HTML trees only from the region of the page between
+    the site header and the site footer. Smaller trees are built faster and
+    take less memory, the cache still stores whole pages."""
+
+    _public_nonparsing_methods = ("update_html", "parse", "relative_url",
+                                  "fetch_many", "iter_fetch", "from_html",
+                                  "sub_page_urls", "prefetch_sub_pages",
+                                  "set_sub_page", "materialize")
     """Public methods that aren't called by `parse` method."""
 
+    _html_memos: Tuple[str, ...] = ("_info_list_index", "_page_layout")
+    """Attributes holding values memoized from the HTML, which are reset to
+    None whenever the HTML changes."""
+
+    _sub_pages: Dict[str, str] = {}
+    """Sub-pages some parsing methods parse from. Keys are sub-page names and
+    values URLs relative to the object's URL."""
+
+    _sub_page_methods: Dict[str, str] = {}
+    """Parsing methods that parse from a sub-page mapped to the sub-page name.
+    `parse` and `materialize` call them only when the sub-page is already
+    loaded, otherwise they're treated as raising `ExpectedParsingError`.
+    Called directly, they request the sub-page when the object's HTML was
+    requested too, objects created from HTML need the sub-page set."""
+
     def __init__(self, url: str, **params) -> None:
         """
         Initializes a scraper object with an endpoint and parameters to dynamically build the URL.
@@ -52,8 +169,14 @@ class Scraper:
         # validate given URL
         self._url = url
         self._html = None
+        self._sub_page_htmls: Dict[str, HTMLParser] = {}
+        self._html_requested = False
+        self._info_list_index: Optional[Dict[str, Node]] = None
+        self._info_list_legacy = False
+        self._page_layout: Optional[Literal["new", "legacy"]] = None
+        self._snapshot: Optional[Dict[str, Any]] = None
         if html:
-            self._html = HTMLParser(html)
+            self._html = self._parse_html(html)
             if not self._html_valid():
                 raise ValueError("Given HTML is invalid.")
             self._set_up_html()
@@ -63,6 +186,118 @@ class Scraper:
                 raise ValueError(f"HTML from given URL is invalid: '{self.url}'")
             self._set_up_html()
 
+    @classmethod
+    def from_html(cls, url: str, html: Union[str, bytes]) -> "Scraper":
+        """
+        Creates scraper object from given HTML without making request.
+
+        :param url: (Relative) URL of the page the HTML is from.
+        :param html: HTML of the page, UTF-8 encoded when given as bytes.
+        :raises ValueError: When given HTML is invalid.
+        :return: Scraper object ready for parsing.
+        """
+        scraper = cls.__new__(cls)
+        scraper.__init_with_url(scraper._make_url_absolute(url), html, False)
+        return scraper
+
+    @classmethod
+    def fetch_many(cls, urls: Iterable[str], max_workers: int = 8,
+                   skip_invalid: bool = False,
+                   sub_pages: bool = False) -> List["Scraper"]:
+        """
+        Creates scraper objects from given URLs concurrently. Requests are
+        made from a thread pool, so returned objects are ready for parsing.
+
+        :param urls: (Relative) URLs of pages to create objects from.
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :param skip_invalid: Whether to leave out URLs with invalid HTML
+            instead of raising an error, defaults to False.
+        :param sub_pages: Whether to prefetch sub-pages of every object too,
+            defaults to False.
+        :raises ValueError: When HTML from one of given URLs is invalid and
+            `skip_invalid` is False.
+        :return: Scraper objects in the same order as given URLs.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            objects = executor.map(
+                lambda url: cls._create_or_skip(url, skip_invalid, sub_pages),
+                urls)
+            return [obj for obj in objects if obj]
+
+    @classmethod
+    def iter_fetch(cls, urls: Iterable[str], max_workers: int = 8,
+                   skip_invalid: bool = False,
+                   sub_pages: bool = False) -> Iterator["Scraper"]:
+        """
+        Creates scraper objects from given URLs concurrently and yields them
+        as soon as they are ready, so the order differs from the order of
+        given URLs.
+
+        :param urls: (Relative) URLs of pages to create objects from.
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :param skip_invalid: Whether to leave out URLs with invalid HTML
+            instead of raising an error, defaults to False.
+        :param sub_pages: Whether to prefetch sub-pages of every object too,
+            defaults to False.
+        :raises ValueError: When HTML from one of given URLs is invalid and
+            `skip_invalid` is False.
+        :return: Iterator of scraper objects ready for parsing.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(cls._create_or_skip, url, skip_invalid,
+                                       sub_pages)
+                       for url in urls]
+            for future in as_completed(futures):
+                obj = future.result()
+                if obj:
+                    yield obj
+        finally:
+            # don't make remaining requests when iteration is stopped early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _http_session() -> requests.Session:
+        """
+        Gets HTTP session shared by all scraper objects, so connections to
+        the site are reused.
+
+        :return: Shared requests session.
+        """
+        global _SESSION  # pylint: disable=global-statement
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = requests.Session()
+            return _SESSION
+
+    @classmethod
+    def _create_or_skip(cls, url: str, skip_invalid: bool,
+                        sub_pages: bool = False) -> Optional["Scraper"]:
+        """
+        Creates scraper object from given URL.
+
+        :param url: (Relative) URL of page to create object from.
+        :param skip_invalid: Whether to return None instead of raising an
+            error when HTML is invalid.
+        :param sub_pages: Whether to prefetch sub-pages of the object,
+            defaults to False.
+        :raises ValueError: When HTML from given URL is invalid and
+            `skip_invalid` is False.
+        :return: Scraper object ready for parsing, None when HTML is invalid
+            and `skip_invalid` is True.
+        """
+        try:
+            scraper = cls(url)
+            if sub_pages:
+                scraper.prefetch_sub_pages()
+            return scraper
+        except ValueError:
+            if skip_invalid:
+                return None
+            raise
+
     def _make_url_with_params(self, endpoint: str, **params) -> str:
         """
         Constructs a complete URL from the endpoint and provided parameters.
@@ -110,11 +345,51 @@ class Scraper:
     def update_html(self) -> None:
         """
         Calls request to `self.url` and updates `self.html` to HTMLParser
-        object created from returned HTML.
+        object created from returned HTML. When `page_cache` is set and
+        contains the page, HTML is taken from the cache instead and valid
+        HTMLs obtained by request are stored to the cache.
         """
-        html_str = requests.get(self._url).text
-        # pylint: disable=missing-timeout
-        self._html = HTMLParser(html_str)
+        self._drop_snapshot()
+        self._html = self._fetch_html(self._url)
+        self._html_requested = True
+        self._reset_html_memos()
+
+    def sub_page_urls(self) -> Dict[str, str]:
+        """
+        Makes URLs of sub-pages some parsing methods parse from, so they can
+        be prefetched together with the page.
+
+        :return: Dict with sub-page names as keys and absolute URLs as values.
+        """
+        return {name: self._make_url_absolute(self._sub_page_url(name))
+                for name in self._sub_pages}
+
+    def prefetch_sub_pages(self) -> None:
+        """
+        Requests all sub-pages that aren't loaded yet. Once loaded, sub-pages
+        are kept by the object and parsing methods that need them are called
+        by `parse` method.
+
+        :raises ValueError: When HTML of one of the sub-pages is invalid.
+        """
+        for name in self._sub_pages:
+            if name not in self._sub_page_htmls:
+                self._load_sub_page(name)
+
+    def set_sub_page(self, name: str, html: Union[str, bytes]) -> None:
+        """
+        Sets HTML of a sub-page without making request, e.g. from an archive.
+
+        :param name: Name of the sub-page.
+        :param html: HTML of the sub-page, UTF-8 encoded when given as bytes.
+        :raises ValueError: When the name or given HTML is invalid.
+        """
+        if name not in self._sub_pages:
+            raise ValueError(f"Invalid sub-page name: '{name}'")
+        sub_page_html = self._parse_html(html)
+        if not self._html_valid(sub_page_html):
+            raise ValueError("Given HTML is invalid.")
+        self._sub_page_htmls[name] = sub_page_html
 
     def parse(
         self,
@@ -143,6 +418,201 @@ class Scraper:
                     parsed_data[method_name] = None
         return parsed_data
 
+    def materialize(self, *method_names: str) -> "Scraper":
+        """
+        Calls parsing methods, stores their results and releases HTML of the
+        page and its sub-pages, so the object takes only memory needed by
+        parsed data. Afterwards the parsing methods return stored results
+        (exceptions raised by them are raised again), table parsing methods
+        still accept fields and limit. `parse` returns only stored results.
+        Methods whose sub-page isn't loaded request it on their first direct
+        call, when the object's HTML was requested. Call `update_html` to
+        parse from HTML again.
+
+        Usage:
+
+        >>> from procyclingstats import Rider
+        >>> urls = ["rider/tadej-pogacar", "rider/jonas-vingegaard"]
+        >>> riders = [Rider(url).materialize("name", "height") for url in urls]
+        >>> riders[0].height()
+        1.76
+
+        Objects can also be used as context managers, which materialize all
+        parsing methods on exit:
+
+        >>> with Rider("rider/tadej-pogacar") as rider:
+        ...     image = rider.html.css_first("img")
+        >>> rider.name()
+        'Tadej  Pogačar'
+
+        :param method_names: Names of parsing methods to store, defaults to
+            all methods called by `parse`.
+        :raises ValueError: When one of the names isn't a parsing method.
+        :return: The object itself.
+        """
+        parsing_methods = dict(self._parsing_methods())
+        if method_names:
+            for method_name in method_names:
+                if method_name not in parsing_methods:
+                    raise ValueError(
+                        f"Invalid parsing method name: '{method_name}'")
+            parsing_methods = {method_name: parsing_methods[method_name]
+                               for method_name in method_names}
+        snapshot = {}
+        for method_name, method in parsing_methods.items():
+            if self._sub_page_requestable(method_name):
+                snapshot[method_name] = _UNLOADED_SUB_PAGE
+            else:
+                snapshot[method_name] = self._stored_result(method)
+        self._drop_snapshot()
+        self._snapshot = snapshot
+        for method_name in snapshot:
+            setattr(self, method_name,
+                    types.MethodType(self._snapshot_method(method_name), self))
+        self._html = None
+        self._sub_page_htmls = {}
+        self._reset_html_memos()
+        return self
+
+    def __enter__(self) -> "Scraper":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 *_: Any) -> None:
+        if exc_type is None:
+            self.materialize()
+
+    def _fetch_html(self, url: str) -> HTMLParser:
+        """
+        Makes request to given URL. When `page_cache` is set and contains the
+        page, HTML is taken from the cache instead and valid HTMLs obtained by
+        request are stored to the cache. HTML is kept as UTF-8 encoded bytes
+        all the way to the parser.
+
+        :param url: Absolute URL of the page.
+        :return: HTML of the page.
+        """
+        if self.page_cache is not None:
+            html_bytes = self.page_cache.get_bytes(url)
+            if html_bytes is not None:
+                return self._parse_html(html_bytes)
+        response = self._http_session().get(url, timeout=self.REQUEST_TIMEOUT)
+        html_bytes = _response_html(response)
+        html = self._parse_html(html_bytes)
+        if self.page_cache is not None and self._html_valid(html):
+            self.page_cache.put(url, html_bytes)
+        return html
+
+    def _parse_html(self, html: Union[str, bytes]) -> HTMLParser:
+        """
+        Builds HTML tree from page HTML, only from its content region when
+        `slice_html` is True.
+
+        :param html: HTML of the page, UTF-8 encoded when given as bytes.
+        :return: HTML tree of the page.
+        """
+        if self.slice_html:
+            html = _content_region(html)
+        return HTMLParser(html)
+
+    def _sub_page(self, name: str) -> HTMLParser:
+        """
+        Gets HTML of a sub-page, which is requested only the first time and
+        only when the object's HTML was requested too.
+
+        :param name: Name of the sub-page.
+        :raises ExpectedParsingError: When the sub-page isn't loaded and the
+            object is created from HTML.
+        :raises ValueError: When HTML of the sub-page is invalid.
+        :return: HTML of the sub-page.
+        """
+        if name not in self._sub_page_htmls:
+            if not self._html_requested:
+                raise ExpectedParsingError(f"Sub-page '{name}' isn't loaded.")
+            self._load_sub_page(name)
+        return self._sub_page_htmls[name]
+
+    def _load_sub_page(self, name: str) -> None:
+        """
+        Requests HTML of a sub-page and keeps it.
+
+        :param name: Name of the sub-page.
+        :raises ValueError: When HTML of the sub-page is invalid.
+        """
+        url = self.sub_page_urls()[name]
+        if url == self._url:
+            html = self.html
+        else:
+            html = self._fetch_html(url)
+            if not self._html_valid(html):
+                raise ValueError(f"HTML from given URL is invalid: '{url}'")
+        self._sub_page_htmls[name] = html
+
+    def _sub_page_requestable(self, method_name: str) -> bool:
+        """
+        Checks whether parsing method parses from a sub-page that isn't
+        loaded, but is requested on the method's direct call.
+
+        :param method_name: Name of the parsing method.
+        :return: True when the sub-page is requested on the method's call.
+        """
+        sub_page = self._sub_page_methods.get(method_name)
+        return (sub_page is not None and self._html_requested and
+                sub_page not in self._sub_page_htmls)
+
+    def _sub_page_url(self, name: str) -> str:
+        """
+        Makes relative URL of a sub-page. Can be overridden by subclasses
+        which sub-pages aren't relative to the object's URL.
+
+        :param name: Name of the sub-page.
+        :return: Relative URL of the sub-page.
+        """
+        return f"{self.relative_url().rstrip('/')}/{self._sub_pages[name]}"
+
+    def _info_list(self) -> Dict[str, Node]:
+        """
+        Indexes key/value info list of the page (``ul.list.keyvalueList`` or
+        legacy ``ul.infolist``, both with label and value divs in every item).
+        The list is walked only once for every HTML and the index is reused by
+        all parsing methods.
+
+        :return: Dict with labels (without trailing colons) as keys and value
+            elements as values in order of the list. Empty when the page has
+            no info list.
+        """
+        if self._info_list_index is None:
+            items = self.html.css("ul.list.keyvalueList > li")
+            self._info_list_legacy = not items
+            if not items:
+                items = self.html.css("ul.infolist > li")
+            index: Dict[str, Node] = {}
+            for item in items:
+                divs = [child for child in item.iter() if child.tag == "div"]
+                if len(divs) >= 2:
+                    label = divs[0].text().strip().rstrip(":")
+                    index.setdefault(label, divs[1])
+            self._info_list_index = index
+        return self._info_list_index
+
+    def _info_value(self, label: str,
+                    position: Optional[int] = None) -> Optional[Node]:
+        """
+        Finds value element of given label in info list of the page.
+
+        :param label: Label of the value without trailing colon.
+        :param position: Position of the value in legacy ``ul.infolist`` used
+            when the label isn't found, defaults to None.
+        :return: Value element, None when unavailable.
+        """
+        info_list = self._info_list()
+        value = info_list.get(label)
+        if value is None and position is not None and self._info_list_legacy:
+            values = list(info_list.values())
+            if position < len(values):
+                value = values[position]
+        return value
+
     def _decompose_url(self) -> List[str]:
         """
         Splits relative URL to list of strings.
@@ -155,10 +625,21 @@ class Scraper:
     def _parsing_methods(self) -> List[Tuple[str, Callable]]:
         """
         Gets all parsing methods from a class. That are all public methods
-        except of methods listed in `_public_nonparsing_methods`.
+        except of methods listed in `_public_nonparsing_methods`. Methods
+        whose sub-page isn't loaded are replaced by functions raising
+        `ExpectedParsingError`. Only methods with stored results are
+        returned when the object is materialized.
 
         :return: List of tuples parsing methods names and parsing methods.
         """
+        if self._snapshot is not None:
+            return [
+                (method_name,
+                 self._unloaded_sub_page_method(
+                     self._sub_page_methods[method_name])
+                 if result is _UNLOADED_SUB_PAGE
+                 else getattr(self, method_name))
+                for method_name, result in self._snapshot.items()]
         methods = inspect.getmembers(self, predicate=inspect.ismethod)
         parsing_methods = []
         for method_name, method in methods:
@@ -166,9 +647,102 @@ class Scraper:
                 method_name[0] != "_"
                 and method_name not in self._public_nonparsing_methods
             ):
+                sub_page = self._sub_page_methods.get(method_name)
+                if (sub_page is not None and
+                        sub_page not in self._sub_page_htmls):
+                    method = self._unloaded_sub_page_method(sub_page)
                 parsing_methods.append((method_name, method))
         return parsing_methods
 
+    @staticmethod
+    def _unloaded_sub_page_method(sub_page: str) -> Callable:
+        """
+        Makes replacement of a parsing method whose sub-page isn't loaded, so
+        the sub-page isn't requested by `parse` or `materialize`.
+
+        :param sub_page: Name of the sub-page.
+        :return: Function that raises `ExpectedParsingError`.
+        """
+        def method() -> Any:
+            raise ExpectedParsingError(f"Sub-page '{sub_page}' isn't loaded.")
+        return method
+
+    @staticmethod
+    def _snapshot_method(method_name: str) -> Callable:
+        """
+        Makes method that returns stored result of a parsing method. Result
+        of a method whose sub-page wasn't loaded is parsed and stored on the
+        first call.
+
+        :param method_name: Name of the parsing method.
+        :return: Function to be bound to the object as the parsing method.
+        """
+        def method(self: "Scraper", *args: str,
+                   limit: Optional[int] = None) -> Any:
+            # pylint: disable=protected-access
+            result = self._snapshot[method_name]  # type: ignore
+            if result is _UNLOADED_SUB_PAGE:
+                parsing_method = getattr(type(self), method_name)
+                result = self._stored_result(lambda: parsing_method(self))
+                self._snapshot[method_name] = result  # type: ignore
+                self._sub_page_htmls = {}
+            if isinstance(result, Exception):
+                # drop traceback of previous raise, so tracebacks don't pile up
+                raise result.with_traceback(None)
+            if not isinstance(result, list):
+                if args or limit is not None:
+                    raise TypeError(
+                        f"{method_name}() takes no arguments")
+                return dict(result) if isinstance(result, dict) else result
+            if limit is not None:
+                result = result[:limit]
+            if not args:
+                return [dict(row) if isinstance(row, dict) else row
+                        for row in result]
+            for row in result:
+                for arg in args:
+                    if arg not in row:
+                        raise ValueError("Invalid field argument")
+            return [{arg: row[arg] for arg in args} for row in result]
+        method.__name__ = method_name
+        return method
+
+    @staticmethod
+    def _stored_result(method: Callable[[], Any]) -> Any:
+        """
+        Calls parsing method whose result is stored by `materialize`.
+
+        :param method: Parsing method without arguments.
+        :return: Result of the method or exception raised by it.
+        """
+        try:
+            return method()
+        except Exception as exception:  # pylint: disable=broad-except
+            # traceback and chained exceptions reference frames with the
+            # HTML, which wouldn't be released otherwise
+            exception.__context__ = None
+            exception.__cause__ = None
+            return exception.with_traceback(None)
+
+    def _drop_snapshot(self) -> None:
+        """
+        Removes stored results of parsing methods, so parsing methods parse
+        from HTML again.
+        """
+        if self._snapshot is None:
+            return
+        for method_name in self._snapshot:
+            self.__dict__.pop(method_name, None)
+        self._snapshot = None
+
+    def _reset_html_memos(self) -> None:
+        """
+        Resets attributes listed in `_html_memos`, so values memoized from
+        the previous HTML aren't used with the new one.
+        """
+        for attribute in self._html_memos:
+            setattr(self, attribute, None)
+
     def _make_url_absolute(self, url: str) -> str:
         """
         Makes absolute URL from given url (adds `self.base_url` to URL if
@@ -177,7 +751,7 @@ class Scraper:
         :param url: URL to format.
         :return: Absolute URL.
         """
-        if "https" not in url:
+        if not url.startswith(("http://", "https://")):
             if url[0] == "/":
                 url = self.BASE_URL + url[1:]
             else:
@@ -186,23 +760,41 @@ class Scraper:
 
     def _set_up_html(self):
         """
-        Empty method that should be overridden by subclasses if it's needed to
-        modify HTML before parsing.
+        Detects layout of the page. Should be extended by subclasses if it's
+        needed to modify HTML before parsing.
+        """
+        self._layout()
+
+    def _layout(self) -> Literal["new", "legacy"]:
+        """
+        Detects layout of the page, which is done only once for every HTML.
+        Legacy pages (most of the historical ones) have title in
+        ``.page-title > .main``, parsing methods use it to choose selectors
+        without probing the other layout.
+
+        :return: ``legacy`` for legacy pages, otherwise ``new``.
         """
+        if self._page_layout is None:
+            title_html = self.html.css_first(".page-title > .main > h1")
+            self._page_layout = "new" if title_html is None else "legacy"
+        return self._page_layout
 
-    def _html_valid(self) -> bool:
+    def _html_valid(self, html: Optional[HTMLParser] = None) -> bool:
         """
         Checks whether given HTML is valid based on some known invalid formats
         of invalid HTMLs.
 
+        :param html: HTML to check, defaults to None (`self.html` is checked).
         :return: True if given HTML is valid, otherwise False.
         """
         try:
+            if html is None:
+                html = self.html
             # Check for "Page not found" in various possible title locations
             page_title_elem = (
-                self.html.css_first(".page-title > .main > h1") or
-                self.html.css_first(".content h1") or
-                self.html.css_first("h1")
+                html.css_first(".page-title > .main > h1") or
+                html.css_first(".content h1") or
+                html.css_first("h1")
             )
             if page_title_elem:
                 page_title = page_title_elem.text()
@@ -210,7 +802,7 @@ class Scraper:
                 assert page_title != "Start"
 
             # Check for technical difficulties message
-            page_content_elem = self.html.css_first("div.page-content > div")
+            page_content_elem = html.css_first("div.page-content > div")
             if page_content_elem:
                 page_title2 = page_content_elem.text()
                 assert page_title2 != (
@@ -219,7 +811,7 @@ class Scraper:
                 )
 
             # Additional check for common error indicators in the page text
-            html_text = self.html.text()
+            html_text = html.text()
             assert "Page not found" not in html_text
             assert "temporarily unavailable" not in html_text
             
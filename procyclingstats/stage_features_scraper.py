@@ -1,5 +1,9 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
 import requests
-from typing import Any, Dict, List
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -44,33 +48,18 @@ class StageFeatures(Scraper):
     }
     """
 
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "download_profile_image",
+        "download_profile_images",
+    )
+    """Public methods that aren't called by `parse` method."""
+
     def features(self) -> Dict[str, Any]:
         """
         Parses stage's features from an unordered list in the HTML.
         """
         features = {}
-        # Try new structure first
-        list_items = self.html.css("ul.list.keyvalueList > li")
-        
-        # Fallback to old structure if new one not found
-        if not list_items:
-            list_items = self.html.css("ul.infolist > li")
-
-        for item in list_items:
-            # New structure: <div class="title"> and <div class="value">
-            title_div = item.css_first("div.title")
-            value_div = item.css_first("div.value")
-            
-            if title_div and value_div:
-                key = title_div.text().strip().strip(":")
-            else:
-                # Fallback to old structure: first and second div
-                divs = item.css("div")
-                if len(divs) < 2:
-                    continue
-                key = divs[0].text().strip().strip(":")
-                value_div = divs[1]
-            
+        for key, value_div in self._info_list().items():
             # Special handling for Parcours type - extract icon class
             if key == "Parcours type":
                 icon = value_div.css_first("span.icon.profile")
@@ -103,30 +92,35 @@ class StageFeatures(Scraper):
     def _get_profile_from_race_page(self) -> str:
         """
         Fallback method to get profile icon from the main race page.
-        Extracts race URL and stage number from current URL to fetch from Race scraper.
+        Extracts race URL and stage number from current URL and gets the race
+        stages from `Race.cached_stages` memo, so the race page is fetched
+        only once for all stages of the race.
         """
         try:
             from .race_scraper import Race
-            
+
             # Parse the current URL to extract race info
             # Expected format: race/tour-de-france/2025/stage-1
-            url_parts = self.relative_url().split('/')
+            url_parts = self._decompose_url()
             if len(url_parts) >= 4 and url_parts[3].startswith('stage-'):
                 # Extract stage number from "stage-1", "stage-2", etc.
                 stage_part = url_parts[3]
                 stage_number = int(stage_part.split('-')[1])
-                
+
                 # Build race URL: race/tour-de-france/2025
                 race_url = '/'.join(url_parts[:3])
-                
-                # Get stages from Race page
-                race = Race(race_url)
-                stages = race.stages('profile_icon', 'stage_name')
-                
+                stages = Race.cached_stages(race_url)
+
+                # Prefer matching by URL, prologues shift stage numbers
+                stage_url = '/'.join(url_parts[:4])
+                for stage in stages:
+                    if stage.get('stage_url') == stage_url:
+                        return stage.get('profile_icon') or ''
+
                 # Find the matching stage (stage numbers are 1-indexed)
                 if 1 <= stage_number <= len(stages):
                     return stages[stage_number - 1].get('profile_icon', '')
-            
+
             return ""
         except Exception:
             # If anything goes wrong, return empty string
@@ -140,25 +134,116 @@ class StageFeatures(Scraper):
         """
         return {"features": self.features()}
 
-    def download_profile_image(self, output_path: str) -> bool:
+    def download_profile_image(self, output_path: str,
+                               chunk_size: int = 64 * 1024,
+                               overwrite: bool = False) -> bool:
         """
-        Downloads the stage profile image.
+        Downloads the stage profile image. Image is streamed to a temporary
+        file in chunks, which is renamed to `output_path` when complete, so
+        partially downloaded images never appear at `output_path`.
 
         :param output_path: The path where the image will be saved.
-        :return: True if the download is successful, False otherwise.
+        :param chunk_size: Size of chunks written to the file in bytes,
+            defaults to 64 KiB.
+        :param overwrite: Whether to download the image even when file with
+            the same size as the remote image is already present at
+            `output_path`. Defaults to False.
+        :return: True if the download is successful or the image is already
+            present, False otherwise.
+        """
+        img_url = self._profile_image_src()
+        if not img_url:
+            return False
+        full_img_url = f"{self.BASE_URL}{img_url}"  # Adjust base URL if needed
+        session = self._http_session()
+
+        if not overwrite and os.path.exists(output_path):
+            head_response = session.head(full_img_url,
+                                         timeout=self.REQUEST_TIMEOUT)
+            # size of an error response says nothing about the image
+            if head_response.ok:
+                remote_size = head_response.headers.get("Content-Length")
+                local_size = os.path.getsize(output_path)
+                # without known remote size any non-empty file is complete,
+                # because files are renamed only after successful download
+                if (remote_size is None and local_size) or (
+                        remote_size is not None and
+                        int(remote_size) == local_size):
+                    return True
+
+        tmp_path = f"{output_path}.{threading.get_ident()}.part"
+        with session.get(full_img_url, stream=True,
+                         timeout=self.REQUEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                return False
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                os.replace(tmp_path, output_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        return True
+
+    @staticmethod
+    def download_profile_images(stage_urls: Iterable[str], output_dir: str,
+                                max_workers: int = 8,
+                                overwrite: bool = False) -> Dict[str, bool]:
+        """
+        Downloads profile images of given stages concurrently. Images are
+        saved to `output_dir` with filenames made from stage URLs and image
+        extensions, e.g. ``race_tour-de-france_2022_stage-1.jpg``. Images
+        already present are skipped (see ``download_profile_image``). Stages
+        whose pages or images can't be downloaded are mapped to False.
+
+        Usage:
+
+        >>> stages = Race("race/tour-de-france/2022").stages("stage_url")
+        >>> StageFeatures.download_profile_images(
+        ...     [stage["stage_url"] for stage in stages], "profiles")
+
+        :param stage_urls: (Relative) URLs of stages.
+        :param output_dir: Directory to save images to, created if needed.
+        :param max_workers: Maximal count of concurrent downloads, defaults to
+            8.
+        :param overwrite: Whether to download images that are already
+            present, defaults to False.
+        :return: Dict mapping stage URLs to whether the image is available in
+            `output_dir`.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        def download(stage_url: str) -> bool:
+            try:
+                stage_features = StageFeatures(stage_url)
+            except (ValueError, requests.RequestException):
+                return False
+            img_url = stage_features._profile_image_src()
+            if not img_url:
+                return False
+            extension = os.path.splitext(img_url.split("?")[0])[1] or ".jpg"
+            filename = "_".join(stage_features._decompose_url()) + extension
+            output_path = os.path.join(output_dir, filename)
+            try:
+                return stage_features.download_profile_image(
+                    output_path, overwrite=overwrite)
+            except requests.RequestException:
+                return False
+
+        stage_urls = list(stage_urls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(stage_urls, executor.map(download, stage_urls)))
+
+    def _profile_image_src(self) -> Optional[str]:
+        """
+        Finds relative URL of the stage profile image.
+
+        :return: Image URL, None when the image isn't available.
         """
         profile_img_html = self.html.css_first(
             "div.mt10 > span.table-cont > ul.list > li > div > a > img"
         )
         if not profile_img_html:
-            return False
-
-        img_url = profile_img_html.attributes["src"]
-        full_img_url = f"{self.BASE_URL}{img_url}"  # Adjust base URL if needed
-
-        response = requests.get(full_img_url)
-        if response.status_code == 200:
-            with open(output_path, "wb") as f:
-                f.write(response.content)
-            return True
-        return False
+            return None
+        return profile_img_html.attributes.get("src")
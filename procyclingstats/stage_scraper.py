@@ -54,11 +54,46 @@ class Stage(Scraper):
 
     _tables_path = "table.results"
 
+    _results_fields = (
+        "rider_name",
+        "rider_url",
+        "rider_number",
+        "team_name",
+        "team_url",
+        "rank",
+        "status",
+        "age",
+        "nationality",
+        "time",
+        "bonus",
+        "pcs_points",
+        "uci_points",
+    )
+    """Fields available in stage results table."""
+
+    _gc_fields = (
+        "rider_name",
+        "rider_url",
+        "rider_number",
+        "team_name",
+        "team_url",
+        "rank",
+        "prev_rank",
+        "age",
+        "nationality",
+        "time",
+        "bonus",
+        "pcs_points",
+        "uci_points",
+    )
+    """Fields available in stage GC table."""
+
     def _set_up_html(self) -> None:
         """
         Overrides Scraper method. Modifies HTML if stage is TTT by adding team
         ranks to riders.
         """
+        super()._set_up_html()
         # add team ranks to every rider's first td element, so it's possible
         # to map teams to riders based on their rank
         categories = self.html.css(self._tables_path)
@@ -133,16 +168,15 @@ class Stage(Scraper):
 
         :return: Stage type, e.g. ``ITT``.
         """
-        # Try new structure first - look in page title
-        page_title = self.html.css_first(".page-title")
-        if page_title:
-            text = page_title.text()
+        if self._layout() == "new":
+            page_title = self.html.css_first(".page-title")
+            text = page_title.text() if page_title else ""
             if "ITT" in text:
                 return "ITT"
             if "TTT" in text:
                 return "TTT"
+            return "RR"
 
-        # Fallback to original structure
         stage_name_html = self.html.css_first(".sub > .blue")
         stage_name2_html = self.html.css_first("div.main > h1")
         if stage_name_html and stage_name2_html:
@@ -353,7 +387,9 @@ class Stage(Scraper):
         table_parser.parse(fields)
         return table_parser.table
 
-    def results(self, *args: str) -> List[Dict[str, Any]]:
+    def results(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parses main results table from HTML. If results table is TTT one day
         race, fields `age` and `nationality` are set to None if are requested,
@@ -376,24 +412,12 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rider_name",
-            "rider_url",
-            "rider_number",
-            "team_name",
-            "team_url",
-            "rank",
-            "status",
-            "age",
-            "nationality",
-            "time",
-            "bonus",
-            "pcs_points",
-            "uci_points",
-        )
+        available_fields = self._results_fields
         fields = parse_table_fields_args(args, available_fields)
         # remove other result tables from html
         # because of one day races self._table_index isn't used here
@@ -422,6 +446,8 @@ class Stage(Scraper):
         # parse TTT table
         if self.stage_type() == "TTT":
             table = self._ttt_results(results_table_html, fields)
+            if limit is not None:
+                table = table[:limit]
             # set status of all riders to DF because status information isn't
             # contained in the HTML of TTT results
             if "status" in fields:
@@ -456,13 +482,15 @@ class Stage(Scraper):
                     row.pop("rider_url")
         else:
             # remove rows that aren't results
-            self._filter_table_rows(results_table_html)
+            self._filter_table_rows(results_table_html, limit)
             table_parser = TableParser(results_table_html)
-            table_parser.parse(fields)
+            table_parser.parse(fields, limit)
             table = table_parser.table
         return table
 
-    def gc(self, *args: str) -> List[Dict[str, Any]]:
+    def gc(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         # pylint: disable=invalid-name
         """
         Parses GC results table from HTML. When GC is unavailable, empty list
@@ -485,34 +513,24 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "rider_name",
-            "rider_url",
-            "rider_number",
-            "team_name",
-            "team_url",
-            "rank",
-            "prev_rank",
-            "age",
-            "nationality",
-            "time",
-            "bonus",
-            "pcs_points",
-            "uci_points",
-        )
+        available_fields = self._gc_fields
         fields = parse_table_fields_args(args, available_fields)
         # remove other result tables from html
-        gc_table_html = self._table_html("gc")
+        gc_table_html = self._table_html("gc", limit)
         if not gc_table_html:
             return []
         table_parser = TableParser(gc_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
 
-    def points(self, *args: str) -> List[Dict[str, Any]]:
+    def points(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parses points classification results table from HTML. When points
         classif. is unavailable empty list is returned.
@@ -533,6 +551,8 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -552,14 +572,16 @@ class Stage(Scraper):
         )
         fields = parse_table_fields_args(args, available_fields)
         # remove other result tables from html
-        points_table_html = self._table_html("points")
+        points_table_html = self._table_html("points", limit)
         if not points_table_html:
             return []
         table_parser = TableParser(points_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
 
-    def kom(self, *args: str) -> List[Dict[str, Any]]:
+    def kom(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parses KOM classification results table from HTML. When KOM classif. is
         unavailable empty list is returned.
@@ -580,6 +602,8 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -599,14 +623,16 @@ class Stage(Scraper):
         )
         fields = parse_table_fields_args(args, available_fields)
         # remove other result tables from html
-        kom_table_html = self._table_html("kom")
+        kom_table_html = self._table_html("kom", limit)
         if not kom_table_html:
             return []
         table_parser = TableParser(kom_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
 
-    def youth(self, *args: str) -> List[Dict[str, Any]]:
+    def youth(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parses youth classification results table from HTML. When youth classif
         is unavailable empty list is returned.
@@ -627,6 +653,8 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -645,14 +673,16 @@ class Stage(Scraper):
             "uci_points",
         )
         fields = parse_table_fields_args(args, available_fields)
-        youth_table_html = self._table_html("youth")
+        youth_table_html = self._table_html("youth", limit)
         if not youth_table_html:
             return []
         table_parser = TableParser(youth_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
 
-    def teams(self, *args: str) -> List[Dict[str, Any]]:
+    def teams(
+        self, *args: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parses teams classification results table from HTML. When teams
         classif. is unavailable empty list is returned.
@@ -667,6 +697,8 @@ class Stage(Scraper):
             - time: Team's total GC time after the stage.
             - nationality: Team's nationality as 2 chars long country code.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -679,11 +711,11 @@ class Stage(Scraper):
             "nationality",
         )
         fields = parse_table_fields_args(args, available_fields)
-        teams_table_html = self._table_html("teams")
+        teams_table_html = self._table_html("teams", limit)
         if not teams_table_html:
             return []
         table_parser = TableParser(teams_table_html)
-        table_parser.parse(fields)
+        table_parser.parse(fields, limit)
         return table_parser.table
 
     def _stage_info_by_label(self, label: str) -> str:
@@ -694,38 +726,33 @@ class Stage(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        # Try new structure first: ul.list.keyvalueList
-        for row in self.html.css("ul.list.keyvalueList > li"):
-            title_elem = row.css_first(".title")
-            value_elem = row.css_first(".value")
-            if title_elem and value_elem:
-                title_text = title_elem.text().strip().rstrip(":")
-                if label == title_text:
-                    return value_elem.text().strip()
-
-        # Fallback to original structure
-        for row in self.html.css("ul.infolist > li"):
-            row_text = row.text(separator="\n").split("\n")
-            row_text = [x for x in row_text if x != " "]
-            if label in row_text[0]:
-                if len(row_text) > 1:
-                    return row_text[1]
-                else:
-                    return ""
-        return ""
-
-    def _filter_table_rows(self, html_table: Node) -> None:
+        value_html = self._info_value(label)
+        if value_html is None:
+            return ""
+        # values of legacy infolist are kept as they are
+        if self._info_list_legacy:
+            return value_html.text()
+        return value_html.text().strip()
+
+    def _filter_table_rows(
+        self, html_table: Node, limit: Optional[int] = None
+    ) -> None:
         """
         Remove non-data rows from table (empty rows, colspan rows, etc.).
 
         :param html_table: HTML table to filter.
+        :param limit: Count of data rows after which filtering stops, defaults
+            to None (the whole table is filtered).
         """
         # Check if this is a teams table by looking at headers
         headers = html_table.css("thead th")
         header_texts = [h.text().strip() for h in headers] if headers else []
         is_teams_table = "Team" in header_texts and "Class" in header_texts
 
+        kept = 0
         for row in html_table.css("tbody > tr"):
+            if limit is not None and kept >= limit:
+                break
             columns = row.css("td")
             # Remove empty rows or rows with colspan (like notes/comments)
             if (len(columns) <= 2 and columns[0].text() == "") or (
@@ -737,19 +764,29 @@ class Stage(Scraper):
                 rider_name_col = row.css_first(".ridername")
                 if rider_name_col and rider_name_col.text().strip() == "":
                     row.remove()
+                else:
+                    kept += 1
             # For teams tables, remove rows that don't have nationality flags
             elif is_teams_table:
                 flag_in_row = row.css(".flag")
                 if not flag_in_row:
                     row.remove()
+                else:
+                    kept += 1
+            else:
+                kept += 1
 
     def _table_html(
-        self, table: Literal["stage", "gc", "points", "kom", "youth", "teams"]
+        self,
+        table: Literal["stage", "gc", "points", "kom", "youth", "teams"],
+        limit: Optional[int] = None,
     ) -> Optional[Node]:
         """
         Get HTML of a results table based on `table` param.
 
         :param table: Keyword of wanted table.
+        :param limit: Count of data rows after which the table isn't filtered,
+            defaults to None (the whole table is filtered).
         :return: HTML of wanted HTML table, None when not found.
         """
         # Try new structure first - identify tables by their characteristics
@@ -764,7 +801,7 @@ class Stage(Scraper):
                 if table == "stage":
                     # Stage results: has Time column and many riders (usually 150+)
                     if "Time" in header_texts and len(rows) > 100:
-                        self._filter_table_rows(html_table)
+                        self._filter_table_rows(html_table, limit)
                         return html_table
                 elif table == "gc":
                     # GC results: has "Time won/lost" or similar time-related column and many riders
@@ -773,19 +810,19 @@ class Stage(Scraper):
                     ) and len(rows) > 100:
                         # Make sure it's not the stage results table by checking for time won/lost
                         if "Time won/lost" in header_texts:
-                            self._filter_table_rows(html_table)
+                            self._filter_table_rows(html_table, limit)
                             return html_table
                 elif table == "points":
                     # Points classification: has "Pnt" column and fewer riders (usually first classification table)
                     if "Pnt" in header_texts and len(rows) < 100:
-                        self._filter_table_rows(html_table)
+                        self._filter_table_rows(html_table, limit)
                         return html_table
                 elif table == "kom":
                     # KOM classification: has "Pnt" column, similar to points but might be different table
                     if "Pnt" in header_texts and len(rows) < 100:
                         # Skip if this is the same table we'd return for points
                         # This is a simplification - in practice KOM might be a separate table or not exist
-                        self._filter_table_rows(html_table)
+                        self._filter_table_rows(html_table, limit)
                         return html_table
                 elif table == "youth":
                     # Youth classification: has "Time" column and moderate number of riders (20-50 typically)
@@ -794,7 +831,7 @@ class Stage(Scraper):
                         and "Time won/lost" in header_texts
                         and 20 <= len(rows) <= 100
                     ):
-                        self._filter_table_rows(html_table)
+                        self._filter_table_rows(html_table, limit)
                         return html_table
                 elif table == "teams":
                     # Teams table: has "Team" as a main column (not just in rider info) and "Class" column
@@ -803,10 +840,12 @@ class Stage(Scraper):
                         and "Class" in header_texts
                         and len(rows) < 50
                     ):
-                        self._filter_table_rows(html_table)
+                        self._filter_table_rows(html_table, limit)
                         return html_table
 
-        # Fallback to original method
+        if self._layout() == "new":
+            return None
+        # tabs of legacy pages
         categories = self.html.css(".result-cont")
         for i, element in enumerate(self.html.css("ul.restabs > li > a")):
             if table in element.text().lower():
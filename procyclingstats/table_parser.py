@@ -1,17 +1,26 @@
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (Any, Callable, Dict, Iterator, List, Literal, Optional,
+                    Tuple, Union)
 import re
+import sys
 
 
-from selectolax.parser import Node
+from selectolax.parser import HTMLParser, Node
 
 from .errors import ExpectedParsingError, UnexpectedParsingError
 from .utils import add_times, format_time, safe_int_parse
 
 
+_row_class: ContextVar[Optional[type]] = ContextVar("_row_class",
+                                                    default=None)
+"""Row class set by `TableParser.building_rows`."""
+
+
 class TableParser:
     """
     Parser for HTML tables. Parsed content is stored in `self.table`, which is
-    represented as list of dicts.
+    represented as list of dicts (or row records, see `building_rows`).
 
     :param html_table: HTML table to be parsed from.
     """
@@ -20,9 +29,17 @@ class TableParser:
     """Finds out what is the table row tag."""
     row_column_tag_dict: Dict[str, str] = {"tr": "td", "li": "div"}
     """Finds out what is the table row column tag."""
+    intern_strings: bool = False
+    """Whether to intern values of `interned_fields`, so equal values from
+    all parsed tables share one string object. Saves memory when many tables
+    are kept loaded at once."""
+    interned_fields: Tuple[str, ...] = (
+        "rider_url", "team_url", "team_name", "nationality")
+    """Fields which values are interned when `intern_strings` is True."""
 
     def __init__(self, html_table: Node) -> None:
         self.table = []
+        self.row_class = _row_class.get()
         table_body = html_table.css_first("tbody")
         if table_body:
             self.html_table = table_body
@@ -35,6 +52,9 @@ class TableParser:
         self.row_column_tag = self.row_column_tag_dict[self.table_row_tag]
 
         self.a_elements = self.html_table.css("a")
+        self._anchors: Optional[Dict[str, List[Tuple[int, Node]]]] = None
+        self._stage_link_elements: Optional[
+            List[Tuple[Optional[str], Optional[Node]]]] = None
         self.table_length = len(self.html_table.css(self.table_row_tag))
         self.row_length = len(
             self.html_table.css(
@@ -42,13 +62,36 @@ class TableParser:
             )
         )
 
-    def parse(self, fields: Union[List[str], Tuple[str, ...]]) -> None:
+    @staticmethod
+    @contextmanager
+    def building_rows(row_class: type) -> Iterator[None]:
+        """
+        Makes table parsers created in the context build rows of given class
+        instead of dicts, so tables don't have to be converted afterwards.
+        The class has to support item access by field names and
+        ``from_columns`` class method, e.g. classes made by
+        ``records.row_class``. Used only for parsing methods whose rows
+        aren't joined with other tables.
+
+        :param row_class: Class of rows.
+        """
+        token = _row_class.set(row_class)
+        try:
+            yield
+        finally:
+            _row_class.reset(token)
+
+    def parse(self, fields: Union[List[str], Tuple[str, ...]],
+              limit: Optional[int] = None) -> None:
         """
         Parses HTML table to `self.table` (list of dicts) by calling given
         table parsing methods. Every parsed table row is dictionary with
         `fields` keys.
 
         :param fields: Table parsing methods of this class.
+        :param limit: Maximal count of rows to parse, defaults to None (all
+        rows are parsed). Other rows are dropped from the parser, so
+        `parse_extra_column` returns values only of parsed rows as well.
         :raises UnexpectedParsingError: When parsed field values aren't the
         same size as table length.
 
@@ -85,10 +128,9 @@ class TableParser:
             - distance
             - date
         """
-        raw_table = []
-        for _ in range(self.table_length):
-            raw_table.append({})
-
+        if limit is not None:
+            self._limit_rows(limit)
+        columns = {}
         for field in fields:
             if field != "class":
                 parsed_field_list = getattr(self, field)()
@@ -100,13 +142,19 @@ class TableParser:
             if len(parsed_field_list) != self.table_length:
                 message = f"Field '{field}' wasn't parsed correctly"
                 raise UnexpectedParsingError(message)
+            columns[field] = self._interned(field, parsed_field_list)
 
-            for row, parsed_value in zip(raw_table, parsed_field_list):
-                row[field] = parsed_value
-
-        # remove unwanted rows
-        for row in raw_table:
-            self.table.append(row)
+        if self.row_class is not None:
+            self.table.extend(
+                self.row_class.from_columns(columns, self.table_length))
+        else:
+            raw_table = []
+            for _ in range(self.table_length):
+                raw_table.append({})
+            for field, parsed_field_list in columns.items():
+                for row, parsed_value in zip(raw_table, parsed_field_list):
+                    row[field] = parsed_value
+            self.table.extend(raw_table)
 
         if "time" in fields and self.table:
             self._make_times_absolute()
@@ -123,12 +171,14 @@ class TableParser:
             raise ValueError(
                 "Given values has to be the same length as table rows count"
             )
+        values = self._interned(field_name, values)
         if self.table:
             for row, value in zip(self.table, values):
                 row[field_name] = value
         else:
+            row_class = self.row_class or dict
             for value in values:
-                self.table.append({field_name: value})
+                self.table.append(row_class(**{field_name: value}))
 
     def parse_extra_column(
         self,
@@ -172,117 +222,41 @@ class TableParser:
         return values
 
     def rider_url(self) -> List[str]:
-        rider_urls = self._filter_a_elements("rider", True)
-        # Handle mismatch between table rows and rider elements
-        if len(rider_urls) != self.table_length:
-            # Pad with empty strings if we have fewer rider URLs than table rows
-            while len(rider_urls) < self.table_length:
-                rider_urls.append("")
-            # Truncate if we have more rider URLs than table rows
-            rider_urls = rider_urls[:self.table_length]
-        return rider_urls
+        return self._row_a_elements("rider", True)
 
     def rider_name(self) -> List[str]:
-        rider_names = self._filter_a_elements("rider", False)
-        # Handle mismatch between table rows and rider elements
-        if len(rider_names) != self.table_length:
-            # Pad with empty strings if we have fewer rider names than table rows
-            while len(rider_names) < self.table_length:
-                rider_names.append("")
-            # Truncate if we have more rider names than table rows
-            rider_names = rider_names[:self.table_length]
-        return rider_names
+        return self._row_a_elements("rider", False)
 
     def team_url(self) -> List[str]:
         try:
             return self.parse_extra_column("Team", str, get_href=True)
         except Exception:
-            team_urls = self._filter_a_elements(
+            return self._row_a_elements(
                 "team", True, lambda x: True if x.text() != "view" else False
             )
-            # Handle mismatch between table rows and team elements
-            if len(team_urls) != self.table_length:
-                # Pad with empty strings if we have fewer team URLs than table rows
-                while len(team_urls) < self.table_length:
-                    team_urls.append("")
-                # Truncate if we have more team URLs than table rows
-                team_urls = team_urls[:self.table_length]
-            return team_urls
 
     def team_name(self) -> List[str]:
         try:
             return self.parse_extra_column("Team", str, get_href=False)
         except Exception:
-            team_names = self._filter_a_elements(
+            return self._row_a_elements(
                 "team", False, lambda x: True if x.text() != "view" else False
             )
-            # Handle mismatch between table rows and team elements
-            if len(team_names) != self.table_length:
-                # Pad with empty strings if we have fewer team names than table rows
-                while len(team_names) < self.table_length:
-                    team_names.append("")
-                # Truncate if we have more team names than table rows
-                team_names = team_names[:self.table_length]
-            return team_names
 
     def stage_url(self) -> List[Optional[str]]:
         """
         One URL per row from the Stage column (handles both <a href> and
         <span data-url>, with a row‐wide fallback).
         """
-        urls: List[Optional[str]] = []
-        for row in self.html_table.css(self.table_row_tag):
-            href: Optional[str] = None
-
-            # try to target the "Stage" cell by index if there's a header
-            try:
-                idx = self._get_column_index_from_header("Stage")
-            except Exception:
-                idx = None
-
-            if idx is not None:
-                # nth-child is 1‐based
-                cell = row.css_first(f"{self.row_column_tag}:nth-child({idx + 1})")
-                if cell:
-                    a = cell.css_first("a")
-                    if a and a.attrs.get("href"):
-                        href = a.attrs["href"]
-                    else:
-                        span = cell.css_first("span[data-url]")
-                        if span:
-                            href = span.attrs["data-url"]
-
-            # fallback: any link‐like element in this row whose URL has "/stage"
-            if not href:
-                for elt in row.css("a, span[data-url]"):
-                    candidate = elt.attrs.get("href") or elt.attrs.get("data-url")
-                    if candidate and "/stage" in candidate:
-                        href = candidate
-                        break
-
-            urls.append(href)
-        return urls
+        return [url for url, _ in self._stage_links()]
 
     def stage_name(self) -> List[Optional[str]]:
         """
         One visible name per row from the Stage column. Matches whatever
         element gave stage_url().
         """
-        names: List[Optional[str]] = []
-        # reuse your new stage_url output
-        url_list = self.stage_url()
-
-        for row, url in zip(self.html_table.css(self.table_row_tag), url_list):
-            if not url:
-                names.append(None)
-                continue
-
-            # find the same element we grabbed the URL from
-            selector = f"a[href='{url}'], span[data-url='{url}']"
-            elt = row.css_first(selector)
-            names.append(elt.text().strip() if elt else None)
-
-        return names
+        return [element.text().strip() if element is not None else None
+                for _, element in self._stage_links()]
 
     # def stage_url(self) -> List[str]:
     #     return self._filter_a_elements("race", True)
@@ -308,15 +282,7 @@ class TableParser:
 
         :return: List of all climb URLs from table.
         """
-        climb_urls = self._filter_a_elements("location", True)
-        # Handle mismatch between table rows and climb elements
-        if len(climb_urls) != self.table_length:
-            # Pad with empty strings if we have fewer climb URLs than table rows
-            while len(climb_urls) < self.table_length:
-                climb_urls.append("")
-            # Truncate if we have more climb URLs than table rows
-            climb_urls = climb_urls[:self.table_length]
-        return climb_urls
+        return self._row_a_elements("location", True)
 
     def climb_name(self) -> List[str]:
         """
@@ -325,15 +291,7 @@ class TableParser:
 
         :return: List of all climb names from table.
         """
-        climb_names = self._filter_a_elements("location", False)
-        # Handle mismatch between table rows and climb elements
-        if len(climb_names) != self.table_length:
-            # Pad with empty strings if we have fewer climb names than table rows
-            while len(climb_names) < self.table_length:
-                climb_names.append("")
-            # Truncate if we have more climb names than table rows
-            climb_names = climb_names[:self.table_length]
-        return climb_names
+        return self._row_a_elements("location", False)
 
     def race_url(self) -> List[str]:
         """
@@ -571,6 +529,20 @@ class TableParser:
             value = row.pop(field_name)
             row[new_field_name] = value
 
+    def _interned(self, field: str, values: List[Any]) -> List[Any]:
+        """
+        Interns string values of the field when interning is enabled and the
+        field is one of `interned_fields`.
+
+        :param field: Name of the field.
+        :param values: Parsed values of the field.
+        :return: Values with interned strings.
+        """
+        if not self.intern_strings or field not in self.interned_fields:
+            return values
+        return [sys.intern(value) if isinstance(value, str) else value
+                for value in values]
+
     def _get_column_index_from_header(self, column_name: str) -> int:
         if self.header is None:
             raise ExpectedParsingError(
@@ -602,6 +574,106 @@ class TableParser:
                     else:
                         row[time_field] = self.table[1:][i - 1]["time"]
 
+    def _limit_rows(self, limit: int) -> None:
+        """
+        Keeps only first `limit` rows of the table. The rows are copied to a
+        new HTML tree, so given HTML table isn't modified and parsing methods
+        don't touch the other rows at all.
+
+        :param limit: Count of rows to keep.
+        :raises ValueError: When limit is negative.
+        """
+        if limit < 0:
+            raise ValueError(f"Invalid limit: '{limit}'")
+        if limit >= self.table_length:
+            return
+        rows = self.html_table.css(self.table_row_tag)[:limit]
+        rows_html = "".join(row.html for row in rows)  # type: ignore
+        if self.table_row_tag == "tr":
+            limited_html = HTMLParser(
+                f"<table><tbody>{rows_html}</tbody></table>")
+            self.html_table = limited_html.css_first("tbody")
+        else:
+            tag = self.html_table.tag
+            limited_html = HTMLParser(f"<{tag}>{rows_html}</{tag}>")
+            self.html_table = limited_html.css_first(tag)
+        self.a_elements = self.html_table.css("a")
+        self._anchors = None
+        self._stage_link_elements = None
+        self.table_length = len(self.html_table.css(self.table_row_tag))
+
+    def _anchor_index(self) -> Dict[str, List[Tuple[int, Node]]]:
+        """
+        Groups a elements of the table by the first part of their href (e.g.
+        ``rider``) together with ordinals of rows they are in. The table is
+        scanned only once, every URL or name field is then a lookup.
+
+        :return: Dict with href keywords as keys and lists of tuples of row
+            ordinal (-1 for elements outside rows) and a element as values, in
+            order of the table.
+        """
+        if self._anchors is None:
+            self._anchors = {}
+            rows = self.html_table.css(self.table_row_tag)
+            ordinals = {row.mem_id: ordinal for ordinal, row in enumerate(rows)}
+            for a_element in self.a_elements:
+                href = a_element.attributes.get("href")
+                if not href:
+                    continue
+                # find row of the element, -1 when it isn't in any row
+                node = a_element.parent
+                while node is not None and node.mem_id not in ordinals:
+                    node = node.parent
+                ordinal = -1 if node is None else ordinals[node.mem_id]
+                self._anchors.setdefault(href.split("/")[0], []).append(
+                    (ordinal, a_element))
+        return self._anchors
+
+    def _stage_links(self) -> List[Tuple[Optional[str], Optional[Node]]]:
+        """
+        Finds stage link of every row, so `stage_url` and `stage_name` share
+        one walk over the rows. The link is taken from the Stage column when
+        the table has a header, otherwise (or when the column has no link)
+        from any link-like element of the row whose URL has ``/stage``.
+
+        :return: List with tuple of URL and element the URL is from for every
+            row, both None for rows without stage link.
+        """
+        if self._stage_link_elements is not None:
+            return self._stage_link_elements
+        # try to target the "Stage" cell by index if there's a header
+        try:
+            idx: Optional[int] = self._get_column_index_from_header("Stage")
+        except Exception:
+            idx = None
+        cell_selector = f"{self.row_column_tag}:nth-child({idx + 1})" \
+            if idx is not None else None
+
+        links: List[Tuple[Optional[str], Optional[Node]]] = []
+        for row in self.html_table.css(self.table_row_tag):
+            href: Optional[str] = None
+            element: Optional[Node] = None
+            cell = row.css_first(cell_selector) if cell_selector else None
+            if cell:
+                a = cell.css_first("a")
+                if a and a.attrs.get("href"):
+                    href, element = a.attrs["href"], a
+                else:
+                    span = cell.css_first("span[data-url]")
+                    if span:
+                        href, element = span.attrs["data-url"], span
+
+            # fallback: any link‐like element in this row whose URL has "/stage"
+            if not href:
+                for elt in row.css("a, span[data-url]"):
+                    candidate = elt.attrs.get("href") or elt.attrs.get("data-url")
+                    if candidate and "/stage" in candidate:
+                        href, element = candidate, elt
+                        break
+            links.append((href, element if href else None))
+        self._stage_link_elements = links
+        return links
+
     def _filter_a_elements(
         self, keyword: str, get_href: bool, validator: Callable = lambda x: True
     ) -> List[str]:
@@ -616,12 +688,31 @@ class TableParser:
         True element is added to result list, otherwise not.
         :return: List of all a elements texts or hrefs with given keyword.
         """
-        filtered_values = []
-        for a_element in self.a_elements:
-            href = a_element.attributes["href"]
-            if href and href.split("/")[0] == keyword and validator(a_element):
-                if get_href:
-                    filtered_values.append(href)
-                else:
-                    filtered_values.append(a_element.text())
-        return filtered_values
+        return [a_element.attributes["href"] if get_href else a_element.text()
+                for _, a_element in self._anchor_index().get(keyword, [])
+                if validator(a_element)]
+
+    def _row_a_elements(
+        self, keyword: str, get_href: bool, validator: Callable = lambda x: True
+    ) -> List[str]:
+        """
+        Gets href or text of the first a element with given keyword in every
+        table row, so values stay aligned with rows even when some rows don't
+        have such element or have more of them.
+
+        :param keyword: Keyword that element's href should have.
+        :param get_href: Whether to return the href of a element, when False
+        text is returned.
+        :param validator: Function to call on every a element. When returns
+        True element can be used, otherwise not.
+        :return: List with value for every table row, empty string for rows
+            without a element with given keyword.
+        """
+        values = [""] * self.table_length
+        found = [False] * self.table_length
+        for ordinal, a_element in self._anchor_index().get(keyword, []):
+            if ordinal >= 0 and not found[ordinal] and validator(a_element):
+                found[ordinal] = True
+                values[ordinal] = a_element.attributes["href"] if get_href \
+                    else a_element.text()
+        return values
@@ -32,25 +32,38 @@ class Team(Scraper):
         ...
     }
     """
+
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "fetch_history",
+    )
+    """Public methods that aren't called by `parse` method."""
+
+    _riders_fields = (
+        "nationality",
+        "rider_name",
+        "rider_url",
+        "age",
+        "since",
+        "until",
+        "career_points",
+        "ranking_points",
+        "ranking_position",
+    )
+    """Fields available in team riders table."""
+
     def name(self) -> str:
         """
         Parses team display name from HTML.
 
         :return: Display name, e.g. ``BORA - hansgrohe``.
         """
-        # Try new structure first
-        display_name_html = self.html.css_first(".page-title h1")
-        if not display_name_html:
-            # Fallback to original selector
+        if self._layout() == "legacy":
             display_name_html = self.html.css_first(".page-title > .main > h1")
-        
-        if not display_name_html:
-            # Last resort - any h1
-            display_name_html = self.html.css_first("h1")
-            
+        else:
+            display_name_html = self.html.css_first(".page-title h1") or \
+                self.html.css_first("h1")
         if not display_name_html:
             raise ExpectedParsingError("Team name unavailable from current HTML structure.")
-            
         return display_name_html.text().split(" (")[0]
 
     def nationality(self) -> str:
@@ -59,15 +72,13 @@ class Team(Scraper):
 
         :return: Team's nationality as 2 chars long country code in uppercase.
         """
-        # Try new structure first - look for flag in page-title
-        nationality_html = self.html.css_first(".page-title span.flag")
-        if not nationality_html:
-            # Fallback to original selector
+        if self._layout() == "legacy":
             nationality_html = self.html.css_first(".page-title > .main > span.flag")
-        
+        else:
+            nationality_html = self.html.css_first(".page-title span.flag")
         if not nationality_html:
             raise ExpectedParsingError("Team nationality unavailable from current HTML structure.")
-            
+
         flag_class = nationality_html.attributes['class']
         # Extract country code from class like "flag nl w32" or "flag nl"
         parts = flag_class.split(" ")
@@ -82,9 +93,10 @@ class Team(Scraper):
 
         :return: Team status as 2 chars long code in uppercase, e.g. ``WT``.
         """
-        team_status_html = self.html.css_first(
-            "div > ul.infolist > li:nth-child(1) > div:nth-child(2)")
-        return team_status_html.text()
+        team_status_html = self._info_value("Team status", 0)
+        if team_status_html is None:
+            raise ExpectedParsingError("Team status unavailable.")
+        return team_status_html.text().strip()
 
     def abbreviation(self) -> str:
         """
@@ -93,9 +105,10 @@ class Team(Scraper):
         :return: Team abbreviation as 3 chars long code in uppercase, e.g.
             ``BOH``
         """
-        abbreviation_html = self.html.css_first(
-            "div > ul.infolist > li:nth-child(2) > div:nth-child(2)")
-        return abbreviation_html.text()
+        abbreviation_html = self._info_value("Abbreviation", 1)
+        if abbreviation_html is None:
+            raise ExpectedParsingError("Team abbreviation unavailable.")
+        return abbreviation_html.text().strip()
 
     def bike(self) -> str:
         """
@@ -103,9 +116,10 @@ class Team(Scraper):
 
         :return: Bike brand e.g. ``Specialized``.
         """
-        bike_html = self.html.css_first(
-            "div > ul.infolist > li:nth-child(4) > div:nth-child(2)")
-        return bike_html.text()
+        bike_html = self._info_value("Bike", 3)
+        if bike_html is None:
+            raise ExpectedParsingError("Team bike unavailable.")
+        return bike_html.text().strip()
 
     def wins_count(self) -> Optional[int]:
         """
@@ -173,7 +187,8 @@ class Team(Scraper):
         team_seasons_select_html = self.html.css_first("form > select")
         return parse_select(team_seasons_select_html)
 
-    def riders(self, *args: str) -> List[Dict[str, Any]]:
+    def riders(self, *args: str, limit: Optional[int] = None
+               ) -> List[Dict[str, Any]]:
         """
         Parses team riders in curresponding season from HTML.
 
@@ -192,20 +207,12 @@ class Team(Scraper):
             - ranking_points: Current rider's points in PCS ranking.
             - ranking_position: Current rider's position in PCS ranking.
 
+        :param limit: Maximal count of rows to parse, defaults to None (all
+            rows are parsed).
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
-        available_fields = (
-            "nationality",
-            "rider_name",
-            "rider_url",
-            "age",
-            "since",
-            "until",
-            "career_points",
-            "ranking_points",
-            "ranking_position"
-        )
+        available_fields = self._riders_fields
         casual_fields = [
             "nationality",
             "rider_name",
@@ -224,8 +231,8 @@ class Team(Scraper):
                     career_points_table_html = table
                     break
         
-        if not career_points_table_html:
-            # Fallback to original tab-based structure
+        if not career_points_table_html and self._layout() == "legacy":
+            # tab-based structure of legacy pages
             mapping = {}
             for i, li in enumerate(self.html.css("ul.riderlistTabs > li")):
                 mapping[li.text()] = i
@@ -242,7 +249,7 @@ class Team(Scraper):
         # add rider_url to the table for table joining purposes
         if "rider_url" not in career_points_fields:
             career_points_fields.append("rider_url")
-        table_parser.parse(career_points_fields)
+        table_parser.parse(career_points_fields, limit)
         if "career_points" in fields:
             career_points = table_parser.parse_extra_column(2,
                 lambda x: int(x) if x.isnumeric() else 0)
@@ -263,3 +270,50 @@ class Team(Scraper):
                         row.pop(field, None)
 
         return table
+
+    def fetch_history(self, *args: str,
+                      max_workers: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetches pages of all team seasons from history select menu
+        concurrently and merges their rosters into one timeline. Seasons which
+        pages are unavailable (e.g. future ones) are skipped. Use
+        ``Scraper.page_cache`` to avoid fetching the same seasons repeatedly.
+
+        :param args: Fields of ``riders`` method that should be contained in
+            timeline rows. When no args are passed, all fields are parsed.
+        :param max_workers: Maximal count of concurrent requests, defaults to
+            8.
+        :raises ValueError: When one of args is of invalid value.
+        :return: Dict mapping rider URLs to lists of rows with keys
+            ``season``, ``team_name``, ``team_url`` and wanted fields, sorted
+            by season.
+        """
+        seasons = {}
+        for option in self.history_select():
+            season_text = option["text"].split("|")[0].strip()
+            if not season_text.isnumeric():
+                continue
+            team_url = option["value"].split("/overview")[0].strip("/")
+            seasons[team_url] = {
+                "season": int(season_text),
+                "team_name": option["text"].split("|", 1)[-1].strip(),
+                "team_url": team_url,
+            }
+        teams = Team.fetch_many(
+            [url for url in seasons if url != self.relative_url()],
+            max_workers, skip_invalid=True)
+        if self.relative_url() in seasons:
+            teams.append(self)
+
+        timeline: Dict[str, List[Dict[str, Any]]] = {}
+        for team in teams:
+            season_info = seasons[team.relative_url()]
+            for rider in team.riders(*args):
+                rider_url = rider["rider_url"]
+                if args and "rider_url" not in args:
+                    rider.pop("rider_url")
+                timeline.setdefault(rider_url, []).append(
+                    {**season_info, **rider})
+        for rows in timeline.values():
+            rows.sort(key=lambda row: row["season"])
+        return timeline
@@ -1,7 +1,7 @@
 import datetime
 import math
 import re
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from selectolax.parser import HTMLParser, Node
 
@@ -124,6 +124,65 @@ def add_times(time1: str, time2: str) -> str:
     tdelta = tdelta1 + tdelta2
     return timedelta_to_time(tdelta)
 
+def time_to_seconds(time: Optional[str]) -> Optional[int]:
+    """
+    Converts time in `H:MM:SS`, `M:SS` or `-H:MM:SS` format to seconds.
+
+    :param time: Time to convert.
+    :return: Time in seconds, None when the time is missing or malformed.
+    """
+    if not time:
+        return None
+    time = time.strip()
+    sign = -1 if time.startswith("-") else 1
+    try:
+        parts = [int(part) for part in time.lstrip("-").split(":")]
+    except ValueError:
+        return None
+    if not 1 < len(parts) < 4:
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + part
+    return sign * seconds
+
+def table_seconds(table: List[Dict[str, Any]],
+                  time_field: str = "time") -> List[Optional[int]]:
+    """
+    Converts times of table rows to seconds. Rows with missing time of
+    classified riders have the same time as the previous row (in results
+    tables such riders finished in the same group).
+
+    :param table: Table with time field.
+    :param time_field: Field with time, defaults to `time`.
+    :return: List of seconds, None for rows of riders whose status isn't
+        `DF`.
+    """
+    seconds_list = []
+    previous = None
+    for row in table:
+        if row.get("status", "DF") != "DF":
+            seconds_list.append(None)
+            continue
+        seconds = time_to_seconds(row.get(time_field))
+        if seconds is None:
+            seconds = previous
+        seconds_list.append(seconds)
+        previous = seconds
+    return seconds_list
+
+def seconds_to_time(seconds: int) -> str:
+    """
+    Converts seconds to time in `H:MM:SS` format.
+
+    :param seconds: Seconds to convert.
+    :return: Formatted time, prefixed with `-` when negative.
+    """
+    sign = "-" if seconds < 0 else ""
+    minutes, secs = divmod(abs(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours}:{minutes:02}:{secs:02}"
+
 # HTML parsing functions
 def parse_select(select_menu: Node) -> List[Dict[str, str]]:
     """
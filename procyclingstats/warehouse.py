@@ -0,0 +1,442 @@
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .errors import ExpectedParsingError
+from .ranking_scraper import Ranking
+from .rider_results_scraper import RiderResults
+from .scraper import Scraper
+from .stage_scraper import Stage
+from .team_scraper import Team
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS riders (
+    rider_url TEXT PRIMARY KEY,
+    rider_name TEXT,
+    nationality TEXT
+);
+CREATE TABLE IF NOT EXISTS teams (
+    team_url TEXT PRIMARY KEY,
+    team_name TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (
+    stage_url TEXT PRIMARY KEY,
+    race_url TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    date TEXT,
+    stage_type TEXT,
+    distance REAL
+);
+CREATE INDEX IF NOT EXISTS stages_race_url ON stages (race_url, stage);
+CREATE INDEX IF NOT EXISTS stages_date ON stages (date);
+CREATE TABLE IF NOT EXISTS stage_results (
+    stage_url TEXT NOT NULL REFERENCES stages (stage_url),
+    classification TEXT NOT NULL,
+    rider_url TEXT NOT NULL REFERENCES riders (rider_url),
+    team_url TEXT REFERENCES teams (team_url),
+    rider_number INTEGER,
+    rank INTEGER,
+    prev_rank INTEGER,
+    status TEXT,
+    age INTEGER,
+    time TEXT,
+    bonus TEXT,
+    pcs_points REAL,
+    uci_points REAL,
+    PRIMARY KEY (stage_url, classification, rider_url)
+);
+CREATE INDEX IF NOT EXISTS stage_results_rider_url
+    ON stage_results (rider_url, rank);
+CREATE TABLE IF NOT EXISTS stage_team_results (
+    stage_url TEXT NOT NULL REFERENCES stages (stage_url),
+    classification TEXT NOT NULL,
+    team_url TEXT NOT NULL REFERENCES teams (team_url),
+    rank INTEGER,
+    prev_rank INTEGER,
+    status TEXT,
+    time TEXT,
+    bonus TEXT,
+    pcs_points REAL,
+    uci_points REAL,
+    PRIMARY KEY (stage_url, classification, team_url)
+);
+CREATE TABLE IF NOT EXISTS rider_results (
+    rider_url TEXT NOT NULL REFERENCES riders (rider_url),
+    stage_url TEXT NOT NULL,
+    race_url TEXT NOT NULL,
+    date TEXT,
+    rank INTEGER,
+    stage_name TEXT,
+    nationality TEXT,
+    class TEXT,
+    distance REAL,
+    pcs_points REAL,
+    uci_points REAL,
+    PRIMARY KEY (rider_url, stage_url)
+);
+CREATE INDEX IF NOT EXISTS rider_results_rider_url
+    ON rider_results (rider_url, date);
+CREATE INDEX IF NOT EXISTS rider_results_race_url ON rider_results (race_url);
+CREATE INDEX IF NOT EXISTS rider_results_date ON rider_results (date);
+CREATE TABLE IF NOT EXISTS team_riders (
+    team_url TEXT NOT NULL REFERENCES teams (team_url),
+    rider_url TEXT NOT NULL REFERENCES riders (rider_url),
+    age INTEGER,
+    since TEXT,
+    until TEXT,
+    career_points INTEGER,
+    ranking_points INTEGER,
+    ranking_position INTEGER,
+    PRIMARY KEY (team_url, rider_url)
+);
+CREATE INDEX IF NOT EXISTS team_riders_rider_url ON team_riders (rider_url);
+CREATE TABLE IF NOT EXISTS ranking_entries (
+    ranking_url TEXT NOT NULL,
+    ranking_type TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    rank INTEGER,
+    prev_rank INTEGER,
+    rider_url TEXT REFERENCES riders (rider_url),
+    team_url TEXT REFERENCES teams (team_url),
+    nation_url TEXT,
+    race_url TEXT,
+    nationality TEXT,
+    class TEXT,
+    points REAL,
+    first_places INTEGER,
+    second_places INTEGER,
+    third_places INTEGER,
+    distance REAL,
+    racedays INTEGER,
+    PRIMARY KEY (ranking_url, position)
+);
+CREATE INDEX IF NOT EXISTS ranking_entries_rider_url
+    ON ranking_entries (rider_url);
+CREATE INDEX IF NOT EXISTS ranking_entries_team_url
+    ON ranking_entries (team_url);
+CREATE INDEX IF NOT EXISTS ranking_entries_race_url
+    ON ranking_entries (race_url);
+"""
+
+_STAGE_RESULTS_COLUMNS = ("stage_url", "classification", "rider_url",
+                          "team_url", "rider_number", "rank", "prev_rank",
+                          "status", "age", "time", "bonus", "pcs_points",
+                          "uci_points")
+_STAGE_TEAM_RESULTS_COLUMNS = ("stage_url", "classification", "team_url",
+                               "rank", "prev_rank", "status", "time", "bonus",
+                               "pcs_points", "uci_points")
+_RIDER_RESULTS_COLUMNS = ("rider_url", "stage_url", "race_url", "date",
+                          "rank", "stage_name", "nationality", "class",
+                          "distance", "pcs_points", "uci_points")
+_TEAM_RIDERS_COLUMNS = ("team_url", "rider_url", "age", "since", "until",
+                        "career_points", "ranking_points", "ranking_position")
+_RANKING_ENTRIES_COLUMNS = ("ranking_url", "ranking_type", "position", "rank",
+                            "prev_rank", "rider_url", "team_url", "nation_url",
+                            "race_url", "nationality", "class", "points",
+                            "first_places", "second_places", "third_places",
+                            "distance", "racedays")
+
+_RANKING_METHODS = {
+    "individual": "individual_ranking",
+    "teams": "team_ranking",
+    "nations": "nations_ranking",
+    "races": "races_ranking",
+    "distance": "distance_ranking",
+    "racedays": "racedays_ranking",
+    "individual_wins": "individual_wins_ranking",
+    "team_wins": "teams_wins_ranking",
+    "nation_wins": "nations_wins_ranking",
+}
+"""Ranking parsing methods by ranking type."""
+
+
+class Warehouse:
+    """
+    Local SQLite store of parsed results tables, so questions like "all
+    top-10s of a rider" are answered by indexed queries instead of parsing
+    HTMLs again. Stored are results and GC of stages, rider's results, team
+    riders and rankings in normalized tables ``riders``, ``teams``,
+    ``stages``, ``stage_results``, ``stage_team_results``, ``rider_results``,
+    ``team_riders`` and ``ranking_entries``. Rows of stage results without
+    rider (e.g. TTT results listing only teams) are stored to
+    ``stage_team_results``. All URLs are stored relative.
+
+    Storing the same page again replaces its previously stored rows.
+
+    Usage:
+
+    >>> from procyclingstats import RiderResults, Stage, Warehouse
+    >>> with Warehouse("pcs.db") as warehouse:
+    ...     warehouse.store(Stage("race/tour-de-france/2022/stage-18"),
+    ...                     RiderResults("rider/tadej-pogacar/results"))
+    ...     warehouse.rider_top_results("rider/tadej-pogacar", 10)
+    [
+        {
+            'stage_url': 'race/tour-de-france/2022/stage-18',
+            'date': '2022-07-21',
+            'rank': 2,
+            ...
+        },
+        ...
+    ]
+
+    :param path: Path to the database file, defaults to ``:memory:``.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    def store(self, *scraper_objects: Scraper) -> None:
+        """
+        Parses tables of given scraper objects and stores them in a single
+        transaction. Supported are ``Stage`` (results and GC),
+        ``RiderResults`` (created from rider's default results table),
+        ``Team`` (riders) and ``Ranking`` objects. Objects are checked before
+        the transaction, so an unsupported one doesn't roll back the others.
+        Stage's date, type and distance unavailable in HTML are stored as
+        NULL.
+
+        :param scraper_objects: Scraper objects ready for HTML parsing.
+        :raises ValueError: When one of the objects isn't supported.
+        """
+        for scraper_obj in scraper_objects:
+            self._check_supported(scraper_obj)
+        with self._connection:
+            for scraper_obj in scraper_objects:
+                if isinstance(scraper_obj, Stage):
+                    self._store_stage(scraper_obj)
+                elif isinstance(scraper_obj, RiderResults):
+                    self._store_rider_results(scraper_obj)
+                elif isinstance(scraper_obj, Team):
+                    self._store_team(scraper_obj)
+                else:
+                    self._store_ranking(scraper_obj)
+
+    def query(self, sql: str,
+              parameters: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        Runs SQL query on the warehouse.
+
+        :param sql: SQL query.
+        :param parameters: Query parameters, defaults to ().
+        :return: Table with rows of the query result.
+        """
+        cursor = self._connection.execute(sql, parameters)
+        return [dict(row) for row in cursor]
+
+    def rider_top_results(self, rider_url: str,
+                          max_rank: int = 10) -> List[Dict[str, Any]]:
+        """
+        Gets rider's results with rank better than or equal to `max_rank`,
+        both from rider's results and from stored stages.
+
+        :param rider_url: Relative URL of the rider, e.g.
+            ``rider/tadej-pogacar``.
+        :param max_rank: The worst rank included, defaults to 10.
+        :return: Table with fields ``stage_url``, ``date`` and ``rank``
+            ordered by date.
+        """
+        return self.query("""
+            SELECT stage_url, date, rank FROM rider_results
+            WHERE rider_url = ? AND rank <= ?
+            UNION
+            SELECT stage_results.stage_url, date, rank FROM stage_results
+            JOIN stages ON stages.stage_url = stage_results.stage_url
+            WHERE rider_url = ? AND classification = 'stage' AND rank <= ?
+            ORDER BY date, stage_url""",
+            (rider_url, max_rank, rider_url, max_rank))
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def _check_supported(self, scraper_obj: Scraper) -> None:
+        """
+        Checks whether the object can be stored.
+
+        :param scraper_obj: Scraper object ready for HTML parsing.
+        :raises ValueError: When the object isn't supported.
+        """
+        if not isinstance(scraper_obj, (Stage, RiderResults, Team, Ranking)):
+            raise ValueError(
+                f"Can't store '{type(scraper_obj).__name__}' object.")
+        if isinstance(scraper_obj, RiderResults):
+            try:
+                # pylint: disable=protected-access
+                scraper_obj._check_default_results_table("store")
+                self._rider_url(scraper_obj)
+            except ExpectedParsingError as e:
+                raise ValueError(
+                    f"Can't store '{scraper_obj.relative_url()}': {e}") from e
+
+    def _store_stage(self, stage: Stage) -> None:
+        """
+        Stores stage with its results and GC. Rows with rider are stored to
+        ``stage_results``, rows with team only to ``stage_team_results``.
+
+        :param stage: Stage object ready for HTML parsing.
+        """
+        stage_url = stage.relative_url()
+        url_parts = stage_url.split("/")
+        self._upsert("stages", ("stage_url", "race_url", "stage", "date",
+                                "stage_type", "distance"), ("stage_url",),
+                     [(stage_url, "/".join(url_parts[:3]), url_parts[-1],
+                       self._optional(stage.date),
+                       self._optional(stage.stage_type),
+                       self._optional(stage.distance))])
+        for results_table in ("stage_results", "stage_team_results"):
+            self._connection.execute(
+                f"DELETE FROM {results_table} WHERE stage_url = ?",
+                (stage_url,))
+        for classification, table in (("stage", stage.results()),
+                                      ("gc", stage.gc())):
+            self._store_riders_and_teams(table)
+            self._insert("stage_results", _STAGE_RESULTS_COLUMNS, [
+                (stage_url, classification) + tuple(
+                    row.get(column) for column in _STAGE_RESULTS_COLUMNS[2:])
+                for row in table if row.get("rider_url")])
+            self._insert("stage_team_results", _STAGE_TEAM_RESULTS_COLUMNS, [
+                (stage_url, classification) + tuple(
+                    row.get(column)
+                    for column in _STAGE_TEAM_RESULTS_COLUMNS[2:])
+                for row in table
+                if not row.get("rider_url") and row.get("team_url")])
+
+    def _store_rider_results(self, rider_results: RiderResults) -> None:
+        """
+        Stores rider's results.
+
+        :param rider_results: RiderResults object ready for HTML parsing.
+        """
+        rider_url = self._rider_url(rider_results)
+        self._upsert("riders", ("rider_url",), ("rider_url",), [(rider_url,)])
+        self._upsert("rider_results", _RIDER_RESULTS_COLUMNS,
+                     ("rider_url", "stage_url"), [
+            (rider_url, row["stage_url"],
+             "/".join(row["stage_url"].split("/")[:3])) + tuple(
+                row.get(column) for column in _RIDER_RESULTS_COLUMNS[3:])
+            for row in rider_results.results() if row.get("stage_url")])
+
+    def _store_team(self, team: Team) -> None:
+        """
+        Stores team riders.
+
+        :param team: Team object ready for HTML parsing.
+        """
+        team_url = team.relative_url()
+        riders = team.riders()
+        self._upsert("teams", ("team_url", "team_name"), ("team_url",),
+                     [(team_url, team.name())])
+        self._store_riders_and_teams(riders)
+        self._connection.execute(
+            "DELETE FROM team_riders WHERE team_url = ?", (team_url,))
+        self._insert("team_riders", _TEAM_RIDERS_COLUMNS, [
+            (team_url,) + tuple(
+                row.get(column) for column in _TEAM_RIDERS_COLUMNS[1:])
+            for row in riders])
+
+    def _store_ranking(self, ranking: Ranking) -> None:
+        """
+        Stores ranking table.
+
+        :param ranking: Ranking object ready for HTML parsing.
+        """
+        ranking_url = ranking.relative_url()
+        ranking_type = ranking._ranking_type() # pylint: disable=protected-access
+        table = getattr(ranking, _RANKING_METHODS[ranking_type])()
+        self._store_riders_and_teams(table)
+        self._connection.execute(
+            "DELETE FROM ranking_entries WHERE ranking_url = ?",
+            (ranking_url,))
+        self._insert("ranking_entries", _RANKING_ENTRIES_COLUMNS, [
+            (ranking_url, ranking_type, position) + tuple(
+                row.get(column) for column in _RANKING_ENTRIES_COLUMNS[3:])
+            for position, row in enumerate(table)])
+
+    def _store_riders_and_teams(self, table: List[Dict[str, Any]]) -> None:
+        """
+        Stores riders and teams referenced by rows of given table.
+
+        :param table: Parsed table.
+        """
+        self._upsert("riders", ("rider_url", "rider_name", "nationality"),
+                     ("rider_url",), [
+            (row["rider_url"], row.get("rider_name"), row.get("nationality"))
+            for row in table if row.get("rider_url")])
+        self._upsert("teams", ("team_url", "team_name"), ("team_url",), [
+            (row["team_url"], row.get("team_name"))
+            for row in table if row.get("team_url")])
+
+    def _insert(self, table: str, columns: Tuple[str, ...],
+                rows: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Inserts rows to table, rows with existing primary key are replaced.
+
+        :param table: Name of the table.
+        :param columns: Columns of inserted rows.
+        :param rows: Inserted rows.
+        """
+        placeholders = ", ".join("?" * len(columns))
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})", rows)
+
+    def _upsert(self, table: str, columns: Tuple[str, ...],
+                key: Tuple[str, ...], rows: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Inserts rows to table, rows with existing `key` are updated with
+        values that aren't None.
+
+        :param table: Name of the table.
+        :param columns: Columns of inserted rows.
+        :param key: Columns of the table's primary key.
+        :param rows: Inserted rows.
+        """
+        placeholders = ", ".join("?" * len(columns))
+        updates = [f"{column} = COALESCE(excluded.{column}, {column})"
+                   for column in columns if column not in key]
+        on_conflict = f"DO UPDATE SET {', '.join(updates)}" if updates \
+            else "DO NOTHING"
+        self._connection.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders}) "
+            f"ON CONFLICT ({', '.join(key)}) {on_conflict}", rows)
+
+    @staticmethod
+    def _optional(parsing_method: Callable[[], Any]) -> Any:
+        """
+        Calls parsing method of a value that might be unavailable.
+
+        :param parsing_method: Parsing method without arguments.
+        :return: Parsed value or None when it's unavailable in HTML.
+        """
+        try:
+            return parsing_method()
+        except ExpectedParsingError:
+            return None
+
+    @staticmethod
+    def _rider_url(rider_results: RiderResults) -> str:
+        """
+        Gets relative URL of the rider from URL of the results page.
+
+        :param rider_results: RiderResults object.
+        :raises ExpectedParsingError: When the rider isn't identified by URL.
+        :return: Relative URL of the rider.
+        """
+        url_parts = rider_results.relative_url().split("/")
+        if url_parts[0] == "rider" and len(url_parts) > 1:
+            return f"rider/{url_parts[1]}"
+        rider_ids = parse_qs(urlparse(rider_results.url).query).get("id")
+        if rider_ids and not rider_ids[0].isnumeric():
+            return f"rider/{rider_ids[0]}"
+        raise ExpectedParsingError("Rider URL unavailable.")
@@ -20,4 +20,8 @@ setup(
         "requests",
         "selectolax"
     ],
+    extras_require={
+        "analytics": ["numpy"],
+        "zstd": ["zstandard"]
+    },
 )
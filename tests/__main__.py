@@ -1,5 +1,8 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
+from procyclingstats import ReplayServer
 from procyclingstats.__main__ import get_corresponding_scraping_class
 
 from .fixtures_utils import FixturesUtils
@@ -19,6 +22,8 @@ def configure_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("-q", "--quiet", action="store_true",
         help="Turns off logging.")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+        help="Maximal count of pages fetched concurrently.")
     subparsers = parser.add_subparsers(help="Command types available.",
         dest="command", required=True)
 
@@ -38,63 +43,113 @@ def configure_parser() -> argparse.ArgumentParser:
         "from fixtures directory if parsing results of old HTML differ to " +
         "parsing results of the current one.")
 
+    replay_parser = subparsers.add_parser("replay", help="Serves HTML " +
+        "fixtures over HTTP, so scraping can be tested without access to PCS.")
+    replay_parser.add_argument("--host", type=str, default="127.0.0.1",
+        help="Host to listen on.")
+    replay_parser.add_argument("--port", type=int, default=8000,
+        help="Port to listen on.")
+    replay_parser.add_argument("--latency", type=float, default=0,
+        help="Delay of every response in seconds.")
+    replay_parser.add_argument("--error-rate", type=float, default=0,
+        help="Probability of responding with error instead of the page.")
+    replay_parser.add_argument("--error-status", type=int, default=503,
+        help="HTTP status of injected errors.")
+
     return parser
 
 
+def add_fixture(f_utils: FixturesUtils, url: str, command: str) -> List[str]:
+    """
+    Makes HTML fixture (and data fixture when command is `add`) from given URL.
+
+    :param f_utils: Fixtures utils of fixtures directory.
+    :param url: Absolute or relative URL of PCS page.
+    :param command: Either `add` or `add_html`.
+    :return: Names of added fixture files.
+    """
+    ScraperClass = get_corresponding_scraping_class(url)
+    obj = ScraperClass(url)
+    filename = f_utils.url_to_filename(obj.relative_url())
+    f_utils.make_html_fixture(obj)
+    added = [f"{filename}.txt"]
+    if command == "add":
+        f_utils.make_data_fixture(obj)
+        added.append(f"{filename}.json")
+    return added
+
+
+def update_html_fixture(f_utils: FixturesUtils, url: str) -> bool:
+    """
+    Updates HTML fixture of given URL if parsing results of old HTML differ to
+    parsing results of the current one.
+
+    :param f_utils: Fixtures utils of fixtures directory.
+    :param url: Relative URL of the fixture.
+    :return: True if the fixture was updated, otherwise False.
+    """
+    ScraperClass = get_corresponding_scraping_class(url)
+    # create scraping object from both old and new HTML
+    new_scraper_obj = ScraperClass(url)
+    old_html = f_utils.get_html_fixture(new_scraper_obj.relative_url())
+    old_scraper_obj = ScraperClass.from_html(url, old_html)  # type: ignore
+
+    try:
+        parsed_obj1 = new_scraper_obj.parse()
+        parsed_obj2 = old_scraper_obj.parse()
+    except Exception as e:
+        print(f"Exception raised: {url}")
+        raise(e)
+    update_needed = False
+    for method in parsed_obj1.keys():
+        try:
+            method_test(parsed_obj1[method], parsed_obj2[method])
+        except AssertionError:
+            update_needed = True
+
+    if update_needed:
+        f_utils.make_html_fixture(new_scraper_obj)
+    return update_needed
+
+
 def run(args: argparse.Namespace, fixturer_path: str = "./tests/fixtures/"):
     f_utils = FixturesUtils(fixturer_path)
     if args.command in ("add", "add_html"):
-        for url in args.urls:
-            ScraperClass = get_corresponding_scraping_class(url)
-            obj = ScraperClass(url)
-            filename = f_utils.url_to_filename(
-                obj.relative_url())
-
-            if args.command == "add":
-                if not args.quiet:
-                    print(f"Adding: {filename}.txt")
-                f_utils.make_html_fixture(obj)
-                if not args.quiet:
-                    print(f"Adding: {filename}.json")
-                f_utils.make_data_fixture(obj)
-
-            elif args.command == "add_html":
-                if not args.quiet:
-                    print(f"Adding: {filename}.txt")
-                f_utils.make_html_fixture(obj)
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            added_fixtures = executor.map(
+                lambda url: add_fixture(f_utils, url, args.command),
+                args.urls)
+            for filenames in added_fixtures:
+                for filename in filenames:
+                    if not args.quiet:
+                        print(f"Adding: {filename}")
 
     elif args.command == "update_htmls":
         urls = f_utils.get_urls_from_fixtures_dir("txt")
-        for url in urls:
-            ScraperClass = get_corresponding_scraping_class(url)
-            # create scraping object from both old and new HTML
-            new_scraper_obj = ScraperClass(url)
-            old_html = f_utils.get_html_fixture(new_scraper_obj.relative_url())
-            old_scraper_obj = ScraperClass.__new__(ScraperClass)
-            old_scraper_obj._Scraper__init_with_url(url, old_html, False)
-
-            try:
-                parsed_obj1 = new_scraper_obj.parse()
-                parsed_obj2 = old_scraper_obj.parse()
-            except Exception as e:
-                print(f"Exception raised: {url}")
-                raise(e)
-            update_needed = False
-            for method in parsed_obj1.keys():
-                try:
-                    method_test(parsed_obj1[method], parsed_obj2[method])
-                except AssertionError:
-                    update_needed = True
-
-            if update_needed:
-                if not args.quiet:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            updates = executor.map(
+                lambda url: update_html_fixture(f_utils, url), urls)
+            for url, updated in zip(urls, updates):
+                if args.quiet:
+                    continue
+                if updated:
                     print(f"Updating: {f_utils.url_to_filename(url)}.txt")
-                f_utils.make_html_fixture(new_scraper_obj)
-            else:
-                if not args.quiet:
+                else:
                     print("HTML up to date: " +
                         f"{f_utils.url_to_filename(url)}.txt")
 
+    elif args.command == "replay":
+        server = ReplayServer(f_utils, args.host, args.port, args.latency,
+                              args.error_rate, args.error_status)
+        if not args.quiet:
+            print(f"Serving fixtures on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+
 if __name__ == "__main__":
     parser_args = configure_parser().parse_args()
     run(parser_args)
@@ -0,0 +1,61 @@
+import pytest
+
+from procyclingstats import Stage
+from procyclingstats.analytics import (cumulative_gaps, position_changes,
+                                       stages_matrix, table_to_columns,
+                                       team_classification, time_gaps)
+
+from .fixtures_utils import FixturesUtils
+
+np = pytest.importorskip("numpy")
+
+STAGE_URL = "race/tour-de-france/2018/stage-19"
+
+
+class TestAnalytics:
+    stage = FixturesUtils().get_scraper_object_from_fixture(Stage, STAGE_URL)
+
+    def test_time_gaps(self) -> None:
+        columns = table_to_columns(self.stage.results())
+        gaps = time_gaps(columns["time"])
+        assert gaps[0] == 0
+        assert gaps[1] == 19
+        # DNF riders have no gap
+        assert (gaps[columns["status"] != "DF"] == -1).all()
+        assert (gaps[columns["status"] == "DF"] >= 0).all()
+
+    def test_cumulative_gaps(self) -> None:
+        stage_1 = [{"rider_url": "a", "time": "1:00:00"},
+                   {"rider_url": "b", "time": "1:00:10"},
+                   {"rider_url": "c", "time": "1:00:20"}]
+        stage_2 = [{"rider_url": "b", "time": "1:00:00"},
+                   {"rider_url": "a", "time": "1:00:30"},
+                   {"rider_url": "c", "status": "DNF", "time": ""}]
+        riders, matrix = stages_matrix([stage_1, stage_2])
+        assert riders == ["a", "b", "c"]
+        assert cumulative_gaps(matrix).tolist() == \
+            [[0, 20], [10, 0], [20, -1]]
+
+    def test_position_changes(self) -> None:
+        columns = table_to_columns(self.stage.gc("rank", "prev_rank"))
+        changes = position_changes(columns["rank"], columns["prev_rank"])
+        assert changes.tolist() == [
+            prev_rank - rank if prev_rank and rank else 0
+            for rank, prev_rank in zip(columns["rank"].tolist(),
+                                       columns["prev_rank"].tolist())]
+
+    def test_team_classification(self) -> None:
+        team_urls = np.array(["x", "y", "x", "y", "x", "x", "z"],
+                             dtype=object)
+        seconds = np.array([10, 11, 12, 13, -1, 30, 1], dtype=np.int64)
+        assert team_classification(team_urls, seconds, top=2) == [
+            {"team_url": "x", "rank": 1, "time": "0:00:22"},
+            {"team_url": "y", "rank": 2, "time": "0:00:24"},
+        ]
+
+    def test_team_classification_without_team(self) -> None:
+        team_urls = np.array(["x", None, "x", None], dtype=object)
+        seconds = np.array([10, 1, 12, 2], dtype=np.int64)
+        assert team_classification(team_urls, seconds, top=2) == [
+            {"team_url": "x", "rank": 1, "time": "0:00:22"},
+        ]
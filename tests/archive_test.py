@@ -0,0 +1,45 @@
+from procyclingstats import HTMLArchive, Rider
+
+from .fixtures_utils import FixturesUtils
+
+RIDER_URL = "rider/alberto-contador"
+
+
+class TestHTMLArchive:
+    def test_content_deduplication(self, tmp_path) -> None:
+        archive = HTMLArchive(str(tmp_path))
+        hash1 = archive.put("https://example.com/a", b"<html>same</html>")
+        hash2 = archive.put("https://example.com/b", b"<html>same</html>")
+        assert hash1 == hash2
+        assert len(list((tmp_path / "objects").rglob("*.gz"))) == 1
+        # index is reloaded from disk
+        reopened = HTMLArchive(str(tmp_path))
+        assert reopened.get("https://example.com/b") == "<html>same</html>"
+
+    def test_load_and_reparse(self, tmp_path) -> None:
+        html = FixturesUtils().get_html_fixture(RIDER_URL)
+        archive = HTMLArchive(str(tmp_path))
+        archive.set(Rider.BASE_URL + RIDER_URL, html)  # type: ignore
+        rider = archive.load(Rider, RIDER_URL)
+        assert rider.relative_url() == RIDER_URL
+        [(url, parsed)] = list(archive.reparse(Rider, max_workers=1))
+        assert url == Rider.BASE_URL + RIDER_URL
+        assert parsed["name"] == rider.name()
+
+    def test_pack(self, tmp_path) -> None:
+        html = FixturesUtils().get_html_fixture(RIDER_URL)
+        archive = HTMLArchive(str(tmp_path / "archive"))
+        archive.set(Rider.BASE_URL + RIDER_URL, html)  # type: ignore
+        archive.set("https://example.com/a", "<html>a</html>")
+        archive.set("https://example.com/b", "<html>a</html>")
+        with archive.pack(str(tmp_path / "pages.pack")) as packed:
+            assert len(packed) == 3
+            assert packed.get("https://example.com/b") == "<html>a</html>"
+            assert packed.load(Rider, RIDER_URL).name() == \
+                archive.load(Rider, RIDER_URL).name()
+            [(_, parsed)] = list(packed.reparse(
+                Rider, [Rider.BASE_URL + RIDER_URL], max_workers=1))
+            assert parsed["name"]
+        # identical content is packed only once
+        assert (tmp_path / "pages.pack").stat().st_size == \
+            len(html.encode("utf-8")) + len(b"<html>a</html>")  # type: ignore
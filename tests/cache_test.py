@@ -0,0 +1,28 @@
+from procyclingstats import PageCache
+
+
+class TestPageCache:
+    def test_lru_eviction(self) -> None:
+        cache = PageCache(max_size=2)
+        cache.set("a", "<html>a</html>")
+        cache.set("b", "<html>b</html>")
+        # touch "a", so "b" is the least recently used page
+        assert cache.get("a") == "<html>a</html>"
+        cache.set("c", "<html>c</html>")
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+
+    def test_directory_persistence(self, tmp_path) -> None:
+        cache = PageCache(max_size=1, directory=str(tmp_path))
+        cache.set("a", "<html>a</html>")
+        cache.set("b", "<html>b</html>")
+        assert "a" in cache
+        assert PageCache(directory=str(tmp_path)).get("a") == "<html>a</html>"
+
+    def test_bytes(self, tmp_path) -> None:
+        cache = PageCache(directory=str(tmp_path))
+        cache.put("a", "<html>Pogačar</html>".encode("utf-8"))
+        assert cache.get_bytes("a") == "<html>Pogačar</html>".encode("utf-8")
+        assert cache.get("a") == "<html>Pogačar</html>"
+        assert PageCache(directory=str(tmp_path)).get_bytes("a") == \
+            "<html>Pogačar</html>".encode("utf-8")
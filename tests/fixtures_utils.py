@@ -84,6 +84,56 @@ class FixturesUtils:
         except FileNotFoundError:
             return None
 
+    def get(self, url: str) -> Optional[str]:
+        """
+        Gets HTML fixture with wanted absolute URL, so fixtures can be used as
+        a page source (e.g. of `ReplayServer`).
+
+        :param url: Absolute URL of wanted fixture.
+        :return: Fixture file content as a string. If file wasn't found None is
+        returned.
+        """
+        relative_url = "/".join(url.split("/")[3:]).strip("/")
+        return self.get_html_fixture(relative_url)
+
+    def get_fixtures_urls(self, scraper_class: Type[Scraper]) -> List[str]:
+        """
+        Gets URLs of all fixtures that have both HTML and data fixture and
+        which URL is valid for given ScraperClass.
+
+        :param ScraperClass: Class to get fixtures URLs of.
+        :return: List of relative URLs.
+        """
+        html_files_urls = self.get_urls_from_fixtures_dir("txt")
+        json_files_urls = set(self.get_urls_from_fixtures_dir("json"))
+        # sub-page fixtures are loaded together with their page's fixture
+        sub_pages = tuple(f"/{sub_page}"
+                          for sub_page in scraper_class._sub_pages.values())
+        # get URLs of all scraper objects that have both HTML and JSON file
+        return [url for url in html_files_urls if url in json_files_urls and
+                get_corresponding_scraping_class(url) == scraper_class and
+                not url.endswith(sub_pages)]
+
+    def get_scraper_object_from_fixture(self, scraper_class: Type[Scraper],
+                                        url: str) -> Scraper:
+        """
+        Creates scraper object of ScraperClass from HTML fixture with given
+        URL. Sub-pages of the object are set from their HTML fixtures when
+        available.
+
+        :param ScraperClass: Class to create object from.
+        :param url: Relative URL of the fixture.
+        :return: Scraper object ready for HTML parsing.
+        """
+        html = self.get_html_fixture(url)
+        # absolute URL is needed for proper relative_url() method
+        scraper_obj = scraper_class.from_html(url, html)  # type: ignore
+        for name, sub_page_url in scraper_obj.sub_page_urls().items():
+            sub_page_html = self.get(sub_page_url)
+            if sub_page_html is not None:
+                scraper_obj.set_sub_page(name, sub_page_html)
+        return scraper_obj
+
     def get_scraper_objects_from_fixtures(
             self, scraper_class: Type[Scraper]) -> List[Scraper]:
         """
@@ -93,24 +143,8 @@ class FixturesUtils:
         :param ScraperClass: Class to create objects from.
         :return: List with scraper objects ready for HTML parsing.
         """
-        html_files_urls = self.get_urls_from_fixtures_dir("txt")
-        json_files_urls = self.get_urls_from_fixtures_dir("json")
-        # get URLs of all scraper objects that have both HTML and JSON file
-        urls = [url for url in html_files_urls if url in json_files_urls]
-        objects_to_test = []
-        for url in urls:
-            # add scraper object if current fixture is it's fixture
-            if get_corresponding_scraping_class(url) == scraper_class:
-                # get HTML of scraper object from fixtures
-                html = self.get_html_fixture(url)
-                # add new scraper object that is ready for parsing to the list
-                scraper_obj = scraper_class.__new__(scraper_class)
-                # Convert relative URL to absolute URL for proper relative_url() method
-                from procyclingstats.scraper import Scraper
-                abs_url = f"{Scraper.BASE_URL}{url}"
-                scraper_obj._Scraper__init_with_url(abs_url, html, False)
-                objects_to_test.append(scraper_obj)
-        return objects_to_test
+        return [self.get_scraper_object_from_fixture(scraper_class, url)
+                for url in self.get_fixtures_urls(scraper_class)]
 
     def get_urls_from_fixtures_dir(self, file_type: str) -> List[str]:
         """
@@ -0,0 +1,94 @@
+import pytest
+
+from procyclingstats import GCEngine, Stage
+
+from .fixtures_utils import FixturesUtils
+
+pytest.importorskip("numpy")
+
+STAGE_1 = [
+    {"rider_url": "rider/a", "status": "DF", "time": "4:00:00",
+     "bonus": "0:00:10"},
+    {"rider_url": "rider/b", "status": "DF", "time": None, "bonus": "0:00:06"},
+    {"rider_url": "rider/c", "status": "DF", "time": "4:00:30",
+     "bonus": "0:00:00"},
+    {"rider_url": "rider/d", "status": "DF", "time": "4:01:00",
+     "bonus": "0:00:00"},
+]
+STAGE_2 = [
+    {"rider_url": "rider/c", "status": "DF", "time": "3:00:00",
+     "bonus": "0:00:00"},
+    {"rider_url": "rider/b", "status": "DF", "time": "3:00:04",
+     "bonus": "-0:00:20"},
+    {"rider_url": "rider/a", "status": "DF", "time": "3:00:40",
+     "bonus": "0:00:00"},
+    {"rider_url": "rider/d", "status": "DNF", "time": "", "bonus": "0:00:00"},
+]
+
+
+class TestGCEngine:
+    def test_add_stage(self) -> None:
+        engine = GCEngine()
+        engine.add_stage(STAGE_1)
+        assert [row["rider_url"] for row in engine.gc()] == \
+            ["rider/a", "rider/b", "rider/c", "rider/d"]
+        engine.add_stage(STAGE_2)
+        assert engine.gc() == [
+            {"rider_url": "rider/b", "rank": 1, "time": "7:00:18"},
+            {"rider_url": "rider/a", "rank": 2, "time": "7:00:30"},
+            {"rider_url": "rider/c", "rank": 3, "time": "7:00:30"},
+        ]
+        assert engine.stages_count == 2
+
+    def test_rider_joining_later(self) -> None:
+        engine = GCEngine()
+        engine.add_stage(STAGE_1[:2])
+        engine.add_stage(STAGE_2)
+        # rider/c and rider/d appear first in the second stage, so they
+        # don't have time of the whole race
+        assert engine.gc() == [
+            {"rider_url": "rider/b", "rank": 1, "time": "7:00:18"},
+            {"rider_url": "rider/a", "rank": 2, "time": "7:00:30"},
+        ]
+
+    def test_rider_missing_in_stage(self) -> None:
+        engine = GCEngine()
+        engine.add_stage(STAGE_1)
+        engine.add_stage(STAGE_2[1:])
+        # rider/c has no result of the second stage
+        assert engine.gc() == [
+            {"rider_url": "rider/b", "rank": 1, "time": "7:00:18"},
+            {"rider_url": "rider/a", "rank": 2, "time": "7:00:30"},
+        ]
+
+    def test_rider_joining_after_starting_gc(self) -> None:
+        engine = GCEngine([
+            {"rider_url": "rider/a", "rank": 1, "time": "3:59:50"},
+            {"rider_url": "rider/b", "rank": 2, "time": "3:59:54"},
+        ])
+        engine.add_stage(STAGE_2[1:3] + STAGE_2[:1])
+        assert [row["rider_url"] for row in engine.gc()] == \
+            ["rider/b", "rider/a"]
+
+    def test_compare(self) -> None:
+        engine = GCEngine()
+        engine.add_stage(STAGE_1)
+        gc = [
+            {"rider_url": "rider/a", "rank": 1, "time": "3:59:50"},
+            {"rider_url": "rider/b", "rank": 2, "time": "3:59:54"},
+            {"rider_url": "rider/d", "rank": 3, "time": "4:01:00"},
+        ]
+        assert engine.compare(gc) == [
+            {"rider_url": "rider/c", "rank": 3, "time": "4:00:30",
+             "expected_rank": None, "expected_time": None},
+            {"rider_url": "rider/d", "rank": 4, "time": "4:01:00",
+             "expected_rank": 3, "expected_time": "4:01:00"},
+        ]
+
+    def test_start_from_gc(self) -> None:
+        stage = FixturesUtils().get_scraper_object_from_fixture(
+            Stage, "race/tour-de-france/2018/stage-19")
+        gc = stage.gc("rider_url", "rank", "time")
+        engine = GCEngine(gc)
+        assert engine.compare(gc) == []
+        assert engine.gc()[0]["time"] == gc[0]["time"]
@@ -0,0 +1,28 @@
+from procyclingstats import RaceStartlist, ReplayServer, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+
+class TestFetchRiders:
+    f_utils = FixturesUtils()
+
+    def test_fetch_riders(self) -> None:
+        startlists = (
+            [{"rider_url": "rider/alberto-contador"},
+             {"rider_url": "rider/tadej-pogacar"}],
+            [{"rider_url": "rider/tadej-pogacar"},
+             {"rider_url": "rider/not-existing-rider"},
+             {"rider_url": None}],
+        )
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                riders = list(RaceStartlist.fetch_riders(*startlists,
+                                                         max_workers=2))
+            finally:
+                Scraper.BASE_URL = base_url
+            # every rider is requested once, invalid profiles are skipped
+            assert server.requests_count == 3
+        assert sorted(rider.relative_url() for rider in riders) == [
+            "rider/alberto-contador", "rider/tadej-pogacar"]
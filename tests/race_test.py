@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from procyclingstats import PageCache, Race, ReplayServer, Scraper
+from procyclingstats.errors import ExpectedParsingError
+
+from .fixtures_utils import FixturesUtils
+
+RACE_URL = "race/tour-de-france/2025"
+FINAL_5K_URL = "race/tour-de-france/2025/route/final-5k"
+
+
+class TestRaceSubPages:
+    f_utils = FixturesUtils()
+
+    def test_sub_page_from_fixture(self) -> None:
+        race = self.f_utils.get_scraper_object_from_fixture(Race, RACE_URL)
+        with open(f"tests/fixtures/"
+                  f"{self.f_utils.url_to_filename(FINAL_5K_URL)}.json") as f:
+            assert race.final_5k_stats() == json.load(f)
+        assert "final_5k_stats" in race.parse()
+
+    def test_parse_without_sub_page(self) -> None:
+        race = Race.from_html(RACE_URL, self.f_utils.get_html_fixture(RACE_URL))
+        assert race.sub_page_urls() == {
+            "final_5k": Scraper.BASE_URL + FINAL_5K_URL}
+        # object created from HTML doesn't request the sub-page
+        with pytest.raises(ExpectedParsingError):
+            race.final_5k_stats()
+        assert race.parse()["final_5k_stats"] is None
+        race.materialize()
+        with pytest.raises(ExpectedParsingError):
+            race.final_5k_stats()
+
+    def test_sub_page_requested_lazily(self) -> None:
+        with open(f"tests/fixtures/"
+                  f"{self.f_utils.url_to_filename(FINAL_5K_URL)}.json") as f:
+            final_5k_stats = json.load(f)
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                with Race(RACE_URL) as race:
+                    assert race.parse()["final_5k_stats"] is None
+                assert server.requests_count == 1
+                # materialized object requests the sub-page on direct call
+                assert race.final_5k_stats() == final_5k_stats
+                assert race.final_5k_stats("rank") == [
+                    {"rank": row["rank"]} for row in final_5k_stats]
+                assert server.requests_count == 2
+                assert race.parse()["final_5k_stats"] == final_5k_stats
+            finally:
+                Scraper.BASE_URL = base_url
+
+    def test_sub_page_requested_once(self) -> None:
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                [race] = Race.fetch_many([RACE_URL], sub_pages=True)
+                assert server.requests_count == 2
+                race.final_5k_stats()
+                race.final_5k_stats()
+                assert "final_5k_stats" in race.parse()
+                assert server.requests_count == 2
+            finally:
+                Scraper.BASE_URL = base_url
+
+
+class TestFetchEditions:
+    f_utils = FixturesUtils()
+
+    def test_cached_editions_kept(self) -> None:
+        base_url = Scraper.BASE_URL
+        race = self.f_utils.get_scraper_object_from_fixture(Race, RACE_URL)
+        cached_url = "race/tour-de-france/2022"
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            Scraper.page_cache = PageCache()
+            Scraper.page_cache.set(server.url + cached_url,
+                                   self.f_utils.get_html_fixture(cached_url))
+            try:
+                editions = race.fetch_editions(2022, 2025, skip_cached=True)
+                # 2023, 2024 and 2025 are requested, 2022 is from the cache
+                assert server.requests_count == 3
+            finally:
+                Scraper.BASE_URL = base_url
+                Scraper.page_cache = None
+        assert list(editions) == [2025, 2022]
+        assert editions[2022]["year"] == 2022
+        assert editions[2025]["year"] == 2025
+
+
+class TestCachedStages:
+    f_utils = FixturesUtils()
+
+    def setup_method(self) -> None:
+        Race.clear_cached_stages()
+
+    def teardown_method(self) -> None:
+        Race.clear_cached_stages()
+
+    def test_cached_stages(self) -> None:
+        race_url = "race/tour-de-france/2022"
+        stages = self.f_utils.get_scraper_object_from_fixture(
+            Race, race_url).stages()
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                cached_stages = Race.cached_stages(race_url)
+                assert cached_stages == stages
+                # returned rows are copies
+                cached_stages[0]["profile_icon"] = None
+                assert Race.cached_stages(
+                    server.url + race_url + "/") == stages
+                assert server.requests_count == 1
+            finally:
+                Scraper.BASE_URL = base_url
+
+    def test_cached_stages_of_other_base_url(self) -> None:
+        race_url = "race/tour-de-france/2022"
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server, \
+                ReplayServer(self.f_utils) as other_server:
+            try:
+                Scraper.BASE_URL = server.url
+                Race.cached_stages(race_url)
+                # memo is keyed by absolute URL, so the other server is
+                # requested too
+                Scraper.BASE_URL = other_server.url
+                Race.cached_stages(race_url)
+                Race.cached_stages(race_url)
+                assert server.requests_count == 1
+                assert other_server.requests_count == 1
+                Race.clear_cached_stages()
+                Race.cached_stages(race_url)
+                assert other_server.requests_count == 2
+            finally:
+                Scraper.BASE_URL = base_url
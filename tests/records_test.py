@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+
+from selectolax.parser import HTMLParser
+
+from procyclingstats import Ranking, RiderResults, Stage, TableParser
+from procyclingstats.records import (ROW_CLASSES, RiderResultRow,
+                                     StageResultRow, records, row_class)
+
+from .fixtures_utils import FixturesUtils
+
+RANKING_TABLES = (
+    ("rankings.php?date=2021-12-31&p=me&s=season-individual",
+     "individual_ranking", ()),
+    ("rankings.php?date=2021-12-31&p=me&s=season-teams", "team_ranking", ()),
+    ("rankings.php?date=2021-12-31&p=me&s=season-nations",
+     "nations_ranking", ()),
+    ("rankings.php?date=2020-12-31&p=me&s=races", "races_ranking", ()),
+    ("rankings.php?date=2020-12-31&p=me&s=wins-individual",
+     "individual_wins_ranking", ("rider_url", "rank")),
+    ("rankings.php?date=2021-12-31&p=me&s=wins-teams",
+     "teams_wins_ranking", ("team_url", "rank")),
+    ("rankings.php?date=2020-12-31&p=me&s=wins-nations",
+     "nations_wins_ranking", ("nation_url", "rank")),
+    ("rankings.php?date=2021-12-31&p=me&s=distance", "distance_ranking", ()),
+    ("rankings.php?date=2021-12-31&p=me&s=racedays", "racedays_ranking", ()),
+)
+
+
+class TestRecords:
+    f_utils = FixturesUtils()
+
+    def test_records(self) -> None:
+        stage = self.f_utils.get_scraper_object_from_fixture(
+            Stage, "race/tour-de-france/2018/stage-19")
+        rows = records(stage.results)
+        assert all(isinstance(row, StageResultRow) for row in rows)
+        assert [row.as_dict() for row in rows] == stage.results()
+        [partial_row, *_] = records(stage.results, "rider_url", "rank")
+        assert partial_row.rank == 1 and partial_row.time is None
+        assert pickle.loads(pickle.dumps(partial_row)) == partial_row
+
+    def test_keyword_field(self) -> None:
+        rider_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, "rider/alberto-contador/results")
+        [row, *_] = records(rider_results.results)
+        assert isinstance(row, RiderResultRow)
+        assert row.class_ == rider_results.results("class")[0]["class"]
+
+    def test_validation(self) -> None:
+        point_row = row_class("PointRow", ("x", "y"))
+        assert not hasattr(point_row(x=1, y=2), "__dict__")
+        with pytest.raises(ValueError):
+            point_row(x=1, z=2)
+
+    def test_ranking_records(self) -> None:
+        for url, method_name, args in RANKING_TABLES:
+            ranking = self.f_utils.get_scraper_object_from_fixture(
+                Ranking, url)
+            row_cls = ROW_CLASSES[(Ranking, method_name)]
+            table = getattr(ranking, method_name)(*args)
+            rows = records(getattr(ranking, method_name), *args)
+            assert rows == [row_cls(**row) for row in table]
+            assert all(type(row) is row_cls for row in rows)
+
+    def test_materialized_records(self) -> None:
+        url, method_name, _ = RANKING_TABLES[0]
+        ranking = self.f_utils.get_scraper_object_from_fixture(Ranking, url)
+        rows = records(ranking.individual_ranking)
+        ranking.materialize(method_name)
+        assert records(ranking.individual_ranking) == rows
+
+    def test_table_parser_builds_rows(self) -> None:
+        html = HTMLParser(
+            "<table><thead><tr><th>Rnk</th><th>Rider</th></tr></thead><tbody>"
+            "<tr><td>1</td><td><a href='rider/a'>A</a></td></tr>"
+            "<tr><td>2</td><td><a href='rider/b'>B</a></td></tr>"
+            "</tbody></table>")
+        with TableParser.building_rows(StageResultRow):
+            table_parser = TableParser(html.css_first("table"))
+        table_parser.parse(["rank", "rider_url"])
+        table_parser.extend_table("status", ["DF", "DNF"])
+        assert table_parser.table == [
+            StageResultRow(rank=1, rider_url="rider/a", status="DF"),
+            StageResultRow(rank=2, rider_url="rider/b", status="DNF")]
+        assert table_parser.table[1]["status"] == "DNF"
+        with pytest.raises(ValueError):
+            StageResultRow.from_columns({"invalid_field": [1]}, 1)
+        table_parser = TableParser(html.css_first("table"))
+        table_parser.parse(["rank"])
+        assert table_parser.table == [{"rank": 1}, {"rank": 2}]
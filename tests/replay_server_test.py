@@ -0,0 +1,42 @@
+import pytest
+import requests
+
+from procyclingstats import ReplayServer, Rider, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+RIDER_URL = "rider/alberto-contador"
+
+
+class TestReplayServer:
+    def test_scraping_from_server(self) -> None:
+        base_url = Scraper.BASE_URL
+        with ReplayServer(FixturesUtils()) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                rider = Rider(RIDER_URL)
+                assert rider.url == server.url + RIDER_URL
+                assert rider.relative_url() == RIDER_URL
+                assert rider.name() == "Alberto  Contador"
+                with pytest.raises(ValueError):
+                    Rider("rider/not-existing-rider")
+            finally:
+                Scraper.BASE_URL = base_url
+
+    def test_error_injection(self) -> None:
+        with ReplayServer(FixturesUtils(), error_rate=1,
+                          error_status=500) as server:
+            response = requests.get(server.url + RIDER_URL)
+            assert response.status_code == 500
+            assert server.requests_count == 1
+
+    def test_head_request(self) -> None:
+        with ReplayServer(FixturesUtils()) as server:
+            get_response = requests.get(server.url + RIDER_URL)
+            head_response = requests.head(server.url + RIDER_URL)
+            assert head_response.status_code == 200
+            assert head_response.content == b""
+            assert (head_response.headers["Content-Length"] ==
+                    str(len(get_response.content)))
+            assert requests.head(
+                server.url + "rider/not-existing-rider").status_code == 404
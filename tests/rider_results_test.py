@@ -0,0 +1,122 @@
+from typing import Optional
+
+import pytest
+
+from procyclingstats import ReplayServer, RiderResults, Scraper
+from procyclingstats.errors import ExpectedParsingError
+
+from .fixtures_utils import FixturesUtils
+
+POGACAR_URL = "rider/tadej-pogacar/results"
+CONTADOR_URL = "rider/alberto-contador/results"
+FIELDS = ("stage_url", "stage_name", "rank")
+POGACAR_2025_URL = "rider.php?xseason=2025&pxseason=equal&offset=0" \
+    "&id=tadej-pogacar&p=results"
+
+
+class CareerPages:
+    """
+    Page source of `fetch_career` requests. The first page of 2025 season is
+    Pogačar's results page, all other pages are Contador's one, so rows of
+    other pages repeat.
+    """
+
+    def __init__(self, f_utils: FixturesUtils,
+                 missing_season: Optional[str] = None) -> None:
+        self.pogacar_html = f_utils.get_html_fixture(POGACAR_URL)
+        self.contador_html = f_utils.get_html_fixture(CONTADOR_URL)
+        self.missing_season = missing_season
+        self.requested_urls = []
+
+    def get(self, url: str) -> Optional[str]:
+        self.requested_urls.append(url)
+        if f"xseason={self.missing_season}&" in url:
+            return None
+        if "xseason=2025&" in url and "offset=0&" in url:
+            return self.pogacar_html
+        return self.contador_html
+
+
+class TestFetchCareer:
+    f_utils = FixturesUtils()
+
+    def test_fetch_career(self) -> None:
+        rider_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, POGACAR_URL)
+        contador_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, CONTADOR_URL)
+        source = CareerPages(self.f_utils)
+        base_url = Scraper.BASE_URL
+        with ReplayServer(source) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                table = rider_results.fetch_career(*FIELDS)
+            finally:
+                Scraper.BASE_URL = base_url
+        seasons = [option["value"] for option in rider_results.seasons_select()
+                   if option["value"]]
+        # first page of every season, other pages of 2025 season listed by
+        # Pogačar's page and other pages of seasons listed by Contador's page
+        assert len(source.requested_urls) == len(seasons) + \
+            len(rider_results.pages_select()) - 1 + \
+            (len(seasons) - 1) * (len(contador_results.pages_select()) - 1)
+        # rows repeated on other pages are added only once, in page order
+        assert table == rider_results.results(*FIELDS) + \
+            contador_results.results(*FIELDS)
+
+    def test_fetch_career_from_season_page(self) -> None:
+        rider_results = RiderResults.from_html(
+            POGACAR_2025_URL, self.f_utils.get_html_fixture(POGACAR_URL))
+        contador_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, CONTADOR_URL)
+        source = CareerPages(self.f_utils, missing_season="2020")
+        base_url = Scraper.BASE_URL
+        with ReplayServer(source) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                table = rider_results.fetch_career(*FIELDS)
+            finally:
+                Scraper.BASE_URL = base_url
+        requested_urls = [url.split("/", 3)[-1]
+                          for url in source.requested_urls]
+        # the loaded season page isn't requested again
+        assert POGACAR_2025_URL not in requested_urls
+        seasons = [option["value"] for option in rider_results.seasons_select()
+                   if option["value"]]
+        # other pages of the missing season aren't known
+        assert len(requested_urls) == len(seasons) - 1 + \
+            len(rider_results.pages_select()) - 1 + \
+            (len(seasons) - 2) * (len(contador_results.pages_select()) - 1)
+        assert table == rider_results.results(*FIELDS) + \
+            contador_results.results(*FIELDS)
+
+    def test_fetch_career_of_other_table(self) -> None:
+        url = "rider.php?topn=1&km=5&id=fabian-cancellara&p=results" \
+            "&s=final-5k-analysis"
+        rider_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, url)
+        with pytest.raises(ExpectedParsingError):
+            rider_results.fetch_career()
+
+
+class TestFetchMany:
+    f_utils = FixturesUtils()
+
+    def test_fetch_many(self) -> None:
+        urls = [CONTADOR_URL, "rider/not-existing-rider/results", POGACAR_URL]
+        base_url = Scraper.BASE_URL
+        with ReplayServer(self.f_utils) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                fetched = RiderResults.fetch_many(urls, max_workers=3,
+                                                  skip_invalid=True)
+                with pytest.raises(ValueError):
+                    RiderResults.fetch_many(urls, max_workers=3)
+            finally:
+                Scraper.BASE_URL = base_url
+        # objects keep order of given URLs
+        assert [obj.relative_url() for obj in fetched] == \
+            [CONTADOR_URL, POGACAR_URL]
+        assert fetched[1].results() == \
+            self.f_utils.get_scraper_object_from_fixture(
+                RiderResults, POGACAR_URL).results()
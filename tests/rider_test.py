@@ -0,0 +1,33 @@
+from procyclingstats import PageCache, Rider, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+RIDER_URL = "rider/tadej-pogacar"
+
+
+class TestRiderInfoBox:
+    f_utils = FixturesUtils()
+
+    def test_info_box_parsed_once(self) -> None:
+        rider = Rider.from_html(RIDER_URL,
+                                self.f_utils.get_html_fixture(RIDER_URL))
+        record = rider._info_box()  # pylint: disable=protected-access
+        assert record == {"birthdate": "1998-9-21", "place_of_birth": "Klanec",
+                          "weight": 66.0, "height": 1.76,
+                          "nationality": "SI"}
+        assert rider._info_box() is record  # pylint: disable=protected-access
+        assert rider.birthdate() == "1998-9-21"
+        assert rider.nationality() == "SI"
+
+    def test_info_box_reset_on_update_html(self) -> None:
+        rider = Rider.from_html(RIDER_URL,
+                                self.f_utils.get_html_fixture(RIDER_URL))
+        assert rider.nationality() == "SI"
+        Scraper.page_cache = PageCache()
+        Scraper.page_cache.set(rider.url, self.f_utils.get_html_fixture(
+            "rider/alberto-contador"))
+        try:
+            rider.update_html()
+        finally:
+            Scraper.page_cache = None
+        assert rider.nationality() == "ES"
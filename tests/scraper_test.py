@@ -0,0 +1,230 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from selectolax.parser import HTMLParser
+
+from procyclingstats import (Race, Ranking, ReplayServer, Rider, Scraper,
+                             Stage, Team)
+from procyclingstats.errors import ExpectedParsingError
+from procyclingstats.scraper import _response_html
+
+from .fixtures_utils import FixturesUtils
+
+RACE_URL = "race/tour-de-france/2025"
+
+
+class TestInfoList:
+    f_utils = FixturesUtils()
+
+    def test_info_list_indexed_once(self) -> None:
+        race = Race.from_html(RACE_URL, self.f_utils.get_html_fixture(RACE_URL))
+        info_list = race._info_list()  # pylint: disable=protected-access
+        assert list(info_list)[:4] == ["Startdate", "Enddate", "Category",
+                                       "UCI Tour"]
+        assert race._info_list() is info_list # pylint: disable=protected-access
+        assert race.startdate() == "2025-07-05"
+        assert race.uci_tour() == "UCI WorldTour"
+
+    def test_legacy_info_list(self) -> None:
+        url = "team/banesto-1997"
+        team = Team.from_html(url, self.f_utils.get_html_fixture(url))
+        assert team.status() == "TT1"
+        assert team.abbreviation() == "BAN"
+        assert team.bike() == "Pinarello"
+
+
+class TestLayout:
+    f_utils = FixturesUtils()
+
+    def test_layout_detected_on_set_up(self) -> None:
+        race = Race.from_html(RACE_URL, self.f_utils.get_html_fixture(RACE_URL))
+        assert race._page_layout == "new"  # pylint: disable=protected-access
+        url = "team/banesto-1997"
+        team = Team.from_html(url, self.f_utils.get_html_fixture(url))
+        assert team._page_layout == "legacy"  # pylint: disable=protected-access
+        assert team.name() == "Banesto"
+        assert team.nationality() == "ES"
+
+
+class TestSliceHtml:
+    f_utils = FixturesUtils()
+
+    def test_sliced_html_parsed_equally(self) -> None:
+        html = self.f_utils.get_html_fixture(RACE_URL)
+        race = Race.from_html(RACE_URL, html)
+        Scraper.slice_html = True
+        try:
+            sliced_race = Race.from_html(RACE_URL, html)
+            sliced_race_from_bytes = Race.from_html(RACE_URL, html.encode())
+        finally:
+            Scraper.slice_html = False
+        assert race.html.css_first("div.footer") is not None
+        assert sliced_race.html.css_first("div.footer") is None
+        assert sliced_race.parse() == race.parse()
+        assert sliced_race_from_bytes.name() == race.name()
+
+    def test_invalid_sliced_html(self) -> None:
+        html = ("<html><header></header><div class='content'>"
+                "<div class='page-title'><div class='main'>"
+                "<h1>Page not found</h1></div></div></div>"
+                "<div class=\"footer\"></div></html>")
+        Scraper.slice_html = True
+        try:
+            with pytest.raises(ValueError):
+                Race.from_html(RACE_URL, html)
+        finally:
+            Scraper.slice_html = False
+
+
+class TestResponseHtml:
+    @staticmethod
+    def _response(content: bytes, content_type: str) -> requests.Response:
+        response = requests.Response()
+        response._content = content  # pylint: disable=protected-access
+        response.headers["Content-Type"] = content_type
+        return response
+
+    def test_utf8_content_kept(self) -> None:
+        html = "<html>Pogačar</html>".encode("utf-8")
+        response = self._response(html, "text/html; charset=utf-8")
+        assert _response_html(response) is html
+        assert _response_html(self._response(html, "text/html")) is html
+
+    @staticmethod
+    def _text(html: bytes) -> str:
+        return HTMLParser(html).css_first("p").text()
+
+    def test_other_encoding_transcoded(self) -> None:
+        html = "<html><p>Pogačar Žiga</p></html>".encode("cp1250")
+        response = self._response(html, "text/html; charset=windows-1250")
+        assert self._text(_response_html(response)) == "Pogačar Žiga"
+
+    def test_meta_charset_rewritten(self) -> None:
+        for meta in ("<meta charset='windows-1250'>",
+                     "<meta http-equiv='Content-Type' "
+                     "content='text/html; charset=windows-1250'>"):
+            html = (f"<html><head>{meta}</head><body><p>Pogačar Žiga</p>"
+                    "</body></html>").encode("cp1250")
+            for content_type in ("text/html",
+                                 "text/html; charset=windows-1250"):
+                html_bytes = _response_html(self._response(html, content_type))
+                assert self._text(html_bytes) == "Pogačar Žiga"
+                assert b"windows-1250" not in html_bytes
+
+
+class TestHttpSession:
+    f_utils = FixturesUtils()
+
+    def test_session_shared(self) -> None:
+        # pylint: disable=protected-access
+        session = Scraper._http_session()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(
+                lambda _: Scraper._http_session(), range(8)))
+        assert all(other is session for other in sessions)
+
+    def test_pages_fetched_through_session(self, monkeypatch) -> None:
+        session = Scraper._http_session()  # pylint: disable=protected-access
+        session_get = session.get
+        requests_made = []
+
+        def get(url, **kwargs):
+            requests_made.append((url, kwargs.get("timeout")))
+            return session_get(url, **kwargs)
+
+        with ReplayServer(self.f_utils) as server:
+            monkeypatch.setattr(session, "get", get)
+            monkeypatch.setattr(Scraper, "BASE_URL", server.url)
+            assert Race(RACE_URL).startdate() == "2025-07-05"
+        assert requests_made == [(server.url + RACE_URL,
+                                  Scraper.REQUEST_TIMEOUT)]
+
+
+class TestFetching:
+    f_utils = FixturesUtils()
+    urls = ["rider/alberto-contador", "rider/not-existing-rider",
+            "rider/tadej-pogacar"]
+
+    def test_iter_fetch(self) -> None:
+        with ReplayServer(self.f_utils) as server:
+            base_url = Scraper.BASE_URL
+            Scraper.BASE_URL = server.url
+            try:
+                riders = list(Rider.iter_fetch(self.urls, max_workers=3,
+                                               skip_invalid=True))
+                with pytest.raises(ValueError):
+                    list(Rider.iter_fetch(self.urls, max_workers=3))
+            finally:
+                Scraper.BASE_URL = base_url
+        assert sorted(rider.relative_url() for rider in riders) == [
+            "rider/alberto-contador", "rider/tadej-pogacar"]
+
+    def test_create_or_skip(self) -> None:
+        # pylint: disable=protected-access
+        with ReplayServer(self.f_utils) as server:
+            base_url = Scraper.BASE_URL
+            Scraper.BASE_URL = server.url
+            try:
+                assert Rider._create_or_skip(self.urls[1], True) is None
+                with pytest.raises(ValueError):
+                    Rider._create_or_skip(self.urls[1], False)
+                race = Race._create_or_skip(RACE_URL, False, sub_pages=True)
+                # the race page and its final-5k sub-page
+                assert server.requests_count == 4
+                assert race.parse()["final_5k_stats"]
+            finally:
+                Scraper.BASE_URL = base_url
+
+
+class TestMaterialize:
+    f_utils = FixturesUtils()
+
+    def test_materialize(self) -> None:
+        url = "race/tour-de-france/2022/stage-21"
+        stage = self.f_utils.get_scraper_object_from_fixture(Stage, url)
+        parsed = stage.parse()
+        results = stage.results("rider_url", "rank")
+        assert stage.materialize() is stage
+        with pytest.raises(AttributeError):
+            stage.html  # pylint: disable=pointless-statement
+        assert stage.parse() == parsed
+        assert stage.results("rider_url", "rank") == results
+        assert stage.results("rider_url", limit=2) == [
+            {"rider_url": row["rider_url"]} for row in results[:2]]
+        with pytest.raises(ValueError):
+            stage.results("invalid_field")
+
+    def test_materialize_releases_html(self) -> None:
+        def parsers_count() -> int:
+            gc.collect()
+            return sum(isinstance(obj, HTMLParser) for obj in gc.get_objects())
+
+        url = "rankings.php?date=2021-12-31&p=me&s=season-teams"
+        count = parsers_count()
+        ranking = self.f_utils.get_scraper_object_from_fixture(Ranking, url)
+        ranking.materialize()
+        assert parsers_count() == count
+        # methods of other ranking types raised while materializing
+        with pytest.raises(ExpectedParsingError):
+            ranking.individual_ranking()
+        assert ranking.team_ranking()
+
+    def test_materialize_methods(self) -> None:
+        team = Team.from_html("team/banesto-1997",
+                              self.f_utils.get_html_fixture("team/banesto-1997"))
+        team.materialize("name", "wins_count")
+        assert team.parse() == {"name": "Banesto",
+                                "wins_count": team.wins_count()}
+        with pytest.raises(AttributeError):
+            team.bike()
+        with pytest.raises(ValueError):
+            team.materialize("update_html")
+
+    def test_context_manager(self) -> None:
+        with Race.from_html(RACE_URL,
+                            self.f_utils.get_html_fixture(RACE_URL)) as race:
+            assert race.html is not None
+        assert race.startdate() == "2025-07-05"
+        assert race._html is None  # pylint: disable=protected-access
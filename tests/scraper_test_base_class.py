@@ -1,4 +1,6 @@
-from typing import Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple, Type
 
 from procyclingstats import Scraper
 
@@ -23,6 +25,21 @@ def method_test(correct_method: Any, parsed_method: Any):
         assert bool(parsed_method) == bool(correct_method)
 
 
+def parse_fixture(scraper_class: Type[Scraper], url: str
+                  ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Parses HTML fixture with given URL and loads corresponding data fixture.
+    Defined on module level, so it can be run in worker processes.
+
+    :param scraper_class: Class to create scraper object from.
+    :param url: Relative URL of the fixture.
+    :return: Tuple of parsed data and data fixture.
+    """
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    obj = f_utils.get_scraper_object_from_fixture(scraper_class, url)
+    return obj.parse(), f_utils.get_data_fixture(url)
+
+
 class ScraperTestBaseClass:
     """
     Base class for scraper classes testing. Scraper testing class that extends
@@ -30,6 +47,8 @@ class ScraperTestBaseClass:
     it's testing e.g. `TestRider` should override to `Rider`.
     """
     ScraperClass = Scraper
+    parsing_workers: Optional[int] = None
+    """Count of processes fixtures are parsed in, defaults to CPU count."""
 
     def test_parser(self, subtests) -> None:
         """
@@ -40,21 +59,18 @@ class ScraperTestBaseClass:
         :param subtests: Subtests module, passed by pytest.
         """
         f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
-        objects_to_test = f_utils.get_scraper_objects_from_fixtures(
-            self.ScraperClass)
-        parsed_data = []
-        correct_data = []
-        urls = []
-        for obj in objects_to_test:
-            parsed = obj.parse()
-            correct = f_utils.get_data_fixture(obj.relative_url())
-            # dicts with parsed data has same keys
-            # assert parsed.keys() == correct.keys() # type: ignore
-            print(obj.relative_url())
-            parsed_data.append(parsed)
-            correct_data.append(correct)
-            urls.append(obj.relative_url())
-            
+        urls = f_utils.get_fixtures_urls(self.ScraperClass)
+        max_workers = min(self.parsing_workers or os.cpu_count() or 1,
+                          len(urls))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    parse_fixture, [self.ScraperClass] * len(urls), urls))
+        else:
+            results = [parse_fixture(self.ScraperClass, url) for url in urls]
+        parsed_data = [parsed for parsed, _ in results]
+        correct_data = [correct for _, correct in results]
+
         assert correct_data[0].keys() == parsed_data[0].keys()
 
         for method in correct_data[0].keys():
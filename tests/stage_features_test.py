@@ -0,0 +1,118 @@
+import os
+
+from selectolax.parser import HTMLParser
+
+from procyclingstats import Race, ReplayServer, Scraper, StageFeatures
+from procyclingstats.replay_server import UNAVAILABLE_HTML
+
+from .fixtures_utils import FixturesUtils
+
+ORIGIN = "https://www.procyclingstats.com/"
+STAGE_URL = "race/tour-de-france/2022/stage-1"
+IMAGE_URL = "images/profiles/tour-de-france-2022-stage-1.jpg"
+STAGE_HTML = ("<html><body><div class=\"page-title\"><div class=\"main\">"
+              "<h1>Stage 1</h1></div></div><div class=\"mt10\">"
+              "<span class=\"table-cont\"><ul class=\"list\"><li><div><a>"
+              f"<img src=\"{IMAGE_URL}\"></a></div></li></ul></span></div>"
+              "</body></html>")
+IMAGE = bytes(range(256)) * 8
+PAGES = {ORIGIN + STAGE_URL: STAGE_HTML, ORIGIN + IMAGE_URL: IMAGE}
+
+
+class TestProfileImageDownload:
+    def test_download_profile_image(self, tmp_path) -> None:
+        output_path = str(tmp_path / "profile.jpg")
+        base_url = Scraper.BASE_URL
+        with ReplayServer(PAGES) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                stage_features = StageFeatures.from_html(STAGE_URL,
+                                                         STAGE_HTML)
+                assert stage_features.download_profile_image(output_path)
+                with open(output_path, "rb") as image:
+                    assert image.read() == IMAGE
+                assert server.requests_count == 1
+                # complete image is only checked by HEAD request
+                assert stage_features.download_profile_image(output_path)
+                assert server.requests_count == 2
+                assert os.listdir(tmp_path) == ["profile.jpg"]
+            finally:
+                Scraper.BASE_URL = base_url
+
+    def test_failed_head_response_not_trusted(self, tmp_path) -> None:
+        output_path = str(tmp_path / "profile.jpg")
+        base_url = Scraper.BASE_URL
+        with ReplayServer(PAGES, error_rate=1) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                stage_features = StageFeatures.from_html(STAGE_URL,
+                                                         STAGE_HTML)
+                # partial file with the same size as the error response
+                with open(output_path, "wb") as image:
+                    image.write(IMAGE[:len(UNAVAILABLE_HTML)])
+                assert not stage_features.download_profile_image(output_path)
+            finally:
+                Scraper.BASE_URL = base_url
+
+    def test_download_profile_images(self, tmp_path) -> None:
+        base_url = Scraper.BASE_URL
+        with ReplayServer(PAGES) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                downloaded = StageFeatures.download_profile_images(
+                    [STAGE_URL, "race/tour-de-france/2022/stage-2"],
+                    str(tmp_path), max_workers=2)
+            finally:
+                Scraper.BASE_URL = base_url
+        assert downloaded == {STAGE_URL: True,
+                              "race/tour-de-france/2022/stage-2": False}
+        assert os.listdir(tmp_path) == [
+            "race_tour-de-france_2022_stage-1.jpg"]
+
+    def test_download_profile_images_unreachable(self, tmp_path) -> None:
+        base_url = Scraper.BASE_URL
+        with ReplayServer(PAGES) as server:
+            pass
+        # the server is closed, so the stage page request fails
+        Scraper.BASE_URL = server.url
+        try:
+            downloaded = StageFeatures.download_profile_images(
+                [STAGE_URL], str(tmp_path))
+        finally:
+            Scraper.BASE_URL = base_url
+        assert downloaded == {STAGE_URL: False}
+        assert not os.listdir(tmp_path)
+
+
+class TestProfileFromRacePage:
+    f_utils = FixturesUtils()
+
+    def setup_method(self) -> None:
+        Race.clear_cached_stages()
+
+    def teardown_method(self) -> None:
+        Race.clear_cached_stages()
+
+    def test_stage_matched_by_url(self) -> None:
+        # pylint: disable=protected-access
+        race_url = "race/tour-de-france/2022"
+        race_html = HTMLParser(self.f_utils.get_html_fixture(race_url))
+        # without the first stage, stage numbers don't match table positions
+        # (as in races with prologue)
+        for table in race_html.css("table.basic"):
+            if "Stage" in table.text() and "Date" in table.text():
+                table.css_first("tbody > tr").decompose()
+                break
+        base_url = Scraper.BASE_URL
+        with ReplayServer({ORIGIN + race_url: race_html.html}) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                icons = {
+                    stage: StageFeatures.from_html(
+                        f"{race_url}/{stage}", STAGE_HTML
+                    )._get_profile_from_race_page()
+                    for stage in ("stage-6", "stage-12")}
+                assert server.requests_count == 1
+            finally:
+                Scraper.BASE_URL = base_url
+        assert icons == {"stage-6": "p3", "stage-12": "p5"}
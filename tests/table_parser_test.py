@@ -0,0 +1,100 @@
+from selectolax.parser import HTMLParser
+
+from procyclingstats import (Race, RaceClimbs, RaceStartlist, RiderResults,
+                             Stage, TableParser, Team)
+
+from .fixtures_utils import FixturesUtils
+
+STAGE_URLS = ("race/tour-de-france/2018/stage-19",
+              "race/tour-de-france/2018/stage-3")
+
+
+class TestTableParser:
+    f_utils = FixturesUtils()
+
+    def _results(self):
+        return [self.f_utils.get_scraper_object_from_fixture(
+            Stage, url).results("rider_url", "team_url", "nationality")
+            for url in STAGE_URLS]
+
+    def test_intern_strings(self) -> None:
+        table1, table2 = self._results()
+        TableParser.intern_strings = True
+        try:
+            interned_table1, interned_table2 = self._results()
+        finally:
+            TableParser.intern_strings = False
+        assert interned_table1 == table1 and interned_table2 == table2
+        urls = {row["rider_url"]: row["rider_url"] for row in interned_table1}
+        shared = [row["rider_url"] for row in interned_table2
+                  if row["rider_url"] in urls]
+        assert shared
+        assert all(url is urls[url] for url in shared)
+
+    def test_rider_urls_aligned_with_rows(self) -> None:
+        html = HTMLParser(
+            "<table><tbody>"
+            "<tr><td>1</td><td><a href='rider/a'>A</a></td></tr>"
+            "<tr><td>2</td><td>-</td></tr>"
+            "<tr><td>3</td><td><a href='rider/c'>C</a> "
+            "<a href='rider/d'>D</a></td></tr>"
+            "</tbody></table>")
+        table_parser = TableParser(html.css_first("table"))
+        table_parser.parse(["rider_url", "rider_name"])
+        assert table_parser.table == [
+            {"rider_url": "rider/a", "rider_name": "A"},
+            {"rider_url": "", "rider_name": ""},
+            {"rider_url": "rider/c", "rider_name": "C"},
+        ]
+
+    def test_stage_urls_and_names(self) -> None:
+        html = HTMLParser(
+            "<table><thead><tr><th>Date</th><th>Stage</th></tr></thead><tbody>"
+            "<tr><td>1.7</td><td><a href='race/tdf/2022/stage-1'>S1</a>"
+            "</td></tr>"
+            "<tr><td>2.7</td><td><span data-url='race/tdf/2022/stage-2'>S2"
+            "</span></td></tr>"
+            "<tr><td>3.7</td><td>Rest day</td></tr>"
+            "</tbody></table>")
+        table_parser = TableParser(html.css_first("table"))
+        table_parser.parse(["stage_url", "stage_name"])
+        assert table_parser.table == [
+            {"stage_url": "race/tdf/2022/stage-1", "stage_name": "S1"},
+            {"stage_url": "race/tdf/2022/stage-2", "stage_name": "S2"},
+            {"stage_url": None, "stage_name": None},
+        ]
+
+    def test_limit(self) -> None:
+        for url in STAGE_URLS:
+            stage = self.f_utils.get_scraper_object_from_fixture(Stage, url)
+            limited_stage = self.f_utils.get_scraper_object_from_fixture(
+                Stage, url)
+            assert limited_stage.results(limit=10) == stage.results()[:10]
+            assert limited_stage.gc(limit=10) == stage.gc()[:10]
+            assert limited_stage.teams(limit=0) == []
+
+    def test_limit_other_tables(self) -> None:
+        for scraper_class, method_name, url in (
+                (RiderResults, "results", "rider/tadej-pogacar/results"),
+                (Team, "riders", "team/etixx-quick-step-2015"),
+                (Race, "stages", "race/tour-de-france/2022"),
+                (RaceStartlist, "startlist",
+                 "race/tour-de-france/2022/startlist"),
+                (RaceStartlist, "startlist",
+                 "race/tour-de-pologne/2009/startlist"),
+                (RaceClimbs, "climbs",
+                 "race/tour-de-france/2021/route/climbs")):
+            get_object = self.f_utils.get_scraper_object_from_fixture
+            table = getattr(get_object(scraper_class, url), method_name)()
+            limited_table = getattr(
+                get_object(scraper_class, url), method_name)(limit=3)
+            assert limited_table == table[:3]
+
+    def test_limit_keeps_html_table(self) -> None:
+        html = HTMLParser(
+            "<table><thead><tr><th>Rnk</th></tr></thead><tbody>"
+            "<tr><td>1</td></tr><tr><td>2</td></tr></tbody></table>")
+        table_parser = TableParser(html.css_first("table"))
+        table_parser.parse(["rank"], limit=1)
+        assert table_parser.table == [{"rank": 1}]
+        assert len(html.css("tbody > tr")) == 2
@@ -0,0 +1,49 @@
+from procyclingstats import ReplayServer, Scraper, Team
+
+from .fixtures_utils import FixturesUtils
+
+ORIGIN = "https://www.procyclingstats.com/"
+TEAM_URL = "team/banesto-1997"
+OTHER_TEAM_URL = "team/etixx-quick-step-2015"
+RIDER_URL = "rider/jose-maria-jimenez"
+
+
+class TestFetchHistory:
+    f_utils = FixturesUtils()
+
+    def test_fetch_history(self) -> None:
+        team_html = self.f_utils.get_html_fixture(TEAM_URL)
+        # Jiménez in place of Boonen, so he rides for other team in 2004
+        other_team_html = self.f_utils.get_html_fixture(
+            OTHER_TEAM_URL).replace("rider/tom-boonen", RIDER_URL)
+        team = Team.from_html(TEAM_URL, team_html)
+        # pages of other seasons aren't available
+        pages = {ORIGIN + "team/banesto-1996": team_html,
+                 ORIGIN + "team/illes-balears-banesto-2004": other_team_html}
+        base_url = Scraper.BASE_URL
+        with ReplayServer(pages) as server:
+            Scraper.BASE_URL = server.url
+            try:
+                timeline = team.fetch_history("rider_url")
+            finally:
+                Scraper.BASE_URL = base_url
+        # the loaded season isn't requested again
+        assert server.requests_count == len(team.history_select()) - 1
+
+        assert timeline[RIDER_URL] == [
+            {"season": 1996, "team_name": "Banesto",
+             "team_url": "team/banesto-1996", "rider_url": RIDER_URL},
+            {"season": 1997, "team_name": "Banesto",
+             "team_url": "team/banesto-1997", "rider_url": RIDER_URL},
+            {"season": 2004, "team_name": "Illes Balears - Banesto",
+             "team_url": "team/illes-balears-banesto-2004",
+             "rider_url": RIDER_URL},
+        ]
+        team_riders = {row["rider_url"] for row in team.riders("rider_url")}
+        other_team_riders = {
+            row["rider_url"] for row in Team.from_html(
+                OTHER_TEAM_URL, other_team_html).riders("rider_url")}
+        assert set(timeline) == team_riders | other_team_riders
+        for rider_url in team_riders - {RIDER_URL}:
+            assert [row["season"] for row in timeline[rider_url]] == \
+                [1996, 1997]
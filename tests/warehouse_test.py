@@ -0,0 +1,113 @@
+import pytest
+
+from procyclingstats import Ranking, RiderResults, Stage, Team, Warehouse
+from procyclingstats.errors import ExpectedParsingError
+
+from .fixtures_utils import FixturesUtils
+
+STAGE_URL = "race/tour-de-france/2018/stage-19"
+TTT_STAGE_URL = "race/tour-de-france/2018/stage-3"
+RIDER_RESULTS_URL = "rider/alberto-contador/results"
+FINAL_5K_RESULTS_URL = "rider.php?topn=1&km=5&id=fabian-cancellara" \
+    "&p=results&s=final-5k-analysis"
+TEAM_URL = "team/banesto-1997"
+RANKING_URL = "rankings.php?date=2021-12-31&p=me&s=season-teams"
+
+
+class TestWarehouse:
+    f_utils = FixturesUtils()
+
+    def test_store_stage(self) -> None:
+        stage = self.f_utils.get_scraper_object_from_fixture(Stage, STAGE_URL)
+        with Warehouse() as warehouse:
+            warehouse.store(stage)
+            [stored_stage] = warehouse.query("SELECT * FROM stages")
+            assert stored_stage["race_url"] == "race/tour-de-france/2018"
+            assert stored_stage["date"] == stage.date()
+            assert len(warehouse.query(
+                "SELECT * FROM stage_results WHERE classification = 'gc'")) \
+                == len(stage.gc())
+
+            winner_url = stage.results("rider_url")[0]["rider_url"]
+            top_results = warehouse.rider_top_results(winner_url, 1)
+            assert top_results[0]["stage_url"] == STAGE_URL
+
+    def test_store_ttt_stage(self) -> None:
+        stage = self.f_utils.get_scraper_object_from_fixture(
+            Stage, TTT_STAGE_URL)
+        with Warehouse() as warehouse:
+            warehouse.store(stage)
+            assert len(warehouse.query(
+                "SELECT * FROM stage_results WHERE classification = 'stage'"
+            )) == len(stage.results())
+            # results listing only teams are kept as team results
+            stage.results = stage.teams  # type: ignore
+            warehouse.store(stage)
+            assert not warehouse.query(
+                "SELECT * FROM stage_results WHERE classification = 'stage'")
+            team_results = warehouse.query(
+                "SELECT team_url, rank, time FROM stage_team_results "
+                "WHERE classification = 'stage' ORDER BY rank")
+            assert team_results == [
+                {"team_url": row["team_url"], "rank": row["rank"],
+                 "time": row["time"]} for row in stage.teams()]
+
+    def test_store_stage_without_date(self) -> None:
+        def date() -> str:
+            raise ExpectedParsingError("Date unavailable.")
+
+        stage = self.f_utils.get_scraper_object_from_fixture(Stage, STAGE_URL)
+        stage.date = date  # type: ignore
+        with Warehouse() as warehouse:
+            warehouse.store(stage)
+            [stored_stage] = warehouse.query("SELECT * FROM stages")
+            assert stored_stage["date"] is None
+            assert stored_stage["distance"] == stage.distance()
+            assert len(warehouse.query("SELECT * FROM stage_results")) == \
+                len(stage.results()) + len(stage.gc())
+
+    def test_unsupported_page_rejected(self) -> None:
+        stage = self.f_utils.get_scraper_object_from_fixture(Stage, STAGE_URL)
+        final_5k_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, FINAL_5K_RESULTS_URL)
+        with Warehouse() as warehouse:
+            with pytest.raises(ValueError):
+                warehouse.store(stage, final_5k_results)
+            assert not warehouse.query("SELECT * FROM stages")
+            warehouse.store(stage)
+            assert len(warehouse.query("SELECT * FROM stages")) == 1
+
+    def test_store_rider_results(self) -> None:
+        rider_results = self.f_utils.get_scraper_object_from_fixture(
+            RiderResults, RIDER_RESULTS_URL)
+        with Warehouse() as warehouse:
+            warehouse.store(rider_results)
+            contador_wins = warehouse.rider_top_results(
+                "rider/alberto-contador", 1)
+            assert len(contador_wins) == len([
+                row for row in rider_results.results("rank", "stage_url")
+                if isinstance(row["rank"], int) and row["rank"] <= 1])
+
+    def test_store_team_and_ranking(self) -> None:
+        team = self.f_utils.get_scraper_object_from_fixture(Team, TEAM_URL)
+        ranking = self.f_utils.get_scraper_object_from_fixture(
+            Ranking, RANKING_URL)
+        with Warehouse() as warehouse:
+            warehouse.store(team, ranking)
+            assert len(warehouse.query("SELECT * FROM team_riders")) == \
+                len(team.riders())
+            assert len(warehouse.query("SELECT * FROM ranking_entries")) == \
+                len(ranking.team_ranking())
+
+    def test_store_again_replaces_rows(self) -> None:
+        stage = self.f_utils.get_scraper_object_from_fixture(Stage, STAGE_URL)
+        team = self.f_utils.get_scraper_object_from_fixture(Team, TEAM_URL)
+        with Warehouse() as warehouse:
+            warehouse.store(stage, team)
+            warehouse.store(stage, team)
+            assert len(warehouse.query("SELECT * FROM stages")) == 1
+            assert len(warehouse.query(
+                "SELECT * FROM stage_results WHERE classification = 'gc'")) \
+                == len(stage.gc())
+            assert len(warehouse.query("SELECT * FROM team_riders")) == \
+                len(team.riders())